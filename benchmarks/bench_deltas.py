@@ -0,0 +1,46 @@
+"""Benchmark: bytes on the wire for delta-encoded progress streams.
+
+Run with ``python benchmarks/bench_deltas.py``. Simulates one operation
+reporting every item with millisecond timestamps, and compares full frames
+with ProgressDeltaEncoder output (including its periodic keyframes).
+"""
+
+from mcp_utils import (
+  ProgressMetrics,
+  ProgressNotification,
+  format_epoch_ms,
+  generate_operation_id,
+  generate_progress_token,
+)
+from mcp_utils.mcp.rpc import JsonRpcProgressNotification, encode_progress_notification
+from mcp_utils.mcp.rpc.deltas import ProgressDeltaEncoder
+
+TOTAL = 10_000
+START_MS = 1_760_000_000_000
+
+
+def main() -> None:
+  operation_id, progress_token = generate_operation_id(), generate_progress_token()
+  encoder = ProgressDeltaEncoder()
+  full = delta = 0
+  for current in range(TOTAL + 1):
+    notification = JsonRpcProgressNotification(
+      params=ProgressNotification(
+        operation_id=operation_id,
+        progress_token=progress_token,
+        stage="indexing",
+        progress=ProgressMetrics(
+          current=current, total=TOTAL, unit="files", percentage=current / TOTAL * 100
+        ),
+        timestamp=format_epoch_ms(START_MS + 3 * current),
+      )
+    )
+    full += len(encode_progress_notification(notification))
+    delta += len(encoder.encode(notification))
+  print(f"{'full frames':<14}{full:>12,} bytes")
+  print(f"{'delta frames':<14}{delta:>12,} bytes")
+  print(f"{'reduction':<14}{full / delta:>11.1f}x")
+
+
+if __name__ == "__main__":
+  main()
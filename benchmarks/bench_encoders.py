@@ -0,0 +1,84 @@
+"""Benchmark: specialized progress frame encoder vs. ``model_dump_json``.
+
+Run with ``python benchmarks/bench_encoders.py``. Reports per-frame cost for
+serializing an existing notification, and for the full tick path (building
+the models and serializing them vs. encoding the fields directly).
+"""
+
+import timeit
+from typing import Any
+
+from mcp_utils import (
+  ProgressMetrics,
+  ProgressNotification,
+  generate_operation_id,
+  generate_progress_token,
+  generate_timestamp,
+)
+from mcp_utils.mcp.rpc import (
+  JsonRpcProgressNotification,
+  ProgressFrameEncoder,
+  encode_progress_notification,
+)
+
+NUMBER = 50_000
+
+OPERATION_ID = generate_operation_id()
+PROGRESS_TOKEN = generate_progress_token()
+TIMESTAMP = generate_timestamp()
+
+NOTIFICATION = JsonRpcProgressNotification(
+  params=ProgressNotification(
+    operation_id=OPERATION_ID,
+    progress_token=PROGRESS_TOKEN,
+    stage="indexing",
+    progress=ProgressMetrics(current=512, total=1024, percentage=50.0),
+    message="halfway there",
+    timestamp=TIMESTAMP,
+  )
+)
+
+NAMESPACE: dict[str, Any] = {
+  "notification": NOTIFICATION,
+  "encode_progress_notification": encode_progress_notification,
+  "encoder": ProgressFrameEncoder(OPERATION_ID, PROGRESS_TOKEN),
+  "JsonRpcProgressNotification": JsonRpcProgressNotification,
+  "ProgressNotification": ProgressNotification,
+  "ProgressMetrics": ProgressMetrics,
+  "OPERATION_ID": OPERATION_ID,
+  "PROGRESS_TOKEN": PROGRESS_TOKEN,
+  "TIMESTAMP": TIMESTAMP,
+}
+
+CASES = [
+  (
+    "serialize model",
+    "notification.model_dump_json().encode()",
+    "encode_progress_notification(notification)",
+  ),
+  (
+    "build + serialize",
+    "JsonRpcProgressNotification(params=ProgressNotification("
+    "operation_id=OPERATION_ID, progress_token=PROGRESS_TOKEN, stage='indexing', "
+    "progress=ProgressMetrics(current=512, total=1024, percentage=50.0), "
+    "message='halfway there', timestamp=TIMESTAMP)).model_dump_json().encode()",
+    "encoder.encode('indexing', 512, 50.0, TIMESTAMP, total=1024, message='halfway there')",
+  ),
+]
+
+
+def per_call_us(stmt: str) -> float:
+  return min(timeit.repeat(stmt, number=NUMBER, repeat=5, globals=NAMESPACE)) / NUMBER * 1e6
+
+
+def main() -> None:
+  assert encode_progress_notification(NOTIFICATION) == NOTIFICATION.model_dump_json().encode()
+  print(f"{'case':<20}{'pydantic us':>14}{'encoder us':>14}{'speedup':>10}")
+  for name, baseline, specialized in CASES:
+    slow = per_call_us(baseline)
+    fast = per_call_us(specialized)
+    print(f"{name:<20}{slow:>14.2f}{fast:>14.2f}{slow / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,55 @@
+"""Benchmark: cold ``import mcp_utils`` and first model use.
+
+Run with ``python benchmarks/bench_import.py``. Each sample runs in a fresh
+interpreter so nothing is cached between runs. Pass ``--max-ms`` to fail
+(exit status 1) when the median cold import exceeds a budget, e.g. in CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+SAMPLES = 11
+
+SNIPPETS = {
+  "import mcp_utils": "import mcp_utils",
+  "first create_operation": "import mcp_utils; mcp_utils.create_operation('bench_tool')",
+}
+
+TIMER = (
+  "import time\n"
+  "start = time.perf_counter()\n"
+  "{snippet}\n"
+  "print((time.perf_counter() - start) * 1000)\n"
+)
+
+
+def sample_ms(snippet: str) -> float:
+  result = subprocess.run(
+    [sys.executable, "-c", TIMER.format(snippet=snippet)],
+    check=True,
+    capture_output=True,
+    text=True,
+  )
+  return float(result.stdout)
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--max-ms", type=float, help="fail if the median cold import exceeds this")
+  args = parser.parse_args()
+
+  medians = {}
+  print(f"{'case':<26}{'median ms':>12}{'min ms':>10}")
+  for name, snippet in SNIPPETS.items():
+    samples = [sample_ms(snippet) for _ in range(SAMPLES)]
+    medians[name] = statistics.median(samples)
+    print(f"{name:<26}{medians[name]:>12.2f}{min(samples):>10.2f}")
+
+  if args.max_ms is not None and medians["import mcp_utils"] > args.max_ms:
+    sys.exit(f"cold import took {medians['import mcp_utils']:.2f} ms (budget {args.max_ms} ms)")
+
+
+if __name__ == "__main__":
+  main()
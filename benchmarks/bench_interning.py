@@ -0,0 +1,94 @@
+"""Benchmark: memory retained by decoded and constructed models, with and without sharing.
+
+Run with ``python benchmarks/bench_interning.py``. Decodes progress
+notifications from parsed JSON (every string a fresh object, as on a real
+wire) and builds start/end ProgressMetrics and active cancellation tokens,
+measuring what stays allocated with tracemalloc. The baseline models are
+subclasses that declare the interned fields as plain ``str``.
+"""
+
+import json
+import tracemalloc
+from collections.abc import Callable
+
+from mcp_utils import (
+  CancellationToken,
+  ProgressMetrics,
+  ProgressNotification,
+  create_active_cancellation_token,
+  create_progress_metrics,
+  format_epoch_ms,
+  generate_operation_id,
+  generate_progress_token,
+)
+
+COUNT = 20_000
+STAGES = ("discovering_entities", "loading_rows", "building_index", "finalizing")
+START_MS = 1_760_000_000_000
+
+
+class PlainProgressMetrics(ProgressMetrics):
+  unit: str = "items"
+
+
+class PlainProgressNotification(ProgressNotification):
+  stage: str
+  progress: PlainProgressMetrics
+
+
+def retained(build: Callable[[], object]) -> int:
+  """Bytes still allocated by ``build``'s result once it returns."""
+  build()  # warm up validators and caches outside the measurement
+  tracemalloc.start()
+  before = tracemalloc.get_traced_memory()[0]
+  result = build()
+  size = tracemalloc.get_traced_memory()[0] - before
+  tracemalloc.stop()
+  del result
+  return size
+
+
+def main() -> None:
+  frames = [
+    json.dumps(
+      {
+        "operationId": generate_operation_id(),
+        "progressToken": generate_progress_token(),
+        "stage": STAGES[i % len(STAGES)],
+        "progress": {"current": i % 50, "total": 100, "unit": "entities", "percentage": i % 50},
+        "timestamp": format_epoch_ms(START_MS + i),
+      }
+    )
+    for i in range(COUNT)
+  ]
+  cases = [
+    (
+      "decoded notifications",
+      lambda: [PlainProgressNotification.model_validate(json.loads(frame)) for frame in frames],
+      lambda: [ProgressNotification.model_validate(json.loads(frame)) for frame in frames],
+    ),
+    (
+      "start/end metrics",
+      lambda: [
+        ProgressMetrics(current=i % 2 * 100, total=100, unit="rows", percentage=i % 2 * 100)
+        for i in range(COUNT)
+      ],
+      lambda: [create_progress_metrics(i % 2 * 100, 100, unit="rows") for i in range(COUNT)],
+    ),
+    (
+      "active tokens",
+      lambda: [CancellationToken(is_cancellation_requested=False) for _ in range(COUNT)],
+      lambda: [create_active_cancellation_token() for _ in range(COUNT)],
+    ),
+  ]
+  print(f"{COUNT:,} objects per case")
+  for name, plain, shared in cases:
+    before, after = retained(plain), retained(shared)
+    print(
+      f"{name:<24}{before / 1024:>10,.0f} KiB -> {after / 1024:>8,.0f} KiB"
+      f"  ({(before - after) / COUNT:>4,.0f} B/object saved)"
+    )
+
+
+if __name__ == "__main__":
+  main()
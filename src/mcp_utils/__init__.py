@@ -1,64 +1,218 @@
 """A Python library that houses several utilities that are useful for implementing mcp servers"""
 
+from typing import TYPE_CHECKING
+
 from mcp_utils.__about__ import __version__
-from mcp_utils._utils.factories import (
-  create_active_cancellation_token,
-  create_cancellation_token,
-  generate_operation_id,
-  generate_progress_token,
-  generate_timestamp,
-  generate_uuid,
-  parse_timestamp,
-  request_cancellation,
-)
-from mcp_utils._utils.transitions import (
-  VALID_TRANSITIONS,
-  create_operation,
-  transition_operation,
-  validate_transition,
-)
-from mcp_utils.base.primitives import UUID, OperationId, ProgressToken, Timestamp
-from mcp_utils.base.system_types import VerbosityMode
-from mcp_utils.core.cancellation_token import (
-  CancellationReason,
-  CancellationSource,
-  CancellationToken,
-)
-from mcp_utils.core.error_response import (
-  AuthError,
-  AuthErrorCode,
-  ConnectionErrorCode,
-  DataErrorCode,
-  ErrorCode,
-  ErrorContext,
-  ErrorResponse,
-  McpConnectionError,
-  OperationErrorCode,
-  QueryError,
-  QueryErrorCode,
-  SystemErrorCode,
-)
-from mcp_utils.core.operation_state import (
-  Checkpoint,
-  LifecycleStatus,
-  OperationState,
-  ResumeCapability,
-)
-from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
-from mcp_utils.mcp.notifications import (
-  CancellationNotification,
-  ErrorNotification,
-  StateChangeNotification,
-)
+from mcp_utils._lazy import lazy_exports
+
+if TYPE_CHECKING:
+  from mcp_utils._utils.factories import (
+    create_active_cancellation_token,
+    create_cancellation_token,
+    create_progress_metrics,
+    generate_operation_id,
+    generate_progress_token,
+    generate_time_ordered_operation_id,
+    generate_timestamp,
+    generate_uuid,
+    operation_id_floor,
+    request_cancellation,
+  )
+  from mcp_utils._utils.id_pool import IdPool
+  from mcp_utils._utils.transitions import (
+    VALID_TRANSITIONS,
+    create_operation,
+    transition_operation,
+    validate_transition,
+  )
+  from mcp_utils.base.primitives import (
+    UUID,
+    EpochTimestamp,
+    InternedStr,
+    OperationId,
+    ProgressToken,
+    Timestamp,
+  )
+  from mcp_utils.base.system_types import VerbosityMode
+  from mcp_utils.base.timestamps import (
+    format_epoch_ms,
+    parse_timestamp,
+    timestamp_to_epoch_ms,
+    timestamps_to_epoch_ms,
+  )
+  from mcp_utils.base.validators import (
+    all_operation_ids,
+    all_progress_tokens,
+    all_timestamps,
+    all_uuids,
+    find_invalid_operation_ids,
+    find_invalid_progress_tokens,
+    find_invalid_timestamps,
+    find_invalid_uuids,
+    is_operation_id,
+    is_progress_token,
+    is_timestamp,
+    is_uuid,
+  )
+  from mcp_utils.core.cancellation_scope import CancellationScope, cancel_operation
+  from mcp_utils.core.cancellation_token import (
+    CancellationReason,
+    CancellationSource,
+    CancellationToken,
+  )
+  from mcp_utils.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+  from mcp_utils.core.deadlines import DeadlineManager
+  from mcp_utils.core.error_response import (
+    AuthError,
+    AuthErrorCode,
+    ConnectionErrorCode,
+    DataErrorCode,
+    ErrorCode,
+    ErrorContext,
+    ErrorResponse,
+    McpConnectionError,
+    OperationErrorCode,
+    QueryError,
+    QueryErrorCode,
+    SystemErrorCode,
+  )
+  from mcp_utils.core.operation_state import (
+    TERMINAL_STATUSES,
+    Checkpoint,
+    LifecycleStatus,
+    OperationState,
+    ResumeCapability,
+  )
+  from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+  from mcp_utils.core.progress_tracker import ProgressTracker
+  from mcp_utils.core.resource_monitor import ResourceBudget, ResourceMonitor, current_rss
+  from mcp_utils.core.stall_detector import StallAction, StallDetector
+  from mcp_utils.mcp.notifications import (
+    CancellationNotification,
+    ErrorNotification,
+    StateChangeNotification,
+  )
+  from mcp_utils.mcp.progress_emitter import ProgressEmitter
+  from mcp_utils.mcp.progress_tree import ProgressNode, ProgressTree
+
+# Public names are imported on first access to keep package import cheap.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+  "mcp_utils._utils.factories": (
+    "create_active_cancellation_token",
+    "create_cancellation_token",
+    "create_progress_metrics",
+    "generate_operation_id",
+    "generate_progress_token",
+    "generate_time_ordered_operation_id",
+    "generate_timestamp",
+    "generate_uuid",
+    "operation_id_floor",
+    "request_cancellation",
+  ),
+  "mcp_utils._utils.id_pool": ("IdPool",),
+  "mcp_utils._utils.transitions": (
+    "VALID_TRANSITIONS",
+    "create_operation",
+    "transition_operation",
+    "validate_transition",
+  ),
+  "mcp_utils.base.primitives": (
+    "UUID",
+    "EpochTimestamp",
+    "InternedStr",
+    "OperationId",
+    "ProgressToken",
+    "Timestamp",
+  ),
+  "mcp_utils.base.system_types": ("VerbosityMode",),
+  "mcp_utils.base.timestamps": (
+    "format_epoch_ms",
+    "parse_timestamp",
+    "timestamp_to_epoch_ms",
+    "timestamps_to_epoch_ms",
+  ),
+  "mcp_utils.base.validators": (
+    "all_operation_ids",
+    "all_progress_tokens",
+    "all_timestamps",
+    "all_uuids",
+    "find_invalid_operation_ids",
+    "find_invalid_progress_tokens",
+    "find_invalid_timestamps",
+    "find_invalid_uuids",
+    "is_operation_id",
+    "is_progress_token",
+    "is_timestamp",
+    "is_uuid",
+  ),
+  "mcp_utils.core.cancellation_scope": ("CancellationScope", "cancel_operation"),
+  "mcp_utils.core.cancellation_token": (
+    "CancellationReason",
+    "CancellationSource",
+    "CancellationToken",
+  ),
+  "mcp_utils.core.circuit_breaker": ("CircuitBreaker", "CircuitOpenError", "CircuitState"),
+  "mcp_utils.core.deadlines": ("DeadlineManager",),
+  "mcp_utils.core.error_response": (
+    "AuthError",
+    "AuthErrorCode",
+    "ConnectionErrorCode",
+    "DataErrorCode",
+    "ErrorCode",
+    "ErrorContext",
+    "ErrorResponse",
+    "McpConnectionError",
+    "OperationErrorCode",
+    "QueryError",
+    "QueryErrorCode",
+    "SystemErrorCode",
+  ),
+  "mcp_utils.core.operation_state": (
+    "TERMINAL_STATUSES",
+    "Checkpoint",
+    "LifecycleStatus",
+    "OperationState",
+    "ResumeCapability",
+  ),
+  "mcp_utils.core.progress_metrics": (
+    "ProgressMetrics",
+    "ProgressNotification",
+  ),
+  "mcp_utils.core.progress_tracker": ("ProgressTracker",),
+  "mcp_utils.core.resource_monitor": ("ResourceBudget", "ResourceMonitor", "current_rss"),
+  "mcp_utils.core.stall_detector": ("StallAction", "StallDetector"),
+  "mcp_utils.mcp.notifications": (
+    "CancellationNotification",
+    "ErrorNotification",
+    "StateChangeNotification",
+  ),
+  "mcp_utils.mcp.progress_emitter": ("ProgressEmitter",),
+  "mcp_utils.mcp.progress_tree": ("ProgressNode", "ProgressTree"),
+}
 
 __all__ = [
   "__version__",
   # Base types
   "UUID",
   "Timestamp",
+  "EpochTimestamp",
+  "InternedStr",
   "OperationId",
   "ProgressToken",
   "VerbosityMode",
+  # Validators
+  "is_uuid",
+  "is_timestamp",
+  "is_operation_id",
+  "is_progress_token",
+  "all_uuids",
+  "all_timestamps",
+  "all_operation_ids",
+  "all_progress_tokens",
+  "find_invalid_uuids",
+  "find_invalid_timestamps",
+  "find_invalid_operation_ids",
+  "find_invalid_progress_tokens",
   # Error types
   "ErrorCode",
   "ConnectionErrorCode",
@@ -75,8 +229,20 @@ __all__ = [
   # Progress types
   "ProgressMetrics",
   "ProgressNotification",
+  "ProgressTracker",
   # Cancellation types
   "CancellationReason",
+  "CancellationScope",
+  "DeadlineManager",
+  "StallAction",
+  "StallDetector",
+  "ResourceBudget",
+  "ResourceMonitor",
+  "current_rss",
+  "CircuitBreaker",
+  "CircuitOpenError",
+  "CircuitState",
+  "cancel_operation",
   "CancellationSource",
   "CancellationToken",
   # Operation state types
@@ -84,17 +250,28 @@ __all__ = [
   "Checkpoint",
   "ResumeCapability",
   "OperationState",
+  "TERMINAL_STATUSES",
   # MCP notifications
   "CancellationNotification",
   "ErrorNotification",
   "StateChangeNotification",
+  "ProgressEmitter",
+  "ProgressNode",
+  "ProgressTree",
   # Utilities
   "generate_uuid",
   "generate_operation_id",
+  "generate_time_ordered_operation_id",
+  "operation_id_floor",
   "generate_progress_token",
   "generate_timestamp",
   "parse_timestamp",
+  "format_epoch_ms",
+  "timestamp_to_epoch_ms",
+  "timestamps_to_epoch_ms",
+  "IdPool",
   "create_cancellation_token",
+  "create_progress_metrics",
   "create_active_cancellation_token",
   "request_cancellation",
   "VALID_TRANSITIONS",
@@ -102,3 +279,5 @@ __all__ = [
   "transition_operation",
   "create_operation",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
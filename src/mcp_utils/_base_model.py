@@ -1,13 +1,26 @@
 """Base model for all mcp_utils types."""
 
+from collections.abc import Callable
+from functools import cache
+from typing import Any, Self
+
 from pydantic import BaseModel, ConfigDict
+from pydantic_core import SchemaValidator
+
+# Per-field constraints dropped from the trusted validator (see validate_trusted).
+_TRUSTED_SKIPPED_CONSTRAINTS = {
+  "str": ("pattern", "min_length", "max_length"),
+  "int": ("ge", "gt", "le", "lt", "multiple_of"),
+  "float": ("ge", "gt", "le", "lt", "multiple_of"),
+}
 
 
 class McpUtilsBaseModel(BaseModel):
   """Base model for all mcp_utils types.
 
   All models are frozen (immutable), serialize to camelCase by default,
-  and accept both camelCase and snake_case on input.
+  and accept both camelCase and snake_case on input. Validators and
+  serializers are built on first use rather than at import time.
   """
 
   model_config = ConfigDict(
@@ -15,4 +28,53 @@ class McpUtilsBaseModel(BaseModel):
     serialize_by_alias=True,
     strict=False,
     frozen=True,
+    defer_build=True,
+  )
+
+  @classmethod
+  def validate_trusted(cls, data: dict[str, Any]) -> Self:
+    """Validate trusted data, skipping per-field constraint checks.
+
+    Pattern, length and range constraints are not checked, so this is only for
+    values the library generated itself or that come from already validated
+    models. Types are still checked and cross-field invariants (model
+    validators) are still enforced.
+    """
+    instance: Self = _trusted_validator(cls).validate_python(data)
+    return instance
+
+  def check_invariants(self) -> Self:
+    """Re-run the model-level (cross-field) validators on this instance.
+
+    Raises ValueError if any invariant does not hold.
+    """
+    for validator in _after_validators(type(self)):
+      validator(self)
+    return self
+
+
+def _strip_constraints(schema: Any) -> Any:
+  """Copy a core schema, dropping the constraints listed in _TRUSTED_SKIPPED_CONSTRAINTS."""
+  if isinstance(schema, list):
+    return [_strip_constraints(item) for item in schema]
+  if not isinstance(schema, dict):
+    return schema
+  skipped = _TRUSTED_SKIPPED_CONSTRAINTS.get(schema.get("type", ""), ())
+  return {key: _strip_constraints(value) for key, value in schema.items() if key not in skipped}
+
+
+@cache
+def _trusted_validator(model_cls: type[BaseModel]) -> SchemaValidator:
+  """Build (once per class) a validator for model_cls without per-field constraints."""
+  model_cls.model_rebuild()  # materialize the schema if the build was deferred
+  return SchemaValidator(_strip_constraints(model_cls.__pydantic_core_schema__))
+
+
+@cache
+def _after_validators(model_cls: type[BaseModel]) -> tuple[Callable[[Any], Any], ...]:
+  """Collect the model-level ``mode="after"`` validators declared on a model class."""
+  return tuple(
+    decorator.func
+    for decorator in model_cls.__pydantic_decorators__.model_validators.values()
+    if decorator.info.mode == "after"
   )
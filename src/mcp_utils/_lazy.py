@@ -0,0 +1,40 @@
+"""Lazy attribute loading (PEP 562) for package ``__init__`` modules."""
+
+import sys
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from typing import Any
+
+
+def lazy_exports(
+  package: str,
+  exports: Mapping[str, tuple[str, ...]],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+  """Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+  ``exports`` maps a defining module to the public names it provides. Each
+  name is imported on first access and then cached in the package namespace,
+  so later lookups are plain attribute hits. Any other name is tried as a
+  submodule, so ``mcp_utils.core`` works without importing it first.
+  """
+  origins = {name: module for module, names in exports.items() for name in names}
+  namespace = sys.modules[package].__dict__
+
+  def __getattr__(name: str) -> Any:
+    module = origins.get(name)
+    if module is None:
+      submodule = f"{package}.{name}"
+      try:
+        return import_module(submodule)
+      except ModuleNotFoundError as exc:
+        if exc.name != submodule:
+          raise
+        raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    namespace[name] = value
+    return value
+
+  def __dir__() -> list[str]:
+    return sorted(namespace.keys() | origins.keys())
+
+  return __getattr__, __dir__
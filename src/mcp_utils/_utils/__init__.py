@@ -1,33 +1,72 @@
 """Utility functions: factories and transition helpers."""
 
-from mcp_utils._utils.factories import (
-  create_active_cancellation_token,
-  create_cancellation_token,
-  generate_operation_id,
-  generate_progress_token,
-  generate_timestamp,
-  generate_uuid,
-  parse_timestamp,
-  request_cancellation,
-)
-from mcp_utils._utils.transitions import (
-  VALID_TRANSITIONS,
-  create_operation,
-  transition_operation,
-  validate_transition,
-)
+from typing import TYPE_CHECKING
+
+from mcp_utils._lazy import lazy_exports
+
+if TYPE_CHECKING:
+  from mcp_utils._utils.factories import (
+    create_active_cancellation_token,
+    create_cancellation_token,
+    create_progress_metrics,
+    generate_operation_id,
+    generate_progress_token,
+    generate_time_ordered_operation_id,
+    generate_timestamp,
+    generate_uuid,
+    operation_id_floor,
+    parse_timestamp,
+    request_cancellation,
+  )
+  from mcp_utils._utils.id_pool import IdPool
+  from mcp_utils._utils.transitions import (
+    VALID_TRANSITIONS,
+    create_operation,
+    transition_operation,
+    validate_transition,
+  )
+
+# Public names are imported on first access to keep package import cheap.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+  "mcp_utils._utils.factories": (
+    "create_active_cancellation_token",
+    "create_cancellation_token",
+    "create_progress_metrics",
+    "generate_operation_id",
+    "generate_progress_token",
+    "generate_time_ordered_operation_id",
+    "generate_timestamp",
+    "generate_uuid",
+    "operation_id_floor",
+    "parse_timestamp",
+    "request_cancellation",
+  ),
+  "mcp_utils._utils.id_pool": ("IdPool",),
+  "mcp_utils._utils.transitions": (
+    "VALID_TRANSITIONS",
+    "create_operation",
+    "transition_operation",
+    "validate_transition",
+  ),
+}
 
 __all__ = [
+  "IdPool",
   "VALID_TRANSITIONS",
   "create_active_cancellation_token",
   "create_cancellation_token",
+  "create_progress_metrics",
   "create_operation",
   "generate_operation_id",
   "generate_progress_token",
+  "generate_time_ordered_operation_id",
   "generate_timestamp",
   "generate_uuid",
+  "operation_id_floor",
   "parse_timestamp",
   "request_cancellation",
   "transition_operation",
   "validate_transition",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
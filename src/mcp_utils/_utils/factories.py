@@ -1,14 +1,19 @@
-"""Factory functions for generating IDs, timestamps, and cancellation tokens."""
+"""Factory functions for generating IDs, timestamps, cancellation tokens and progress metrics."""
 
+import sys
+import time
 import uuid
-from datetime import UTC, datetime
+from datetime import datetime
+from functools import cache, lru_cache
 
 from mcp_utils.base.primitives import OperationId, ProgressToken, Timestamp
+from mcp_utils.base.timestamps import parse_timestamp as parse_timestamp
 from mcp_utils.core.cancellation_token import (
   CancellationReason,
   CancellationSource,
   CancellationToken,
 )
+from mcp_utils.core.progress_metrics import ProgressMetrics
 
 
 def generate_uuid() -> str:
@@ -21,19 +26,68 @@ def generate_operation_id() -> OperationId:
   return f"op-{generate_uuid()}"
 
 
+def generate_time_ordered_operation_id() -> OperationId:
+  """Generate an operation ID that sorts by creation time: 'op-{uuid7}'.
+
+  The UUID v7 layout puts the Unix time in milliseconds in the leading 48
+  bits, and the lowercase hex form keeps that order as plain string order.
+  IDs from one process are monotonic, so sorted indexes and append-only
+  stores keyed by operation ID see sequential inserts.
+  """
+  return f"op-{uuid.uuid7()}"
+
+
+def operation_id_floor(when: datetime) -> OperationId:
+  """Return the smallest time-ordered operation ID that can be generated at ``when``.
+
+  Use it as the lower bound of a range scan over IDs from
+  generate_time_ordered_operation_id, e.g. operations started in the last minute.
+  """
+  millis = int(when.timestamp() * 1000)
+  if not 0 <= millis < 1 << 48:
+    raise ValueError(f"{when!r} is outside the UUID v7 timestamp range")
+  hex_millis = f"{millis:012x}"
+  return f"op-{hex_millis[:8]}-{hex_millis[8:]}-7000-8000-000000000000"
+
+
 def generate_progress_token() -> ProgressToken:
   """Generate a properly formatted progress token: 'pt-{uuid}'."""
   return f"pt-{generate_uuid()}"
 
 
-def generate_timestamp() -> Timestamp:
-  """Generate a UTC timestamp in ISO 8601 format matching the CUE schema."""
-  return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+# Last formatted clock readings: (epoch second, "YYYY-MM-DDTHH:MM:SS", same + "Z")
+# and (epoch millisecond, "YYYY-MM-DDTHH:MM:SS.mmmZ"). Each is replaced as a
+# whole tuple, so concurrent readers never see a torn entry.
+_second_cache: tuple[int, str, str] = (-1, "", "")
+_millis_cache: tuple[int, str] = (-1, "")
 
 
-def parse_timestamp(ts: Timestamp) -> datetime:
-  """Parse a CUE-format timestamp string into a datetime object."""
-  return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+def generate_timestamp(*, millis: bool = False) -> Timestamp:
+  """Generate a UTC timestamp in ISO 8601 format matching the CUE schema.
+
+  The formatted string is cached per clock tick (second, or millisecond when
+  ``millis`` is set), so repeated calls within a tick only read the clock.
+  With ``millis=True`` the result carries the optional ``.mmm`` fraction.
+  """
+  global _second_cache, _millis_cache
+  now_ms = time.time_ns() // 1_000_000
+  if millis:
+    cached_ms, cached = _millis_cache  # one read, so both halves are from the same entry
+    if cached_ms == now_ms:
+      return cached
+
+  second, base, whole = _second_cache
+  if second != now_ms // 1000:
+    second = now_ms // 1000
+    base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+    whole = f"{base}Z"
+    _second_cache = (second, base, whole)
+  if not millis:
+    return whole
+
+  stamped = f"{base}.{now_ms % 1000:03d}Z"
+  _millis_cache = (now_ms, stamped)
+  return stamped
 
 
 def create_cancellation_token(
@@ -46,18 +100,24 @@ def create_cancellation_token(
   if cancelled:
     if reason is None or source is None:
       raise ValueError("reason and source are required when cancelled=True")
-    return CancellationToken(
-      is_cancellation_requested=True,
-      reason=reason,
-      source=source,
-      timestamp=generate_timestamp(),
+    return CancellationToken.validate_trusted(
+      {
+        "is_cancellation_requested": True,
+        "reason": reason,
+        "source": source,
+        "timestamp": generate_timestamp(),
+      }
     )
-  return CancellationToken(is_cancellation_requested=False)
+  return create_active_cancellation_token()
 
 
+@cache
 def create_active_cancellation_token() -> CancellationToken:
-  """Create an uncancelled token (initial state)."""
-  return CancellationToken(is_cancellation_requested=False)
+  """Return the uncancelled token (initial state).
+
+  Tokens are frozen, so one shared instance is returned to every caller.
+  """
+  return CancellationToken.validate_trusted({"is_cancellation_requested": False})
 
 
 def request_cancellation(
@@ -69,11 +129,41 @@ def request_cancellation(
 
   Does not mutate the original (tokens are frozen).
   """
-  return token.model_copy(
-    update={
+  return type(token).validate_trusted(
+    {
       "is_cancellation_requested": True,
       "reason": reason,
       "source": source,
       "timestamp": generate_timestamp(),
     }
   )
+
+
+def create_progress_metrics(
+  current: int,
+  total: int | None = None,
+  *,
+  unit: str = "items",
+  percentage: float | None = None,
+) -> ProgressMetrics:
+  """Create ProgressMetrics, sharing one instance per common start or end value.
+
+  Unless given, the percentage is derived from ``current`` and ``total``
+  (0 when the total is unknown). Metrics at 0 or at the total with the
+  derived, 0 or 100 percentage, the values most operations report, come
+  from a bounded cache of frozen instances; anything else is built and
+  validated as usual.
+  """
+  derived = (current / total) * 100 if total else 0.0
+  if percentage is None:
+    percentage = derived
+  if (current == 0 or current == total) and percentage in (derived, 0.0, 100.0):
+    return _shared_progress_metrics(current, total, sys.intern(unit), percentage)
+  return ProgressMetrics(current=current, total=total, unit=unit, percentage=percentage)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _shared_progress_metrics(
+  current: int, total: int | None, unit: str, percentage: float
+) -> ProgressMetrics:
+  return ProgressMetrics(current=current, total=total, unit=unit, percentage=percentage)
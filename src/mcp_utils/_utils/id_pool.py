@@ -0,0 +1,105 @@
+"""Pooled UUID v4 generation for operation IDs and progress tokens."""
+
+import os
+import threading
+import weakref
+from collections import deque
+
+from mcp_utils.base.primitives import OperationId, ProgressToken
+
+# RFC 4122 variant nibble: the top two bits are forced to 10, keeping the low two random.
+_VARIANT_NIBBLE = {f"{n:x}": "89ab"[n & 0b11] for n in range(16)}
+
+
+def _format_uuids(count: int) -> list[str]:
+  """Format ``count`` UUID v4 strings from a single entropy read."""
+  raw = os.urandom(16 * count).hex()
+  variant = _VARIANT_NIBBLE
+  return [
+    f"{raw[i : i + 8]}-{raw[i + 8 : i + 12]}-4{raw[i + 13 : i + 16]}-"
+    f"{variant[raw[i + 16]]}{raw[i + 17 : i + 20]}-{raw[i + 20 : i + 32]}"
+    for i in range(0, 32 * count, 32)
+  ]
+
+
+class IdPool:
+  """Pool of pre-formatted UUID v4 strings for high-rate ID generation.
+
+  Entropy is read in bulk (one ``os.urandom`` call per batch) and formatted
+  ahead of time. Taking an ID is a lock-free ``deque.popleft``; when the pool
+  drops below ``low_water`` a background thread refills it. If the pool runs
+  dry first, the caller formats a batch itself. After ``fork`` the child
+  discards the IDs it inherited so parent and child never hand out the same
+  ID.
+  """
+
+  def __init__(
+    self,
+    batch_size: int = 4096,
+    *,
+    low_water: int | None = None,
+    background: bool = True,
+  ) -> None:
+    if batch_size < 1:
+      raise ValueError("batch_size must be at least 1")
+    self._batch_size = batch_size
+    self._low_water = batch_size // 4 if low_water is None else low_water
+    self._background = background
+    self._ids: deque[str] = deque()
+    self._refilling = threading.Lock()
+    _live_pools.add(self)
+
+  def __len__(self) -> int:
+    return len(self._ids)
+
+  def uuid(self) -> str:
+    """Take a lowercase UUID v4 string from the pool."""
+    ids = self._ids
+    if len(ids) <= self._low_water and self._background:
+      self._start_refill()
+    try:
+      return ids.popleft()
+    except IndexError:
+      batch = _format_uuids(self._batch_size)
+      uuid = batch.pop()
+      ids.extend(batch)
+      return uuid
+
+  def operation_id(self) -> OperationId:
+    """Take an operation ID: 'op-{uuid}'."""
+    return f"op-{self.uuid()}"
+
+  def progress_token(self) -> ProgressToken:
+    """Take a progress token: 'pt-{uuid}'."""
+    return f"pt-{self.uuid()}"
+
+  def _start_refill(self) -> None:
+    lock = self._refilling
+    if not lock.acquire(blocking=False):
+      return
+    threading.Thread(
+      target=self._refill, args=(self._ids, lock), name="mcp-utils-id-pool", daemon=True
+    ).start()
+
+  def _refill(self, ids: deque[str], lock: threading.Lock) -> None:
+    # Bound at start: a reset in the meantime replaces both, and must not get these IDs.
+    try:
+      ids.extend(_format_uuids(self._batch_size))
+    finally:
+      lock.release()
+
+  def _reset_after_fork(self) -> None:
+    self._ids = deque()
+    self._refilling = threading.Lock()
+
+
+_live_pools: weakref.WeakSet[IdPool] = weakref.WeakSet()
+
+
+def _reset_pools_after_fork() -> None:
+  for pool in list(_live_pools):
+    pool._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch - fork only exists on POSIX
+  os.register_at_fork(after_in_child=_reset_pools_after_fork)
@@ -2,9 +2,17 @@
 
 from typing import Any
 
-from mcp_utils._utils.factories import generate_operation_id, generate_timestamp
+from pydantic import ConfigDict, TypeAdapter
+
+from mcp_utils._utils.factories import (
+  create_progress_metrics,
+  generate_operation_id,
+  generate_timestamp,
+)
+from mcp_utils.base.primitives import Timestamp
 from mcp_utils.core.error_response import ErrorResponse
 from mcp_utils.core.operation_state import (
+  TERMINAL_STATUSES,
   LifecycleStatus,
   OperationState,
   TPartialResult,
@@ -26,6 +34,8 @@ VALID_TRANSITIONS: dict[LifecycleStatus, set[LifecycleStatus]] = {
   LifecycleStatus.CANCELLED: set(),
 }
 
+_TIMESTAMP_ADAPTER: TypeAdapter[str] = TypeAdapter(Timestamp, config=ConfigDict(defer_build=True))
+
 
 def validate_transition(
   current: LifecycleStatus,
@@ -47,7 +57,9 @@ def transition_operation(
 ) -> OperationState[TResult, TPartialResult]:
   """Transition an OperationState to a new status with validation.
 
-  Returns a new OperationState instance (immutable pattern).
+  Returns a new OperationState instance (immutable pattern). Only the fields
+  being changed and the invariants they affect are re-validated; the rest of
+  the state is trusted because it was validated when it was built.
   Raises ValueError if the transition is invalid.
   """
   if not validate_transition(state.status, new_status):
@@ -56,24 +68,28 @@ def transition_operation(
       f"Valid targets: {VALID_TRANSITIONS.get(state.status, set())}"
     )
 
-  terminal = {LifecycleStatus.COMPLETED, LifecycleStatus.FAILED, LifecycleStatus.CANCELLED}
-  effective_end_time = end_time if new_status in terminal else None
-  if new_status in terminal and effective_end_time is None:
-    effective_end_time = generate_timestamp()
-
   updates: dict[str, Any] = {"status": new_status}
-  if effective_end_time is not None:
-    updates["end_time"] = effective_end_time
+  if new_status in TERMINAL_STATUSES:
+    if end_time is None:
+      updates["end_time"] = generate_timestamp()
+    else:
+      updates["end_time"] = _TIMESTAMP_ADAPTER.validate_python(end_time)
   if result is not None:
     updates["result"] = result
   if error is not None:
-    updates["error"] = error
+    updates["error"] = (
+      error if isinstance(error, ErrorResponse) else ErrorResponse.model_validate(error)
+    )
   if partial_results is not None:
     updates["partial_results"] = partial_results
   if progress is not None:
-    updates["progress"] = progress
+    updates["progress"] = (
+      progress.check_invariants()
+      if isinstance(progress, ProgressMetrics)
+      else ProgressMetrics.model_validate(progress)
+    )
 
-  return state.model_copy(update=updates)
+  return state.model_copy(update=updates).check_invariants()
 
 
 def create_operation(
@@ -81,11 +97,18 @@ def create_operation(
   *,
   progress: ProgressMetrics | None = None,
 ) -> OperationState[dict[str, Any], dict[str, Any]]:
-  """Create a new OperationState in 'created' status."""
-  return OperationState(
-    operation_id=generate_operation_id(),
-    tool_name=tool_name,
-    status=LifecycleStatus.CREATED,
-    start_time=generate_timestamp(),
-    progress=progress or ProgressMetrics(current=0, percentage=0.0),
-  )
+  """Create a new OperationState in 'created' status.
+
+  The generated ID and timestamp are trusted and skip pattern validation. A
+  progress value that is not already a ProgressMetrics gets full validation.
+  """
+  data: dict[str, Any] = {
+    "operation_id": generate_operation_id(),
+    "tool_name": tool_name,
+    "status": LifecycleStatus.CREATED,
+    "start_time": generate_timestamp(),
+    "progress": progress or create_progress_metrics(0),
+  }
+  if isinstance(data["progress"], ProgressMetrics):
+    return OperationState.validate_trusted(data)
+  return OperationState.model_validate(data)
@@ -1,25 +1,112 @@
-"""Base types: primitives and system types."""
+"""Base types: primitives, system types, timestamp parsing, and validators."""
 
-from mcp_utils.base.primitives import (
-  OPERATION_ID_PATTERN,
-  PROGRESS_TOKEN_PATTERN,
-  TIMESTAMP_PATTERN,
-  UUID,
-  UUID_PATTERN,
-  OperationId,
-  ProgressToken,
-  Timestamp,
-)
-from mcp_utils.base.system_types import VerbosityMode
+from typing import TYPE_CHECKING
+
+from mcp_utils._lazy import lazy_exports
+
+if TYPE_CHECKING:
+  from mcp_utils.base.primitives import (
+    OPERATION_ID_PATTERN,
+    PROGRESS_TOKEN_PATTERN,
+    TIMESTAMP_PATTERN,
+    UUID,
+    UUID_PATTERN,
+    EpochTimestamp,
+    InternedStr,
+    OperationId,
+    ProgressToken,
+    Timestamp,
+  )
+  from mcp_utils.base.system_types import VerbosityMode
+  from mcp_utils.base.timestamps import (
+    format_epoch_ms,
+    parse_timestamp,
+    timestamp_to_epoch_ms,
+    timestamps_to_epoch_ms,
+  )
+  from mcp_utils.base.validators import (
+    PatternValidator,
+    all_operation_ids,
+    all_progress_tokens,
+    all_timestamps,
+    all_uuids,
+    find_invalid_operation_ids,
+    find_invalid_progress_tokens,
+    find_invalid_timestamps,
+    find_invalid_uuids,
+    is_operation_id,
+    is_progress_token,
+    is_timestamp,
+    is_uuid,
+  )
+
+# Public names are imported on first access to keep package import cheap.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+  "mcp_utils.base.primitives": (
+    "OPERATION_ID_PATTERN",
+    "PROGRESS_TOKEN_PATTERN",
+    "TIMESTAMP_PATTERN",
+    "UUID",
+    "UUID_PATTERN",
+    "EpochTimestamp",
+    "InternedStr",
+    "OperationId",
+    "ProgressToken",
+    "Timestamp",
+  ),
+  "mcp_utils.base.system_types": ("VerbosityMode",),
+  "mcp_utils.base.timestamps": (
+    "format_epoch_ms",
+    "parse_timestamp",
+    "timestamp_to_epoch_ms",
+    "timestamps_to_epoch_ms",
+  ),
+  "mcp_utils.base.validators": (
+    "PatternValidator",
+    "all_operation_ids",
+    "all_progress_tokens",
+    "all_timestamps",
+    "all_uuids",
+    "find_invalid_operation_ids",
+    "find_invalid_progress_tokens",
+    "find_invalid_timestamps",
+    "find_invalid_uuids",
+    "is_operation_id",
+    "is_progress_token",
+    "is_timestamp",
+    "is_uuid",
+  ),
+}
 
 __all__ = [
   "UUID",
   "UUID_PATTERN",
   "Timestamp",
   "TIMESTAMP_PATTERN",
+  "EpochTimestamp",
+  "InternedStr",
   "OperationId",
   "OPERATION_ID_PATTERN",
   "ProgressToken",
   "PROGRESS_TOKEN_PATTERN",
   "VerbosityMode",
+  "format_epoch_ms",
+  "parse_timestamp",
+  "timestamp_to_epoch_ms",
+  "timestamps_to_epoch_ms",
+  "PatternValidator",
+  "is_uuid",
+  "is_timestamp",
+  "is_operation_id",
+  "is_progress_token",
+  "all_uuids",
+  "all_timestamps",
+  "all_operation_ids",
+  "all_progress_tokens",
+  "find_invalid_uuids",
+  "find_invalid_timestamps",
+  "find_invalid_operation_ids",
+  "find_invalid_progress_tokens",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,8 +1,12 @@
-"""Base primitive types: UUID, Timestamp, OperationId, ProgressToken."""
+"""Base primitive types: UUID, Timestamp, OperationId, ProgressToken, EpochTimestamp, InternedStr."""
 
-from typing import Annotated
+import re
+import sys
+from typing import Annotated, Any
 
-from pydantic import Field
+from pydantic import AfterValidator, BeforeValidator, Field, PlainSerializer, WithJsonSchema
+
+from mcp_utils.base.timestamps import format_epoch_ms, timestamp_to_epoch_ms
 
 # Regex pattern constants (match CUE source schemas exactly)
 UUID_PATTERN = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
@@ -15,3 +19,30 @@ UUID = Annotated[str, Field(pattern=UUID_PATTERN)]
 Timestamp = Annotated[str, Field(pattern=TIMESTAMP_PATTERN)]
 OperationId = Annotated[str, Field(pattern=OPERATION_ID_PATTERN)]
 ProgressToken = Annotated[str, Field(pattern=PROGRESS_TOKEN_PATTERN)]
+
+# Low-cardinality string (tool name, stage, unit, method) interned on
+# validation, so the many models repeating it share a single str object.
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
+_TIMESTAMP_RE = re.compile(TIMESTAMP_PATTERN.removesuffix("$") + r"\Z")
+
+
+def _epoch_ms_from_wire(value: Any) -> Any:
+  """Accept a CUE-format timestamp string and convert it to epoch milliseconds."""
+  if isinstance(value, str):
+    if _TIMESTAMP_RE.match(value) is None:
+      raise ValueError(f"String should match pattern '{TIMESTAMP_PATTERN}'")
+    return timestamp_to_epoch_ms(value)
+  return value
+
+
+# Timestamp held in memory as integer epoch milliseconds (UTC). Accepts the wire
+# string or an int, and serializes back to the wire string, so models using it
+# stay wire-compatible with Timestamp while comparisons and arithmetic are on ints.
+EpochTimestamp = Annotated[
+  int,
+  BeforeValidator(_epoch_ms_from_wire),
+  PlainSerializer(format_epoch_ms, return_type=str),
+  WithJsonSchema({"type": "string", "pattern": TIMESTAMP_PATTERN}),
+]
@@ -0,0 +1,56 @@
+"""Timestamp codecs: CUE-format strings to and from datetimes and epoch milliseconds."""
+
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(ts: str) -> datetime:
+  """Parse a CUE-format timestamp string into a datetime object.
+
+  Results are memoized in a bounded LRU, since the same start/end times are
+  typically parsed many times. Datetimes are immutable, so sharing is safe.
+  """
+  return datetime.fromisoformat(ts)
+
+
+def timestamp_to_epoch_ms(ts: str) -> int:
+  """Convert a CUE-format timestamp to integer milliseconds since the Unix epoch."""
+  return timestamps_to_epoch_ms((ts,))[0]
+
+
+def timestamps_to_epoch_ms(timestamps: Iterable[str]) -> list[int]:
+  """Convert many CUE-format timestamps to epoch milliseconds in one pass.
+
+  Uses integer timedelta arithmetic, so millisecond values are exact (no
+  float rounding). Raises ValueError if a timestamp is malformed or has no
+  UTC offset.
+  """
+  fromisoformat = datetime.fromisoformat
+  try:
+    return [(fromisoformat(ts) - _EPOCH) // _MILLISECOND for ts in timestamps]
+  except TypeError as exc:
+    raise ValueError("timestamps must include a UTC offset ('Z' or '+HH:MM')") from exc
+
+
+@lru_cache(maxsize=1024)
+def _format_epoch_second(second: int) -> str:
+  return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+
+
+def format_epoch_ms(ms: int) -> str:
+  """Render epoch milliseconds as a CUE-format UTC timestamp.
+
+  The ``.mmm`` fraction is included only when it is non-zero, so
+  whole-second timestamps round-trip to the same string they were parsed
+  from.
+  """
+  second, millis = divmod(ms, 1000)
+  if millis:
+    return f"{_format_epoch_second(second)}.{millis:03d}Z"
+  return f"{_format_epoch_second(second)}Z"
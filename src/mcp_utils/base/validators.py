@@ -0,0 +1,71 @@
+"""Precompiled validators for primitive patterns, usable without pydantic models."""
+
+from collections.abc import Iterable
+
+from pydantic_core import SchemaValidator, ValidationError, core_schema
+
+from mcp_utils.base.primitives import (
+  OPERATION_ID_PATTERN,
+  PROGRESS_TOKEN_PATTERN,
+  TIMESTAMP_PATTERN,
+  UUID_PATTERN,
+)
+
+
+class PatternValidator:
+  """Precompiled check for one primitive pattern.
+
+  Uses the same pydantic-core regex engine as the model fields, so results
+  agree exactly with model validation, but without building a model or
+  raising on failure. Bulk checks validate the whole batch in one call into
+  pydantic-core.
+  """
+
+  __slots__ = ("pattern", "_single", "_batch")
+
+  def __init__(self, pattern: str) -> None:
+    item = core_schema.str_schema(pattern=pattern, strict=True)
+    self.pattern = pattern
+    self._single = SchemaValidator(item)
+    self._batch = SchemaValidator(core_schema.list_schema(item))
+
+  def is_valid(self, value: object) -> bool:
+    """Return True if ``value`` is a string matching the pattern."""
+    return self._single.isinstance_python(value)
+
+  def all_valid(self, values: Iterable[object]) -> bool:
+    """Return True if every value is a string matching the pattern."""
+    return self._batch.isinstance_python(_as_list(values))
+
+  def find_invalid(self, values: Iterable[object]) -> list[int]:
+    """Return the indices of values that do not match (empty if all are valid)."""
+    try:
+      self._batch.validate_python(_as_list(values))
+    except ValidationError as exc:
+      return sorted({error["loc"][0] for error in exc.errors()})  # type: ignore[misc]
+    return []
+
+
+def _as_list(values: Iterable[object]) -> list[object] | tuple[object, ...]:
+  return values if isinstance(values, list | tuple) else list(values)
+
+
+UUID_VALIDATOR = PatternValidator(UUID_PATTERN)
+TIMESTAMP_VALIDATOR = PatternValidator(TIMESTAMP_PATTERN)
+OPERATION_ID_VALIDATOR = PatternValidator(OPERATION_ID_PATTERN)
+PROGRESS_TOKEN_VALIDATOR = PatternValidator(PROGRESS_TOKEN_PATTERN)
+
+is_uuid = UUID_VALIDATOR.is_valid
+is_timestamp = TIMESTAMP_VALIDATOR.is_valid
+is_operation_id = OPERATION_ID_VALIDATOR.is_valid
+is_progress_token = PROGRESS_TOKEN_VALIDATOR.is_valid
+
+all_uuids = UUID_VALIDATOR.all_valid
+all_timestamps = TIMESTAMP_VALIDATOR.all_valid
+all_operation_ids = OPERATION_ID_VALIDATOR.all_valid
+all_progress_tokens = PROGRESS_TOKEN_VALIDATOR.all_valid
+
+find_invalid_uuids = UUID_VALIDATOR.find_invalid
+find_invalid_timestamps = TIMESTAMP_VALIDATOR.find_invalid
+find_invalid_operation_ids = OPERATION_ID_VALIDATOR.find_invalid
+find_invalid_progress_tokens = PROGRESS_TOKEN_VALIDATOR.find_invalid
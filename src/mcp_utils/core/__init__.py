@@ -1,47 +1,107 @@
 """Core types: errors, progress, cancellation, operation state."""
 
-from mcp_utils.core.cancellation_token import (
-  CancellationReason,
-  CancellationSource,
-  CancellationToken,
-)
-from mcp_utils.core.error_response import (
-  AuthError,
-  AuthErrorCode,
-  ConnectionErrorCode,
-  DataErrorCode,
-  ErrorCode,
-  ErrorContext,
-  ErrorResponse,
-  McpConnectionError,
-  OperationErrorCode,
-  QueryError,
-  QueryErrorCode,
-  SystemErrorCode,
-)
-from mcp_utils.core.operation_state import (
-  Checkpoint,
-  LifecycleStatus,
-  OperationState,
-  ResumeCapability,
-  TCheckpointData,
-  TPartialResult,
-  TResult,
-)
-from mcp_utils.core.progress_metrics import (
-  ProgressMetrics,
-  ProgressNotification,
-)
+from typing import TYPE_CHECKING
+
+from mcp_utils._lazy import lazy_exports
+
+if TYPE_CHECKING:
+  from mcp_utils.core.cancellation_scope import CancellationScope, cancel_operation
+  from mcp_utils.core.cancellation_token import (
+    CancellationReason,
+    CancellationSource,
+    CancellationToken,
+  )
+  from mcp_utils.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+  from mcp_utils.core.deadlines import DeadlineManager
+  from mcp_utils.core.error_response import (
+    AuthError,
+    AuthErrorCode,
+    ConnectionErrorCode,
+    DataErrorCode,
+    ErrorCode,
+    ErrorContext,
+    ErrorResponse,
+    McpConnectionError,
+    OperationErrorCode,
+    QueryError,
+    QueryErrorCode,
+    SystemErrorCode,
+  )
+  from mcp_utils.core.operation_state import (
+    TERMINAL_STATUSES,
+    Checkpoint,
+    LifecycleStatus,
+    OperationState,
+    ResumeCapability,
+    TCheckpointData,
+    TPartialResult,
+    TResult,
+  )
+  from mcp_utils.core.progress_metrics import (
+    ProgressMetrics,
+    ProgressNotification,
+  )
+  from mcp_utils.core.progress_tracker import ProgressTracker
+  from mcp_utils.core.resource_monitor import ResourceBudget, ResourceMonitor, current_rss
+  from mcp_utils.core.stall_detector import StallAction, StallDetector
+
+# Public names are imported on first access to keep package import cheap.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+  "mcp_utils.core.cancellation_scope": ("CancellationScope", "cancel_operation"),
+  "mcp_utils.core.cancellation_token": (
+    "CancellationReason",
+    "CancellationSource",
+    "CancellationToken",
+  ),
+  "mcp_utils.core.circuit_breaker": ("CircuitBreaker", "CircuitOpenError", "CircuitState"),
+  "mcp_utils.core.deadlines": ("DeadlineManager",),
+  "mcp_utils.core.error_response": (
+    "AuthError",
+    "AuthErrorCode",
+    "ConnectionErrorCode",
+    "DataErrorCode",
+    "ErrorCode",
+    "ErrorContext",
+    "ErrorResponse",
+    "McpConnectionError",
+    "OperationErrorCode",
+    "QueryError",
+    "QueryErrorCode",
+    "SystemErrorCode",
+  ),
+  "mcp_utils.core.operation_state": (
+    "TERMINAL_STATUSES",
+    "Checkpoint",
+    "LifecycleStatus",
+    "OperationState",
+    "ResumeCapability",
+    "TCheckpointData",
+    "TPartialResult",
+    "TResult",
+  ),
+  "mcp_utils.core.progress_metrics": (
+    "ProgressMetrics",
+    "ProgressNotification",
+  ),
+  "mcp_utils.core.progress_tracker": ("ProgressTracker",),
+  "mcp_utils.core.resource_monitor": ("ResourceBudget", "ResourceMonitor", "current_rss"),
+  "mcp_utils.core.stall_detector": ("StallAction", "StallDetector"),
+}
 
 __all__ = [
   "AuthError",
   "AuthErrorCode",
   "CancellationReason",
+  "CancellationScope",
   "CancellationSource",
   "CancellationToken",
   "Checkpoint",
+  "CircuitBreaker",
+  "CircuitOpenError",
+  "CircuitState",
   "ConnectionErrorCode",
   "DataErrorCode",
+  "DeadlineManager",
   "ErrorCode",
   "ErrorContext",
   "ErrorResponse",
@@ -51,11 +111,21 @@ __all__ = [
   "OperationState",
   "ProgressMetrics",
   "ProgressNotification",
+  "ProgressTracker",
   "QueryError",
   "QueryErrorCode",
+  "ResourceBudget",
+  "ResourceMonitor",
   "ResumeCapability",
+  "StallAction",
+  "StallDetector",
   "SystemErrorCode",
+  "TERMINAL_STATUSES",
   "TCheckpointData",
   "TPartialResult",
   "TResult",
+  "cancel_operation",
+  "current_rss",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
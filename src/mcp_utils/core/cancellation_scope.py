@@ -0,0 +1,210 @@
+"""Live cancellation state for running operations, with callbacks and linked scopes."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Iterable
+from typing import Self
+
+from mcp_utils._utils.factories import (
+  create_active_cancellation_token,
+  generate_timestamp,
+  request_cancellation,
+)
+from mcp_utils._utils.transitions import transition_operation, validate_transition
+from mcp_utils.base.primitives import OperationId
+from mcp_utils.core.cancellation_token import (
+  CancellationReason,
+  CancellationSource,
+  CancellationToken,
+)
+from mcp_utils.core.operation_state import (
+  LifecycleStatus,
+  OperationState,
+  TPartialResult,
+  TResult,
+)
+from mcp_utils.mcp.notifications import CancellationNotification
+
+
+class CancellationScope:
+  """Mutable cancellation flag shared by everything working on one operation.
+
+  Poll ``cancelled`` in hot loops; it is a plain attribute set once by
+  ``cancel`` (only ever read it). Callbacks registered with
+  ``add_callback`` run once on cancellation, and ``await scope.wait()``
+  suspends until then. A scope created with ``parents`` (or through
+  ``child``) is cancelled with the same token as soon as any parent is,
+  so cancelling a request cancels all its sub-operations. ``cancel`` may
+  be called from any thread.
+
+  Once fired, ``token`` holds the cancelled CancellationToken and
+  ``notification`` the matching CancellationNotification.
+  """
+
+  __slots__ = (
+    "operation_id",
+    "cancelled",
+    "token",
+    "_notification",
+    "_parents",
+    "_children",
+    "_callbacks",
+    "_next_handle",
+    "_lock",
+  )
+
+  def __init__(
+    self,
+    operation_id: OperationId | None = None,
+    *,
+    parents: Iterable[Self] = (),
+  ) -> None:
+    self.operation_id = operation_id
+    self.cancelled = False
+    self.token: CancellationToken = create_active_cancellation_token()
+    self._notification: CancellationNotification | None = None
+    self._parents = tuple(parents)
+    self._children: set[Self] = set()
+    self._callbacks: dict[int, Callable[[Self], object]] = {}
+    self._next_handle = 0
+    self._lock = threading.Lock()
+    for parent in self._parents:
+      with parent._lock:
+        if not parent.cancelled:
+          parent._children.add(self)
+          continue
+      self._fire(parent.token)
+      break
+
+  def child(self, operation_id: OperationId | None = None) -> Self:
+    """Create a scope that is cancelled whenever this one is."""
+    return type(self)(operation_id, parents=(self,))
+
+  @property
+  def notification(self) -> CancellationNotification | None:
+    """CancellationNotification for this operation, or None if not cancelled or anonymous."""
+    if self._notification is None and self.cancelled and self.operation_id is not None:
+      self._notification = CancellationNotification(
+        operation_id=self.operation_id,
+        cancellation_token=self.token,
+        timestamp=generate_timestamp(),
+      )
+    return self._notification
+
+  def cancel(self, reason: CancellationReason, source: CancellationSource) -> bool:
+    """Cancel this scope and its descendants.
+
+    Returns False if it was already cancelled. Every callback runs even if
+    some raise; their exceptions are then re-raised as an ExceptionGroup.
+    """
+    if self.cancelled:
+      return False
+    return self._fire(request_cancellation(self.token, reason, source))
+
+  def add_callback(self, callback: Callable[[Self], object]) -> Callable[[], None]:
+    """Run ``callback(scope)`` on cancellation, or now if already cancelled.
+
+    Returns a function that unregisters the callback.
+    """
+    with self._lock:
+      if not self.cancelled:
+        handle = self._next_handle
+        self._next_handle += 1
+        self._callbacks[handle] = callback
+        return lambda: self._remove_callback(handle)
+    callback(self)
+    return _noop
+
+  async def wait(self) -> None:
+    """Wait until the scope is cancelled."""
+    if self.cancelled:
+      return
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[None] = loop.create_future()
+    remove = self.add_callback(lambda _: loop.call_soon_threadsafe(_resolve, future))
+    try:
+      await future
+    finally:
+      remove()
+
+  def close(self) -> None:
+    """Detach from the parents, e.g. when the operation has finished."""
+    for parent in self._parents:
+      with parent._lock:
+        parent._children.discard(self)
+    with self._lock:
+      self._callbacks.clear()
+
+  def __enter__(self) -> Self:
+    return self
+
+  def __exit__(self, *exc_info: object) -> None:
+    self.close()
+
+  def _remove_callback(self, handle: int) -> None:
+    with self._lock:
+      self._callbacks.pop(handle, None)
+
+  def _fire(self, token: CancellationToken) -> bool:
+    """Set ``token`` on this scope and every not yet cancelled descendant."""
+    errors: list[Exception] = []
+    fired = False
+    pending = [self]
+    while pending:
+      scope = pending.pop()
+      with scope._lock:
+        if scope.cancelled:
+          continue
+        scope.token = token
+        scope.cancelled = True
+        callbacks = list(scope._callbacks.values())
+        children = list(scope._children)
+        scope._callbacks.clear()
+        scope._children.clear()
+      fired = fired or scope is self
+      for callback in callbacks:
+        try:
+          callback(scope)
+        except Exception as error:
+          errors.append(error)
+      pending.extend(children)
+    if errors:
+      raise ExceptionGroup("cancellation callbacks failed", errors)
+    return fired
+
+
+def cancel_operation(
+  state: OperationState[TResult, TPartialResult],
+  reason: CancellationReason,
+  source: CancellationSource,
+  *,
+  scope: CancellationScope | None = None,
+) -> tuple[OperationState[TResult, TPartialResult], CancellationToken]:
+  """Cancel an operation from the outside and return its new state and token.
+
+  Fires ``scope`` if given (a scope that was already cancelled keeps its
+  token) and moves a RUNNING state to CANCELLED through
+  transition_operation, keeping its partial results or using ``{}``.
+  States that cannot move to CANCELLED are returned unchanged.
+  """
+  if scope is not None:
+    scope.cancel(reason, source)
+    token = scope.token
+  else:
+    token = request_cancellation(create_active_cancellation_token(), reason, source)
+  if validate_transition(state.status, LifecycleStatus.CANCELLED):
+    state = transition_operation(
+      state,
+      LifecycleStatus.CANCELLED,
+      partial_results={} if state.partial_results is None else state.partial_results,
+    )
+  return state, token
+
+
+def _noop() -> None:
+  pass
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+  if not future.done():
+    future.set_result(None)
@@ -0,0 +1,257 @@
+"""Per-tool circuit breaker that cancels operations with reason ERROR_THRESHOLD."""
+
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+from mcp_utils._utils.factories import generate_timestamp
+from mcp_utils._utils.transitions import create_operation
+from mcp_utils.base.primitives import OperationId
+from mcp_utils.core.cancellation_scope import CancellationScope, cancel_operation
+from mcp_utils.core.cancellation_token import (
+  CancellationReason,
+  CancellationSource,
+  CancellationToken,
+)
+from mcp_utils.core.error_response import ErrorContext, ErrorResponse
+from mcp_utils.core.operation_state import TERMINAL_STATUSES, AnyOperationState, LifecycleStatus
+from mcp_utils.core.progress_metrics import ProgressMetrics
+
+
+class CircuitState(StrEnum):
+  """State of a tool's circuit."""
+
+  CLOSED = "closed"
+  OPEN = "open"
+  HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+  """Raised by CircuitBreaker.create_operation while a tool's circuit is open.
+
+  ``error`` is the ErrorResponse to return to the client.
+  """
+
+  def __init__(self, tool_name: str, retry_after: float, error: ErrorResponse) -> None:
+    super().__init__(error.message)
+    self.tool_name = tool_name
+    self.retry_after = retry_after
+    self.error = error
+
+
+class _Window:
+  """Outcomes of the last ``size`` calls in a ring buffer, with a running failure count."""
+
+  __slots__ = ("outcomes", "index", "failures")
+
+  def __init__(self, size: int) -> None:
+    self.outcomes = bytearray(size)
+    self.index = 0
+    self.failures = 0
+
+  def push(self, failed: bool) -> int:
+    index = self.index
+    self.failures += failed - self.outcomes[index]
+    self.outcomes[index] = failed
+    self.index = (index + 1) % len(self.outcomes)
+    return self.failures
+
+  def clear(self) -> None:
+    self.outcomes[:] = bytes(len(self.outcomes))
+    self.index = self.failures = 0
+
+
+class _Circuit:
+  __slots__ = ("state", "opened_at", "probe", "windows", "running")
+
+  def __init__(self) -> None:
+    self.state = CircuitState.CLOSED
+    self.opened_at = 0.0
+    self.probe: OperationId | None = None
+    self.windows: dict[int, _Window] = {}
+    self.running: dict[OperationId, tuple[AnyOperationState, CancellationScope | None]] = {}
+
+
+class CircuitBreaker:
+  """Stop sending work to a tool whose backend keeps failing.
+
+  Each tool keeps the outcomes of its last ``window`` calls in a ring
+  buffer; with ``by_code_range`` there is one buffer per error code range
+  (1xxx connection, 3xxx query, ...), so a burst of bad queries does not
+  add up with connection failures. Once ``failure_threshold`` failures sit
+  in one buffer the circuit opens:
+
+  - the tool's tracked in-flight operations are cancelled with reason
+    ERROR_THRESHOLD and source SERVER through cancel_operation, and
+    ``on_cancel(state, token)`` is called for each
+  - ``create_operation`` raises CircuitOpenError for the tool
+
+  ``reset_timeout`` seconds later the circuit is half open: the next
+  ``create_operation`` is let through as a probe and the others are still
+  rejected. The probe completing closes the circuit and clears its
+  buffers; it failing opens it again. Outcomes are recorded from terminal
+  states passed to ``track`` (COMPLETED is a success, FAILED a failure
+  with the state's error) or directly with ``record_success`` and
+  ``record_failure``.
+  """
+
+  def __init__(
+    self,
+    on_cancel: Callable[[AnyOperationState, CancellationToken], object] | None = None,
+    *,
+    failure_threshold: int = 5,
+    window: int = 20,
+    reset_timeout: float = 30.0,
+    by_code_range: bool = False,
+    error_code: int = 6002,
+    clock: Callable[[], float] = time.monotonic,
+  ) -> None:
+    if not 1 <= failure_threshold <= window:
+      raise ValueError("failure_threshold must be between 1 and window")
+    if reset_timeout <= 0:
+      raise ValueError("reset_timeout must be positive")
+    if not 6000 <= error_code <= 6999:
+      raise ValueError("error_code must be an operation error code (6000-6999)")
+    self.failure_threshold = failure_threshold
+    self.window = window
+    self.reset_timeout = reset_timeout
+    self.by_code_range = by_code_range
+    self.error_code = error_code
+    self._on_cancel = on_cancel
+    self._clock = clock
+    self._circuits: dict[str, _Circuit] = {}
+    self._tools: dict[OperationId, str] = {}
+
+  def __len__(self) -> int:
+    return len(self._tools)
+
+  def __contains__(self, operation_id: object) -> bool:
+    return operation_id in self._tools
+
+  def state(self, tool_name: str) -> CircuitState:
+    """Current state of ``tool_name``'s circuit."""
+    circuit = self._circuits.get(tool_name)
+    return CircuitState.CLOSED if circuit is None else circuit.state
+
+  def failures(self, tool_name: str, code: int | None = None) -> int:
+    """Failures in the window that an error with ``code`` is counted in."""
+    circuit = self._circuits.get(tool_name)
+    window = None if circuit is None else circuit.windows.get(self._category(code))
+    return 0 if window is None else window.failures
+
+  def create_operation(
+    self,
+    tool_name: str,
+    *,
+    progress: ProgressMetrics | None = None,
+    scope: CancellationScope | None = None,
+  ) -> AnyOperationState:
+    """Create and track an operation, or raise CircuitOpenError if the circuit is open."""
+    circuit = self._circuits.setdefault(tool_name, _Circuit())
+    if circuit.state != CircuitState.CLOSED:
+      retry_after = circuit.opened_at + self.reset_timeout - self._clock()
+      if circuit.probe is not None or retry_after > 0:
+        raise self._rejection(tool_name, max(retry_after, 0.0))
+    state = create_operation(tool_name, progress=progress)
+    if circuit.state != CircuitState.CLOSED:
+      circuit.state, circuit.probe = CircuitState.HALF_OPEN, state.operation_id
+    self.track(state, scope=scope)
+    return state
+
+  def track(self, state: AnyOperationState, *, scope: CancellationScope | None = None) -> None:
+    """Track an in-flight operation, or record the outcome of a terminal one.
+
+    ``scope`` is kept from earlier calls when not given.
+    """
+    operation_id = state.operation_id
+    tool_name = state.tool_name
+    if state.status in TERMINAL_STATUSES:
+      self.forget(operation_id)
+      if state.status == LifecycleStatus.COMPLETED:
+        self.record_success(tool_name)
+      elif state.status == LifecycleStatus.FAILED:
+        self.record_failure(tool_name, state.error)
+      return
+    running = self._circuits.setdefault(tool_name, _Circuit()).running
+    if scope is None and operation_id in running:
+      scope = running[operation_id][1]
+    running[operation_id] = (state, scope)
+    self._tools[operation_id] = tool_name
+
+  def forget(self, operation_id: OperationId) -> None:
+    """Stop tracking an operation without recording an outcome.
+
+    A forgotten probe lets the next create_operation probe instead.
+    """
+    tool_name = self._tools.pop(operation_id, None)
+    if tool_name is not None:
+      circuit = self._circuits[tool_name]
+      del circuit.running[operation_id]
+      if circuit.probe == operation_id:
+        circuit.probe = None
+
+  def record_success(self, tool_name: str) -> None:
+    """Record a successful call; closes a half-open circuit."""
+    circuit = self._circuits.get(tool_name)
+    if circuit is None:
+      return
+    if circuit.state == CircuitState.HALF_OPEN:
+      self._close(circuit)
+      return
+    for window in circuit.windows.values():
+      window.push(False)
+
+  def record_failure(
+    self, tool_name: str, error: ErrorResponse | None = None
+  ) -> list[AnyOperationState]:
+    """Record a failed call; returns the states cancelled if this opened the circuit."""
+    circuit = self._circuits.setdefault(tool_name, _Circuit())
+    category = self._category(None if error is None else error.code)
+    window = circuit.windows.get(category)
+    if window is None:
+      window = circuit.windows[category] = _Window(self.window)
+    failures = window.push(True)
+    if circuit.state == CircuitState.HALF_OPEN or (
+      circuit.state == CircuitState.CLOSED and failures >= self.failure_threshold
+    ):
+      return self._open(circuit)
+    return []
+
+  def reset(self, tool_name: str) -> None:
+    """Close a tool's circuit and clear its failure counts."""
+    circuit = self._circuits.get(tool_name)
+    if circuit is not None:
+      self._close(circuit)
+
+  def _category(self, code: int | None) -> int:
+    return code // 1000 if self.by_code_range and code is not None else 0
+
+  def _close(self, circuit: _Circuit) -> None:
+    circuit.state, circuit.probe = CircuitState.CLOSED, None
+    for window in circuit.windows.values():
+      window.clear()
+
+  def _open(self, circuit: _Circuit) -> list[AnyOperationState]:
+    circuit.state, circuit.probe = CircuitState.OPEN, None
+    circuit.opened_at = self._clock()
+    running, circuit.running = circuit.running, {}
+    cancelled = []
+    for operation_id, (state, scope) in running.items():
+      del self._tools[operation_id]
+      state, token = cancel_operation(
+        state, CancellationReason.ERROR_THRESHOLD, CancellationSource.SERVER, scope=scope
+      )
+      if self._on_cancel is not None:
+        self._on_cancel(state, token)
+      cancelled.append(state)
+    return cancelled
+
+  def _rejection(self, tool_name: str, retry_after: float) -> CircuitOpenError:
+    error = ErrorResponse(
+      code=self.error_code,
+      message=f"Too many recent failures for {tool_name}; not accepting new operations",
+      context=ErrorContext(operation=tool_name),
+      suggestion=f"Retry in {retry_after:.1f}s",
+      timestamp=generate_timestamp(),
+    )
+    return CircuitOpenError(tool_name, retry_after, error)
@@ -0,0 +1,181 @@
+"""Hierarchical timer-wheel deadlines that cancel operations with reason TIMEOUT."""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable
+
+from mcp_utils.base.primitives import OperationId
+from mcp_utils.core.cancellation_scope import CancellationScope, cancel_operation
+from mcp_utils.core.cancellation_token import (
+  CancellationReason,
+  CancellationSource,
+  CancellationToken,
+)
+from mcp_utils.core.operation_state import AnyOperationState
+
+
+class _Timer:
+  __slots__ = ("tick", "state", "scope", "bucket")
+
+  def __init__(self, tick: int, state: AnyOperationState, scope: CancellationScope | None) -> None:
+    self.tick = tick
+    self.state = state
+    self.scope = scope
+    self.bucket: dict[OperationId, _Timer] = {}
+
+
+class DeadlineManager:
+  """Per-operation deadlines on a hierarchical timer wheel.
+
+  Time is cut into ``resolution``-second ticks. Level 0 has one slot per
+  tick for the next ``wheel_size`` ticks, and each higher level has slots
+  ``wheel_size`` times wider; a timer moves down a level when its slot
+  comes up. Arming, re-arming and disarming are O(1) dict operations, and
+  ``advance`` touches only the slots that come due, so tens of thousands
+  of operations cost no tasks, threads or heap churn. A deadline is
+  rounded up to a whole tick and fires on the first ``advance`` after it.
+
+  On expiry the operation is cancelled with reason TIMEOUT and source
+  SERVER through cancel_operation (firing the scope it was armed with and
+  moving a RUNNING state to CANCELLED), and ``on_timeout(state, token)``
+  is called with the result.
+  """
+
+  def __init__(
+    self,
+    on_timeout: Callable[[AnyOperationState, CancellationToken], object],
+    *,
+    resolution: float = 0.01,
+    wheel_size: int = 256,
+    levels: int = 4,
+    clock: Callable[[], float] = time.monotonic,
+  ) -> None:
+    if resolution <= 0:
+      raise ValueError("resolution must be positive")
+    if wheel_size < 2 or levels < 1:
+      raise ValueError("wheel_size must be at least 2 and levels at least 1")
+    self.resolution = resolution
+    self.wheel_size = wheel_size
+    self._on_timeout = on_timeout
+    self._clock = clock
+    self._origin = clock()
+    self._tick = 0
+    self._spans = [wheel_size**level for level in range(levels)]
+    self._wheels: list[list[dict[OperationId, _Timer]]] = [
+      [{} for _ in range(wheel_size)] for _ in range(levels)
+    ]
+    self._timers: dict[OperationId, _Timer] = {}
+
+  def __len__(self) -> int:
+    return len(self._timers)
+
+  def __contains__(self, operation_id: object) -> bool:
+    return operation_id in self._timers
+
+  def arm(
+    self,
+    state: AnyOperationState,
+    timeout: float,
+    *,
+    scope: CancellationScope | None = None,
+  ) -> None:
+    """Set the deadline of ``state``'s operation to ``timeout`` seconds from now.
+
+    Re-arming an operation replaces its previous deadline.
+    """
+    operation_id = state.operation_id
+    old = self._timers.pop(operation_id, None)
+    if old is not None:
+      del old.bucket[operation_id]
+    tick = math.ceil((self._clock() + timeout - self._origin) / self.resolution)
+    timer = self._timers[operation_id] = _Timer(max(tick, self._tick + 1), state, scope)
+    self._insert(operation_id, timer)
+
+  def update(self, state: AnyOperationState) -> bool:
+    """Replace the state kept for an armed operation; False if it is not armed."""
+    timer = self._timers.get(state.operation_id)
+    if timer is None:
+      return False
+    timer.state = state
+    return True
+
+  def disarm(self, operation_id: OperationId) -> bool:
+    """Remove an operation's deadline; False if it had none."""
+    timer = self._timers.pop(operation_id, None)
+    if timer is None:
+      return False
+    del timer.bucket[operation_id]
+    return True
+
+  def remaining(self, operation_id: OperationId) -> float | None:
+    """Seconds until the operation's deadline, or None if it has none."""
+    timer = self._timers.get(operation_id)
+    if timer is None:
+      return None
+    return timer.tick * self.resolution + self._origin - self._clock()
+
+  def advance(self) -> int:
+    """Fire every deadline that has passed; returns how many fired."""
+    target = math.floor((self._clock() - self._origin) / self.resolution)
+    if not self._timers:
+      self._tick = max(self._tick, target)
+      return 0
+    fired = 0
+    wheels, size = self._wheels, self.wheel_size
+    while self._tick < target and self._timers:
+      self._tick += 1
+      tick = self._tick
+      for level in range(len(self._spans) - 1, 0, -1):
+        span = self._spans[level]
+        if tick % span == 0:
+          self._cascade(wheels[level], (tick // span) % size)
+      slot = wheels[0][tick % size]
+      if slot:
+        wheels[0][tick % size] = {}
+        for operation_id, timer in list(slot.items()):
+          # An earlier expiry callback may have disarmed or re-armed this one.
+          if self._timers.get(operation_id) is not timer:
+            continue
+          if timer.tick > tick:  # parked beyond a single-level wheel's range
+            self._insert(operation_id, timer)
+            continue
+          del self._timers[operation_id]
+          self._expire(timer)
+          fired += 1
+    self._tick = max(self._tick, target)
+    return fired
+
+  async def run(self, interval: float | None = None) -> None:
+    """Call ``advance`` every ``interval`` seconds (default: one tick) until cancelled."""
+    interval = self.resolution if interval is None else interval
+    while True:
+      self.advance()
+      await asyncio.sleep(interval)
+
+  def _insert(self, operation_id: OperationId, timer: _Timer) -> None:
+    size, spans, tick, now = self.wheel_size, self._spans, timer.tick, self._tick
+    top, level = len(spans) - 1, 0
+    while level < top and tick // spans[level] - now // spans[level] >= size:
+      level += 1
+    if tick // spans[level] - now // spans[level] >= size:
+      # Beyond the top level's range: park in its last slot and re-place on cascade.
+      tick = now + spans[top] * (size - 1)
+    timer.bucket = self._wheels[level][(tick // spans[level]) % size]
+    timer.bucket[operation_id] = timer
+
+  def _cascade(self, wheel: list[dict[OperationId, _Timer]], index: int) -> None:
+    slot = wheel[index]
+    if slot:
+      wheel[index] = {}
+      for operation_id, timer in slot.items():
+        self._insert(operation_id, timer)
+
+  def _expire(self, timer: _Timer) -> None:
+    state, token = cancel_operation(
+      timer.state,
+      CancellationReason.TIMEOUT,
+      CancellationSource.SERVER,
+      scope=timer.scope,
+    )
+    self._on_timeout(state, token)
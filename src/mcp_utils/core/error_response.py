@@ -5,7 +5,7 @@ from typing import Annotated, Self
 from pydantic import ConfigDict, Field, model_validator
 
 from mcp_utils._base_model import McpUtilsBaseModel
-from mcp_utils.base.primitives import Timestamp
+from mcp_utils.base.primitives import InternedStr, Timestamp
 
 # Error code type aliases
 ErrorCode = Annotated[int, Field(ge=1000, le=6999)]
@@ -29,7 +29,7 @@ class ErrorContext(McpUtilsBaseModel):
   )
 
   operation: str | None = None
-  stage: str | None = None
+  stage: InternedStr | None = None
   retries_attempted: Annotated[int, Field(ge=0)] | None = Field(
     default=None, alias="retriesAttempted"
   )
@@ -6,7 +6,7 @@ from typing import Any, Generic, Self, TypeVar
 from pydantic import Field, model_validator
 
 from mcp_utils._base_model import McpUtilsBaseModel
-from mcp_utils.base.primitives import OperationId, Timestamp
+from mcp_utils.base.primitives import InternedStr, OperationId, Timestamp
 from mcp_utils.core.error_response import ErrorResponse
 from mcp_utils.core.progress_metrics import ProgressMetrics
 
@@ -22,6 +22,10 @@ class LifecycleStatus(StrEnum):
   CANCELLED = "cancelled"
 
 
+TERMINAL_STATUSES = frozenset(
+  {LifecycleStatus.COMPLETED, LifecycleStatus.FAILED, LifecycleStatus.CANCELLED}
+)
+
 TResult = TypeVar("TResult", default=dict[str, Any])
 TCheckpointData = TypeVar("TCheckpointData", default=dict[str, Any])
 TPartialResult = TypeVar("TPartialResult", default=dict[str, Any])
@@ -32,7 +36,7 @@ class Checkpoint(McpUtilsBaseModel, Generic[TCheckpointData]):
 
   data: TCheckpointData
   timestamp: Timestamp
-  stage: str
+  stage: InternedStr
 
 
 class ResumeCapability(McpUtilsBaseModel, Generic[TCheckpointData]):
@@ -46,7 +50,7 @@ class OperationState(McpUtilsBaseModel, Generic[TResult, TPartialResult]):
   """Current state of an operation."""
 
   operation_id: OperationId = Field(..., alias="operationId")
-  tool_name: str = Field(..., alias="toolName")
+  tool_name: InternedStr = Field(..., alias="toolName")
   status: LifecycleStatus
   start_time: Timestamp = Field(..., alias="startTime")
   end_time: Timestamp | None = Field(default=None, alias="endTime")
@@ -57,11 +61,14 @@ class OperationState(McpUtilsBaseModel, Generic[TResult, TPartialResult]):
 
   @model_validator(mode="after")
   def validate_status_constraints(self) -> Self:
-    terminal = {LifecycleStatus.COMPLETED, LifecycleStatus.FAILED, LifecycleStatus.CANCELLED}
-    if self.status in terminal and self.end_time is None:
+    if self.status in TERMINAL_STATUSES and self.end_time is None:
       raise ValueError(f"end_time is required when status is '{self.status}'")
     if self.status == LifecycleStatus.FAILED and self.error is None:
       raise ValueError("error is required when status is 'failed'")
     if self.status == LifecycleStatus.CANCELLED and self.partial_results is None:
       raise ValueError("partial_results is required when status is 'cancelled'")
     return self
+
+
+# Any operation state, whatever its result types; for code that only routes states.
+AnyOperationState = OperationState[Any, Any]
@@ -5,7 +5,7 @@ from typing import Annotated, Any, Self
 from pydantic import Field, model_validator
 
 from mcp_utils._base_model import McpUtilsBaseModel
-from mcp_utils.base.primitives import OperationId, ProgressToken, Timestamp
+from mcp_utils.base.primitives import InternedStr, OperationId, ProgressToken, Timestamp
 
 
 class ProgressMetrics(McpUtilsBaseModel):
@@ -13,7 +13,7 @@ class ProgressMetrics(McpUtilsBaseModel):
 
   current: Annotated[int, Field(ge=0)]
   total: int | None = None
-  unit: str = "items"
+  unit: InternedStr = "items"
   percentage: Annotated[float, Field(ge=0.0, le=100.0)]
 
   @model_validator(mode="after")
@@ -33,7 +33,7 @@ class ProgressNotification(McpUtilsBaseModel):
 
   operation_id: OperationId = Field(..., alias="operationId")
   progress_token: ProgressToken = Field(..., alias="progressToken")
-  stage: str
+  stage: InternedStr
   progress: ProgressMetrics
   message: str | None = None
   metadata: dict[str, Any] | None = None
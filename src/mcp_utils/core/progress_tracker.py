@@ -0,0 +1,108 @@
+"""Mutable progress accumulator with smoothed throughput and ETA."""
+
+import time
+from collections.abc import Callable
+
+from mcp_utils._utils.factories import create_progress_metrics
+from mcp_utils.core.progress_metrics import ProgressMetrics
+
+
+class ProgressTracker:
+  """Cheap mutable counter that produces validated ProgressMetrics on demand.
+
+  ``advance`` is a plain integer add, so it can sit in hot loops. Throughput
+  is an exponentially weighted moving average of items per second, updated
+  whenever ``throughput``, ``eta`` or ``snapshot`` is read (at most once per
+  ``sample_interval``). Samples are weighted by elapsed time with a
+  ``halflife`` in seconds, so irregular sampling does not skew the rate.
+  """
+
+  __slots__ = (
+    "current",
+    "total",
+    "unit",
+    "halflife",
+    "sample_interval",
+    "_clock",
+    "_started_at",
+    "_sampled_at",
+    "_sampled_current",
+    "_rate",
+  )
+
+  def __init__(
+    self,
+    total: int | None = None,
+    *,
+    unit: str = "items",
+    current: int = 0,
+    halflife: float = 5.0,
+    sample_interval: float = 0.1,
+    clock: Callable[[], float] = time.monotonic,
+  ) -> None:
+    if halflife <= 0:
+      raise ValueError("halflife must be positive")
+    self.current = current
+    self.total = total
+    self.unit = unit
+    self.halflife = halflife
+    self.sample_interval = sample_interval
+    self._clock = clock
+    self._started_at = self._sampled_at = clock()
+    self._sampled_current = current
+    self._rate: float | None = None
+
+  def advance(self, n: int = 1) -> None:
+    """Add ``n`` completed units."""
+    self.current += n
+
+  @property
+  def percentage(self) -> float:
+    """Completion percentage from current/total, capped at 100 (0 when the total is unknown)."""
+    total = self.total
+    return min(self.current / total, 1.0) * 100 if total else 0.0
+
+  @property
+  def elapsed(self) -> float:
+    """Seconds since the tracker was created."""
+    return self._clock() - self._started_at
+
+  @property
+  def throughput(self) -> float | None:
+    """Smoothed units per second, or None before the first sample."""
+    self._sample()
+    return self._rate
+
+  @property
+  def eta(self) -> float | None:
+    """Estimated seconds remaining, or None if the total or rate is unknown."""
+    rate = self.throughput
+    if self.total is None or not rate:
+      return None
+    return max(self.total - self.current, 0) / rate
+
+  def snapshot(self) -> ProgressMetrics:
+    """Return a validated ProgressMetrics for the current state.
+
+    When ``current`` has overshot an estimated total, the total is reported
+    as ``current`` (100%).
+    """
+    self._sample()
+    total = self.total
+    if total is not None and self.current > total:
+      total = self.current
+    return create_progress_metrics(self.current, total, unit=self.unit, percentage=self.percentage)
+
+  def _sample(self) -> None:
+    now = self._clock()
+    elapsed = now - self._sampled_at
+    if elapsed < self.sample_interval or elapsed <= 0:
+      return
+    rate = (self.current - self._sampled_current) / elapsed
+    if self._rate is None:
+      self._rate = rate
+    else:
+      weight = 1 - 0.5 ** (elapsed / self.halflife)
+      self._rate += weight * (rate - self._rate)
+    self._sampled_at = now
+    self._sampled_current = self.current
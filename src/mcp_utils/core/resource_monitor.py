@@ -0,0 +1,251 @@
+"""Sampling resource monitor that cancels operations with reason RESOURCE_LIMIT."""
+
+import asyncio
+import os
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Self
+
+from mcp_utils.base.primitives import OperationId
+from mcp_utils.core.cancellation_scope import CancellationScope, cancel_operation
+from mcp_utils.core.cancellation_token import (
+  CancellationReason,
+  CancellationSource,
+  CancellationToken,
+)
+from mcp_utils.core.operation_state import TERMINAL_STATUSES, AnyOperationState
+
+_STATM = "/proc/self/statm"
+
+
+def current_rss() -> int | None:
+  """Resident set size of this process in bytes, or None if it cannot be read.
+
+  Read from /proc, so only available on Linux. The peak RSS from getrusage
+  is no substitute: it never goes down, so a ceiling once crossed would
+  stay crossed.
+  """
+  try:
+    with open(_STATM, "rb") as statm:
+      return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+  except OSError:
+    return None
+
+
+class ResourceBudget:
+  """Per-operation limits for one tool; None means unlimited."""
+
+  __slots__ = ("cpu_seconds", "memory_bytes")
+
+  def __init__(self, *, cpu_seconds: float | None = None, memory_bytes: int | None = None) -> None:
+    if (cpu_seconds is not None and cpu_seconds <= 0) or (
+      memory_bytes is not None and memory_bytes <= 0
+    ):
+      raise ValueError("budget limits must be positive")
+    self.cpu_seconds = cpu_seconds
+    self.memory_bytes = memory_bytes
+
+  def overrun(self, cpu_seconds: float, memory_bytes: int) -> float:
+    """Largest usage-to-limit ratio; above 1 means the budget is exceeded."""
+    ratio = 0.0
+    if self.cpu_seconds is not None:
+      ratio = cpu_seconds / self.cpu_seconds
+    if self.memory_bytes is not None:
+      ratio = max(ratio, memory_bytes / self.memory_bytes)
+    return ratio
+
+
+class _Usage:
+  __slots__ = ("state", "scope", "cpu_seconds", "memory_bytes")
+
+  def __init__(self, state: AnyOperationState, scope: CancellationScope | None) -> None:
+    self.state = state
+    self.scope = scope
+    self.cpu_seconds = 0.0
+    self.memory_bytes = 0
+
+
+class ResourceMonitor:
+  """Hold operations to per-tool resource budgets and the worker to an RSS ceiling.
+
+  Operations report what they use through ``measure`` (CPU time of the
+  current thread and, with ``trace_allocations``, net allocations seen by
+  tracemalloc) or ``charge``. Each ``sample`` reads the process RSS and
+  cancels, most expensive first:
+
+  - every operation over its tool's budget, ranked by how far over it is
+  - while the RSS is above ``max_rss``, the operations holding the most
+    memory (then CPU), until their accounted memory covers the excess
+
+  ``max_rss`` needs a readable current RSS (see current_rss), so it raises
+  ValueError where there is none.
+  Cancellation goes through cancel_operation with reason RESOURCE_LIMIT
+  and source SERVER, and ``on_cancel(state, token)`` is called for each.
+  tracemalloc slows the interpreter down noticeably, so only enable
+  ``trace_allocations`` when debugging; ``close`` stops tracing again if
+  this monitor started it.
+  """
+
+  def __init__(
+    self,
+    on_cancel: Callable[[AnyOperationState, CancellationToken], object],
+    *,
+    budgets: Mapping[str, ResourceBudget] | None = None,
+    default_budget: ResourceBudget | None = None,
+    max_rss: int | None = None,
+    trace_allocations: bool = False,
+    rss: Callable[[], int | None] = current_rss,
+    cpu_clock: Callable[[], float] = time.thread_time,
+  ) -> None:
+    self.budgets = dict(budgets or {})
+    self.default_budget = default_budget
+    self.max_rss = max_rss
+    self.trace_allocations = trace_allocations
+    self.process_rss: int | None = None
+    self._on_cancel = on_cancel
+    self._rss = rss
+    self._cpu_clock = cpu_clock
+    self._usage: dict[OperationId, _Usage] = {}
+    if max_rss is not None and rss() is None:
+      raise ValueError("max_rss needs the current RSS, which cannot be read on this platform")
+    self._started_tracing = trace_allocations and not tracemalloc.is_tracing()
+    if self._started_tracing:
+      tracemalloc.start()
+
+  def __len__(self) -> int:
+    return len(self._usage)
+
+  def __contains__(self, operation_id: object) -> bool:
+    return operation_id in self._usage
+
+  def close(self) -> None:
+    """Stop tracemalloc if this monitor started it."""
+    if self._started_tracing:
+      self._started_tracing = False
+      tracemalloc.stop()
+
+  def __enter__(self) -> Self:
+    return self
+
+  def __exit__(self, *exc_info: object) -> None:
+    self.close()
+
+  def budget_for(self, tool_name: str) -> ResourceBudget | None:
+    """The budget applied to operations of ``tool_name``."""
+    return self.budgets.get(tool_name, self.default_budget)
+
+  def track(self, state: AnyOperationState, *, scope: CancellationScope | None = None) -> None:
+    """Start accounting for an operation, or record its new state.
+
+    Terminal states stop the accounting. ``scope`` is kept from earlier
+    calls when not given.
+    """
+    operation_id = state.operation_id
+    if state.status in TERMINAL_STATUSES:
+      self._usage.pop(operation_id, None)
+      return
+    usage = self._usage.get(operation_id)
+    if usage is None:
+      self._usage[operation_id] = _Usage(state, scope)
+      return
+    usage.state = state
+    if scope is not None:
+      usage.scope = scope
+
+  def forget(self, operation_id: OperationId) -> None:
+    """Stop accounting for an operation."""
+    self._usage.pop(operation_id, None)
+
+  def charge(
+    self, operation_id: OperationId, *, cpu_seconds: float = 0.0, memory_bytes: int = 0
+  ) -> bool:
+    """Add usage to an operation; False if it is not tracked.
+
+    ``memory_bytes`` may be negative when the operation releases memory.
+    """
+    usage = self._usage.get(operation_id)
+    if usage is None:
+      return False
+    usage.cpu_seconds += cpu_seconds
+    usage.memory_bytes += memory_bytes
+    return True
+
+  def usage(self, operation_id: OperationId) -> tuple[float, int] | None:
+    """CPU seconds and net allocated bytes charged to an operation so far."""
+    usage = self._usage.get(operation_id)
+    return None if usage is None else (usage.cpu_seconds, usage.memory_bytes)
+
+  @contextmanager
+  def measure(self, operation_id: OperationId) -> Iterator[None]:
+    """Charge the CPU time (and traced allocations) of the enclosed block to an operation.
+
+    Only work done on the current thread in the block is counted, so wrap
+    synchronous sections; in asyncio code, wrap the parts between awaits.
+    """
+    tracing = self.trace_allocations and tracemalloc.is_tracing()
+    memory_start = tracemalloc.get_traced_memory()[0] if tracing else 0
+    cpu_start = self._cpu_clock()
+    try:
+      yield
+    finally:
+      cpu_seconds = self._cpu_clock() - cpu_start
+      memory_bytes = tracemalloc.get_traced_memory()[0] - memory_start if tracing else 0
+      self.charge(operation_id, cpu_seconds=cpu_seconds, memory_bytes=memory_bytes)
+
+  def sample(self) -> list[AnyOperationState]:
+    """Read the process RSS, enforce the budgets, and return the cancelled states."""
+    self.process_rss = rss = self._rss()
+
+    over_budget: list[tuple[float, OperationId]] = []
+    for operation_id, usage in self._usage.items():
+      budget = self.budget_for(usage.state.tool_name)
+      if budget is not None:
+        overrun = budget.overrun(usage.cpu_seconds, usage.memory_bytes)
+        if overrun > 1.0:
+          over_budget.append((overrun, operation_id))
+    victims = [operation_id for _, operation_id in sorted(over_budget, reverse=True)]
+
+    if self.max_rss is not None and rss is not None and rss > self.max_rss:
+      excess = rss - self.max_rss
+      excess -= sum(max(self._usage[victim].memory_bytes, 0) for victim in victims)
+      chosen = set(victims)
+      heaviest = sorted(
+        (
+          (usage.memory_bytes, usage.cpu_seconds, operation_id)
+          for operation_id, usage in self._usage.items()
+          if operation_id not in chosen
+        ),
+        reverse=True,
+      )
+      for memory_bytes, _, operation_id in heaviest:
+        if excess <= 0:
+          break
+        victims.append(operation_id)
+        if memory_bytes <= 0:
+          break  # nothing accounted to go by: shed one operation per sample
+        excess -= memory_bytes
+
+    cancelled = []
+    for operation_id in victims:
+      victim = self._usage.pop(operation_id, None)
+      if victim is not None:  # an earlier on_cancel may have finished it
+        cancelled.append(self._cancel(victim))
+    return cancelled
+
+  async def run(self, interval: float = 1.0) -> None:
+    """Call ``sample`` every ``interval`` seconds until cancelled."""
+    while True:
+      self.sample()
+      await asyncio.sleep(interval)
+
+  def _cancel(self, usage: _Usage) -> AnyOperationState:
+    state, token = cancel_operation(
+      usage.state,
+      CancellationReason.RESOURCE_LIMIT,
+      CancellationSource.SERVER,
+      scope=usage.scope,
+    )
+    self._on_cancel(state, token)
+    return state
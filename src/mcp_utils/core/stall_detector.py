@@ -0,0 +1,221 @@
+"""Watchdog for operations that stop reporting progress."""
+
+import logging
+import math
+import time
+from collections.abc import Callable, Mapping
+from enum import StrEnum
+
+from mcp_utils._utils.factories import generate_timestamp
+from mcp_utils.base.primitives import OperationId
+from mcp_utils.core.cancellation_scope import CancellationScope, cancel_operation
+from mcp_utils.core.cancellation_token import CancellationReason, CancellationSource
+from mcp_utils.core.error_response import ErrorContext, ErrorResponse
+from mcp_utils.core.operation_state import TERMINAL_STATUSES, AnyOperationState, LifecycleStatus
+from mcp_utils.core.progress_metrics import ProgressNotification
+from mcp_utils.mcp.notifications import CancellationNotification, ErrorNotification
+
+logger = logging.getLogger(__name__)
+
+StallNotification = ErrorNotification | CancellationNotification
+
+
+class StallAction(StrEnum):
+  """What StallDetector does with an operation that stopped making progress."""
+
+  WARN = "warn"
+  ERROR = "error"
+  CANCEL = "cancel"
+
+
+class _Watch:
+  __slots__ = ("state", "scope", "stage", "last_seen", "bucket")
+
+  def __init__(
+    self, state: AnyOperationState, scope: CancellationScope | None, last_seen: float
+  ) -> None:
+    self.state = state
+    self.scope = scope
+    self.stage: str | None = None
+    self.last_seen = last_seen
+    self.bucket: int | None = None
+
+
+class StallDetector:
+  """Find operations with no progress or transition within their tool's threshold.
+
+  Each watched operation sits in a time bucket (``resolution`` seconds
+  wide) keyed by when it would stall, and recording activity just moves it
+  to a later bucket. ``check`` only opens the buckets that have come due,
+  so its cost follows the number of stalled operations, not the number
+  watched. Stalls are reported at most ``resolution`` seconds late.
+
+  A stalled operation is handled by ``action``:
+
+  - WARN: log a warning, and again after every further threshold
+  - ERROR: send an ErrorNotification with ``error_code`` to ``sink``, and
+    again after every further threshold
+  - CANCEL: cancel it with reason TIMEOUT and source SERVER through
+    cancel_operation, send the CancellationNotification to ``sink`` and
+    stop watching it
+
+  CREATED and RUNNING operations are watched; PAUSED ones are kept but not
+  checked until they run again, and terminal ones are dropped.
+  """
+
+  def __init__(
+    self,
+    *,
+    threshold: float = 60.0,
+    tool_thresholds: Mapping[str, float] | None = None,
+    action: StallAction = StallAction.WARN,
+    error_code: int = 6001,
+    sink: Callable[[StallNotification], object] | None = None,
+    resolution: float = 1.0,
+    clock: Callable[[], float] = time.monotonic,
+  ) -> None:
+    if threshold <= 0 or resolution <= 0:
+      raise ValueError("threshold and resolution must be positive")
+    if not 6000 <= error_code <= 6999:
+      raise ValueError("error_code must be an operation error code (6000-6999)")
+    self.threshold = threshold
+    self.tool_thresholds = dict(tool_thresholds or {})
+    self.action = action
+    self.error_code = error_code
+    self.resolution = resolution
+    self._sink = sink
+    self._clock = clock
+    self._watches: dict[OperationId, _Watch] = {}
+    self._buckets: dict[int, dict[OperationId, _Watch]] = {}
+    self._checked = math.floor(clock() / resolution)
+
+  def __len__(self) -> int:
+    return len(self._watches)
+
+  def __contains__(self, operation_id: object) -> bool:
+    return operation_id in self._watches
+
+  def threshold_for(self, tool_name: str) -> float:
+    """Seconds without progress after which an operation of ``tool_name`` has stalled."""
+    return self.tool_thresholds.get(tool_name, self.threshold)
+
+  def record_transition(
+    self, state: AnyOperationState, *, scope: CancellationScope | None = None
+  ) -> None:
+    """Start watching an operation or record its new state.
+
+    ``scope`` is the operation's CancellationScope, used by the CANCEL
+    action; it is kept from earlier calls when not given.
+    """
+    operation_id = state.operation_id
+    if state.status in TERMINAL_STATUSES:
+      self.forget(operation_id)
+      return
+    now = self._clock()
+    watch = self._watches.get(operation_id)
+    if watch is None:
+      watch = self._watches[operation_id] = _Watch(state, scope, now)
+    else:
+      watch.state, watch.last_seen = state, now
+      if scope is not None:
+        watch.scope = scope
+    self._unindex(operation_id, watch)
+    if state.status != LifecycleStatus.PAUSED:
+      self._index(operation_id, watch, now + self.threshold_for(state.tool_name))
+
+  def record_progress(self, notification: ProgressNotification) -> bool:
+    """Record a progress notification; False if its operation is not watched."""
+    operation_id = notification.operation_id
+    watch = self._watches.get(operation_id)
+    if watch is None:
+      return False
+    now = watch.last_seen = self._clock()
+    watch.stage = notification.stage
+    self._unindex(operation_id, watch)
+    if watch.state.status != LifecycleStatus.PAUSED:
+      self._index(operation_id, watch, now + self.threshold_for(watch.state.tool_name))
+    return True
+
+  def forget(self, operation_id: OperationId) -> None:
+    """Stop watching an operation."""
+    watch = self._watches.pop(operation_id, None)
+    if watch is not None:
+      self._unindex(operation_id, watch)
+
+  def check(self) -> list[AnyOperationState]:
+    """Handle every operation that has stalled since the last check.
+
+    Returns their states; with the CANCEL action these are the new
+    CANCELLED states (or the unchanged ones that could not be cancelled).
+    """
+    now = self._clock()
+    due = math.floor(now / self.resolution)
+    if due <= self._checked:
+      return []
+    buckets = self._buckets
+    if due - self._checked <= len(buckets):
+      keys = [key for key in range(self._checked + 1, due + 1) if key in buckets]
+    else:
+      keys = sorted(key for key in buckets if key <= due)
+    self._checked = due
+    stalled = []
+    for key in keys:
+      bucket = buckets.pop(key)
+      for watch in bucket.values():
+        watch.bucket = None
+      for operation_id, watch in bucket.items():
+        # Callbacks run for an earlier one may have recorded activity for this one.
+        if (
+          watch.bucket is None
+          and self._watches.get(operation_id) is watch
+          and watch.state.status != LifecycleStatus.PAUSED
+        ):
+          stalled.append(self._stalled(operation_id, watch, now))
+    return stalled
+
+  def _index(self, operation_id: OperationId, watch: _Watch, deadline: float) -> None:
+    key = max(math.ceil(deadline / self.resolution), self._checked + 1)
+    self._buckets.setdefault(key, {})[operation_id] = watch
+    watch.bucket = key
+
+  def _unindex(self, operation_id: OperationId, watch: _Watch) -> None:
+    key = watch.bucket
+    if key is None:
+      return
+    bucket = self._buckets[key]
+    del bucket[operation_id]
+    if not bucket:
+      del self._buckets[key]
+    watch.bucket = None
+
+  def _stalled(self, operation_id: OperationId, watch: _Watch, now: float) -> AnyOperationState:
+    state = watch.state
+    threshold = self.threshold_for(state.tool_name)
+    if self.action == StallAction.CANCEL:
+      del self._watches[operation_id]
+      state, token = cancel_operation(
+        state, CancellationReason.TIMEOUT, CancellationSource.SERVER, scope=watch.scope
+      )
+      if self._sink is not None:
+        self._sink(
+          CancellationNotification(
+            operation_id=operation_id, cancellation_token=token, timestamp=generate_timestamp()
+          )
+        )
+      return state
+
+    idle = now - watch.last_seen
+    message = f"Operation made no progress for {idle:.1f}s (threshold {threshold:g}s)"
+    if self.action == StallAction.WARN:
+      logger.warning("%s (%s, stage %s): %s", operation_id, state.tool_name, watch.stage, message)
+    elif self._sink is not None:
+      timestamp = generate_timestamp()
+      error = ErrorResponse(
+        code=self.error_code,
+        message=message,
+        context=ErrorContext(operation=state.tool_name, stage=watch.stage),
+        timestamp=timestamp,
+      )
+      self._sink(ErrorNotification(operation_id=operation_id, error=error, timestamp=timestamp))
+    self._index(operation_id, watch, now + threshold)
+    return state
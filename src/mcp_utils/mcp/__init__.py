@@ -1,15 +1,44 @@
-"""MCP notification types."""
+"""MCP notification types and progress pipeline helpers."""
 
-from mcp_utils.mcp.notifications import (
-  CancellationNotification,
-  ErrorNotification,
-  ProgressNotification,
-  StateChangeNotification,
-)
+from typing import TYPE_CHECKING
+
+from mcp_utils._lazy import lazy_exports
+
+if TYPE_CHECKING:
+  from mcp_utils.mcp.notifications import (
+    CancellationNotification,
+    ErrorNotification,
+    ProgressNotification,
+    StateChangeNotification,
+  )
+  from mcp_utils.mcp.outbound_queue import AsyncOutboundQueue, OutboundNotification, OutboundQueue
+  from mcp_utils.mcp.progress_emitter import ProgressEmitter
+  from mcp_utils.mcp.progress_tree import ProgressNode, ProgressTree
+
+# Public names are imported on first access to keep package import cheap.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+  "mcp_utils.mcp.notifications": (
+    "CancellationNotification",
+    "ErrorNotification",
+    "ProgressNotification",
+    "StateChangeNotification",
+  ),
+  "mcp_utils.mcp.outbound_queue": ("AsyncOutboundQueue", "OutboundNotification", "OutboundQueue"),
+  "mcp_utils.mcp.progress_emitter": ("ProgressEmitter",),
+  "mcp_utils.mcp.progress_tree": ("ProgressNode", "ProgressTree"),
+}
 
 __all__ = [
+  "AsyncOutboundQueue",
   "CancellationNotification",
   "ErrorNotification",
+  "OutboundNotification",
+  "OutboundQueue",
+  "ProgressEmitter",
+  "ProgressNode",
   "ProgressNotification",
+  "ProgressTree",
   "StateChangeNotification",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,116 @@
+"""Outbound notification queue that coalesces progress updates per operation."""
+
+import asyncio
+from collections import deque
+
+from mcp_utils.base.primitives import OperationId
+from mcp_utils.core.progress_metrics import ProgressNotification
+from mcp_utils.mcp.notifications import (
+  CancellationNotification,
+  ErrorNotification,
+  StateChangeNotification,
+)
+from mcp_utils.mcp.rpc.wrappers import (
+  JsonRpcCancellationNotification,
+  JsonRpcErrorNotification,
+  JsonRpcProgressNotification,
+  JsonRpcStateChangeNotification,
+)
+
+OutboundNotification = (
+  ProgressNotification
+  | StateChangeNotification
+  | ErrorNotification
+  | CancellationNotification
+  | JsonRpcProgressNotification
+  | JsonRpcStateChangeNotification
+  | JsonRpcErrorNotification
+  | JsonRpcCancellationNotification
+)
+
+_WRAPPERS = (
+  JsonRpcProgressNotification,
+  JsonRpcStateChangeNotification,
+  JsonRpcErrorNotification,
+  JsonRpcCancellationNotification,
+)
+
+
+class _Slot:
+  __slots__ = ("item",)
+
+  def __init__(self, item: OutboundNotification) -> None:
+    self.item = item
+
+
+class OutboundQueue:
+  """FIFO of outbound notifications holding at most one pending progress update per operation.
+
+  A progress notification replaces the one already pending for its
+  operation, keeping that one's place in the queue. State change, error
+  and cancellation notifications are never dropped and keep their order.
+  A progress update is never moved ahead of another notification queued
+  after the progress it would replace, so per-operation order is kept.
+  Memory is therefore bounded by the number of active operations and
+  control notifications, not by the progress rate.
+  """
+
+  def __init__(self) -> None:
+    self._slots: deque[_Slot] = deque()
+    self._progress: dict[OperationId, _Slot] = {}
+    self.coalesced = 0
+
+  def __len__(self) -> int:
+    return len(self._slots)
+
+  def put(self, item: OutboundNotification) -> None:
+    """Queue a notification, replacing a pending progress update for the same operation."""
+    params = item.params if isinstance(item, _WRAPPERS) else item
+    operation_id = params.operation_id
+    if isinstance(params, ProgressNotification):
+      slot = self._progress.get(operation_id)
+      if slot is not None:
+        slot.item = item
+        self.coalesced += 1
+        return
+      slot = self._progress[operation_id] = _Slot(item)
+    else:
+      # Later progress must queue behind this notification, not replace an earlier slot.
+      self._progress.pop(operation_id, None)
+      slot = _Slot(item)
+    self._slots.append(slot)
+
+  def pop(self) -> OutboundNotification:
+    """Remove and return the oldest notification. Raises IndexError if empty."""
+    slot = self._slots.popleft()
+    item = slot.item
+    params = item.params if isinstance(item, _WRAPPERS) else item
+    if self._progress.get(params.operation_id) is slot:
+      del self._progress[params.operation_id]
+    return item
+
+  def drain(self) -> list[OutboundNotification]:
+    """Remove and return every queued notification, oldest first."""
+    items = [slot.item for slot in self._slots]
+    self._slots.clear()
+    self._progress.clear()
+    return items
+
+
+class AsyncOutboundQueue(OutboundQueue):
+  """OutboundQueue with an awaitable ``get`` for asyncio senders."""
+
+  def __init__(self) -> None:
+    super().__init__()
+    self._ready = asyncio.Event()
+
+  def put(self, item: OutboundNotification) -> None:
+    super().put(item)
+    self._ready.set()
+
+  async def get(self) -> OutboundNotification:
+    """Wait for and return the oldest notification."""
+    while not self._slots:
+      self._ready.clear()
+      await self._ready.wait()
+    return self.pop()
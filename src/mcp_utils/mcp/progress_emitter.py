@@ -0,0 +1,129 @@
+"""Verbosity-aware progress throttling that decides before building notifications."""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from mcp_utils._utils.factories import create_progress_metrics, generate_timestamp
+from mcp_utils.base.primitives import OperationId, ProgressToken
+from mcp_utils.base.system_types import VerbosityMode
+from mcp_utils.core.progress_metrics import ProgressNotification
+
+_LEVELS = {
+  VerbosityMode.COARSE: 0,
+  VerbosityMode.NORMAL: 1,
+  VerbosityMode.FINE: 2,
+  VerbosityMode.DEBUG: 3,
+}
+
+
+class _Emitted:
+  """What was last sent for one progress token."""
+
+  __slots__ = ("stage", "total", "percentage", "message", "metadata", "sent_at")
+
+  def __init__(
+    self,
+    stage: str,
+    total: int | None,
+    percentage: float,
+    message: str | None,
+    metadata: dict[str, Any] | None,
+    sent_at: float,
+  ) -> None:
+    self.stage = stage
+    self.total = total
+    self.percentage = percentage
+    self.message = message
+    self.metadata = metadata
+    self.sent_at = sent_at
+
+
+class ProgressEmitter:
+  """Decide per progress token whether an update is worth sending.
+
+  Rules by verbosity, each level including the ones before it:
+
+  - COARSE: the first update and every stage change
+  - NORMAL: percentage moved by at least ``min_percentage_delta``, reached
+    100, or the total changed
+  - FINE: the message changed
+  - DEBUG: the metadata changed
+
+  Stage changes are always sent, and so from NORMAL are updates reaching
+  100 or changing the total; any other update is also held back until
+  ``min_interval`` seconds have passed since the last one sent for that
+  token. The decision only compares plain values, and the
+  ProgressNotification is built only for updates that pass. Messages are
+  included from FINE and metadata from DEBUG.
+  """
+
+  def __init__(
+    self,
+    verbosity: VerbosityMode = VerbosityMode.NORMAL,
+    *,
+    min_interval: float = 0.1,
+    min_percentage_delta: float = 1.0,
+    clock: Callable[[], float] = time.monotonic,
+  ) -> None:
+    self.verbosity = verbosity
+    self.min_interval = min_interval
+    self.min_percentage_delta = min_percentage_delta
+    self._clock = clock
+    self._last: dict[ProgressToken, _Emitted] = {}
+
+  def update(
+    self,
+    operation_id: OperationId,
+    progress_token: ProgressToken,
+    stage: str,
+    current: int,
+    *,
+    total: int | None = None,
+    unit: str = "items",
+    percentage: float | None = None,
+    message: str | None = None,
+    metadata: dict[str, Any] | None = None,
+  ) -> ProgressNotification | None:
+    """Return a notification for this update, or None if it is suppressed.
+
+    Unless given, the percentage is derived from ``current`` and ``total``
+    (0 when the total is unknown). When ``current`` has overshot the total,
+    the total is reported as ``current`` (100%).
+    """
+    level = _LEVELS[self.verbosity]
+    if level < 2:
+      message = None
+    if level < 3:
+      metadata = None
+    if percentage is None:
+      percentage = min(current / total, 1.0) * 100 if total else 0.0
+    now = self._clock()
+    last = self._last.get(progress_token)
+    if last is not None and stage == last.stage:
+      urgent = level >= 1 and (percentage >= 100 > last.percentage or total != last.total)
+      if not urgent:
+        if now - last.sent_at < self.min_interval:
+          return None
+        changed = level >= 1 and abs(percentage - last.percentage) >= self.min_percentage_delta
+        changed = changed or message != last.message or metadata != last.metadata
+        if not changed:
+          return None
+    self._last[progress_token] = _Emitted(stage, total, percentage, message, metadata, now)
+    reported_total = current if total is not None and current > total else total
+    return ProgressNotification(
+      operation_id=operation_id,
+      progress_token=progress_token,
+      stage=stage,
+      progress=create_progress_metrics(current, reported_total, unit=unit, percentage=percentage),
+      message=message,
+      metadata=metadata,
+      timestamp=generate_timestamp(),
+    )
+
+  def forget(self, progress_token: ProgressToken) -> None:
+    """Drop the state kept for a finished progress token."""
+    self._last.pop(progress_token, None)
+
+  def __len__(self) -> int:
+    return len(self._last)
@@ -0,0 +1,189 @@
+"""Hierarchical progress aggregation across child operations."""
+
+from collections.abc import Callable
+from typing import Self
+
+from mcp_utils._utils.factories import create_progress_metrics
+from mcp_utils.base.primitives import OperationId, ProgressToken
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.mcp.progress_emitter import ProgressEmitter
+
+
+class ProgressNode:
+  """One operation in a progress tree.
+
+  A leaf tracks its own ``current``/``total``; an inner node's fraction is
+  the weighted mean of its children's. Each node keeps the running weighted
+  sum of its children, so a change is pushed to the root in O(depth)
+  instead of re-summing siblings. A leaf with an unknown total counts as 0
+  until it is completed.
+  """
+
+  __slots__ = (
+    "parent",
+    "weight",
+    "current",
+    "total",
+    "_children",
+    "_weighted_sum",
+    "_weight_total",
+    "_completed_children",
+    "_done",
+    "_on_change",
+  )
+
+  def __init__(
+    self,
+    parent: Self | None = None,
+    weight: float = 1.0,
+    total: int | None = None,
+  ) -> None:
+    if weight <= 0:
+      raise ValueError("weight must be positive")
+    self.parent = parent
+    self.weight = weight
+    self.current = 0
+    self.total = total
+    self._children = 0
+    self._weighted_sum = 0.0
+    self._weight_total = 0.0
+    self._completed_children = 0
+    self._done = False
+    self._on_change: Callable[[], None] | None = None
+
+  @property
+  def fraction(self) -> float:
+    """Completion between 0 and 1."""
+    if self._children:
+      if self._completed_children == self._children:
+        return 1.0  # exact, whatever rounding the running sum picked up
+      return min(max(self._weighted_sum / self._weight_total, 0.0), 1.0)
+    if self._done:
+      return 1.0
+    return min(self.current / self.total, 1.0) if self.total else 0.0
+
+  @property
+  def percentage(self) -> float:
+    """Completion between 0 and 100."""
+    return self.fraction * 100
+
+  @property
+  def completed_children(self) -> int:
+    """Number of direct children that are fully complete."""
+    return self._completed_children
+
+  def add_child(self, weight: float = 1.0, total: int | None = None) -> Self:
+    """Attach a child operation; its weight is relative to its siblings."""
+    if not self._children and (self.current or self._done):
+      raise ValueError("cannot add children to a leaf that has progress")
+    old = self.fraction if self._children else 0.0
+    child = type(self)(self, weight, total)
+    self._children += 1
+    self._weight_total += weight
+    self._changed(old)
+    return child
+
+  def update(self, current: int, total: int | None = None) -> None:
+    """Set a leaf's progress; ``total`` is kept from before if not given."""
+    self._require_leaf()
+    old = self.fraction
+    self.current = current
+    if total is not None:
+      self.total = total
+    self._changed(old)
+
+  def update_metrics(self, metrics: ProgressMetrics) -> None:
+    """Set a leaf's progress from the child operation's own ProgressMetrics."""
+    self.update(metrics.current, metrics.total)
+
+  def complete(self) -> None:
+    """Mark a leaf as finished, whether or not its total was known."""
+    self._require_leaf()
+    old = self.fraction
+    self._done = True
+    self._changed(old)
+
+  def snapshot(self, unit: str = "operations") -> ProgressMetrics:
+    """ProgressMetrics for this node: finished direct children and weighted percentage.
+
+    For a leaf, its own current/total; a total that ``current`` has overshot
+    is reported as ``current`` (100%).
+    """
+    if not self._children:
+      total = self.total
+      if total is not None and self.current > total:
+        total = self.current
+      percentage = (self.current / total) * 100 if total else self.percentage
+      return create_progress_metrics(self.current, total, percentage=percentage)
+    return create_progress_metrics(self._completed_children, unit=unit, percentage=self.percentage)
+
+  def _require_leaf(self) -> None:
+    if self._children:
+      raise ValueError("progress of a node with children is derived from them")
+
+  def _changed(self, old: float) -> None:
+    """Push this node's fraction change from ``old`` up to the root."""
+    node = self
+    new = node.fraction
+    while (parent := node.parent) is not None and new != old:
+      parent_old = parent.fraction
+      parent._weighted_sum += node.weight * (new - old)
+      parent._completed_children += (new >= 1.0) - (old >= 1.0)
+      node, old, new = parent, parent_old, parent.fraction
+    if node._on_change is not None and new != old:
+      node._on_change()
+
+
+class ProgressTree:
+  """Roll child progress up into one parent operation's progress notifications.
+
+  Updates to any node are aggregated into the root incrementally; each
+  change of the root's percentage is offered to ``emitter`` (so verbosity
+  and rate limits apply) and notifications that pass are handed to
+  ``sink``, e.g. ``OutboundQueue.put``.
+  """
+
+  def __init__(
+    self,
+    operation_id: OperationId,
+    progress_token: ProgressToken,
+    sink: Callable[[ProgressNotification], object],
+    *,
+    stage: str = "running",
+    unit: str = "operations",
+    emitter: ProgressEmitter | None = None,
+  ) -> None:
+    self.operation_id = operation_id
+    self.progress_token = progress_token
+    self.stage = stage
+    self.unit = unit
+    self.root = ProgressNode()
+    self._sink = sink
+    self._emitter = ProgressEmitter() if emitter is None else emitter
+    self.root._on_change = self._emit
+
+  def add_child(self, weight: float = 1.0, total: int | None = None) -> ProgressNode:
+    """Attach a top-level child operation."""
+    return self.root.add_child(weight, total)
+
+  def set_stage(self, stage: str) -> None:
+    """Change the parent's stage and offer a notification for it."""
+    self.stage = stage
+    self._emit()
+
+  def snapshot(self) -> ProgressMetrics:
+    """The parent's aggregated ProgressMetrics."""
+    return self.root.snapshot(self.unit)
+
+  def _emit(self) -> None:
+    root = self.root
+    notification = self._emitter.update(
+      self.operation_id,
+      self.progress_token,
+      self.stage,
+      root.completed_children,
+      unit=self.unit,
+      percentage=root.percentage,
+    )
+    if notification is not None:
+      self._sink(notification)
@@ -1,17 +1,112 @@
-"""JSON-RPC 2.0 notification wrappers."""
+"""JSON-RPC 2.0 notification wrappers, codecs, stream readers and writers."""
 
-from mcp_utils.mcp.rpc.wrappers import (
-  JsonRpcCancellationNotification,
-  JsonRpcErrorNotification,
-  JsonRpcNotification,
-  JsonRpcProgressNotification,
-  JsonRpcStateChangeNotification,
-)
+from typing import TYPE_CHECKING
+
+from mcp_utils._lazy import lazy_exports
+
+if TYPE_CHECKING:
+  from mcp_utils.mcp.rpc.decoders import (
+    NOTIFICATION_TYPES,
+    AnyJsonRpcNotification,
+    decode_notification,
+    decode_notification_python,
+  )
+  from mcp_utils.mcp.rpc.deltas import (
+    PROGRESS_DELTA_METHOD,
+    ProgressDeltaDecoder,
+    ProgressDeltaEncoder,
+  )
+  from mcp_utils.mcp.rpc.encoders import ProgressFrameEncoder, encode_progress_notification
+  from mcp_utils.mcp.rpc.lazy import LazyNotification
+  from mcp_utils.mcp.rpc.streams import (
+    FrameBuffer,
+    Framing,
+    aiter_frames,
+    aiter_notifications,
+    iter_frames,
+    iter_lazy_notifications,
+    iter_notifications,
+  )
+  from mcp_utils.mcp.rpc.wrappers import (
+    JsonRpcCancellationNotification,
+    JsonRpcErrorNotification,
+    JsonRpcNotification,
+    JsonRpcProgressNotification,
+    JsonRpcStateChangeNotification,
+  )
+  from mcp_utils.mcp.rpc.writers import (
+    URGENT_METHODS,
+    AsyncNotificationWriter,
+    NotificationWriter,
+    WriteFraming,
+  )
+
+# Public names are imported on first access to keep package import cheap.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+  "mcp_utils.mcp.rpc.decoders": (
+    "NOTIFICATION_TYPES",
+    "AnyJsonRpcNotification",
+    "decode_notification",
+    "decode_notification_python",
+  ),
+  "mcp_utils.mcp.rpc.deltas": (
+    "PROGRESS_DELTA_METHOD",
+    "ProgressDeltaDecoder",
+    "ProgressDeltaEncoder",
+  ),
+  "mcp_utils.mcp.rpc.encoders": ("ProgressFrameEncoder", "encode_progress_notification"),
+  "mcp_utils.mcp.rpc.lazy": ("LazyNotification",),
+  "mcp_utils.mcp.rpc.streams": (
+    "FrameBuffer",
+    "Framing",
+    "aiter_frames",
+    "aiter_notifications",
+    "iter_frames",
+    "iter_lazy_notifications",
+    "iter_notifications",
+  ),
+  "mcp_utils.mcp.rpc.wrappers": (
+    "JsonRpcCancellationNotification",
+    "JsonRpcErrorNotification",
+    "JsonRpcNotification",
+    "JsonRpcProgressNotification",
+    "JsonRpcStateChangeNotification",
+  ),
+  "mcp_utils.mcp.rpc.writers": (
+    "URGENT_METHODS",
+    "AsyncNotificationWriter",
+    "NotificationWriter",
+    "WriteFraming",
+  ),
+}
 
 __all__ = [
+  "AnyJsonRpcNotification",
+  "AsyncNotificationWriter",
+  "FrameBuffer",
+  "Framing",
   "JsonRpcCancellationNotification",
   "JsonRpcErrorNotification",
   "JsonRpcNotification",
   "JsonRpcProgressNotification",
   "JsonRpcStateChangeNotification",
+  "LazyNotification",
+  "NOTIFICATION_TYPES",
+  "NotificationWriter",
+  "PROGRESS_DELTA_METHOD",
+  "ProgressDeltaDecoder",
+  "ProgressDeltaEncoder",
+  "ProgressFrameEncoder",
+  "URGENT_METHODS",
+  "WriteFraming",
+  "aiter_frames",
+  "aiter_notifications",
+  "decode_notification",
+  "decode_notification_python",
+  "encode_progress_notification",
+  "iter_frames",
+  "iter_lazy_notifications",
+  "iter_notifications",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
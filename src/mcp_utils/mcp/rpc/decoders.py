@@ -0,0 +1,73 @@
+"""Single-pass decoding of incoming JSON-RPC notifications."""
+
+from typing import Annotated, Any
+
+from pydantic import ConfigDict, Field, TypeAdapter, ValidationError
+
+from mcp_utils._base_model import McpUtilsBaseModel
+from mcp_utils.mcp.rpc.wrappers import (
+  JsonRpcCancellationNotification,
+  JsonRpcErrorNotification,
+  JsonRpcNotification,
+  JsonRpcProgressNotification,
+  JsonRpcStateChangeNotification,
+)
+
+# Methods with a dedicated wrapper; any other method decodes as JsonRpcNotification.
+NOTIFICATION_TYPES: dict[str, type[McpUtilsBaseModel]] = {
+  "notifications/progress": JsonRpcProgressNotification,
+  "notifications/cancelled": JsonRpcCancellationNotification,
+  "notifications/error": JsonRpcErrorNotification,
+  "notifications/state_change": JsonRpcStateChangeNotification,
+}
+
+AnyJsonRpcNotification = (
+  JsonRpcProgressNotification
+  | JsonRpcCancellationNotification
+  | JsonRpcErrorNotification
+  | JsonRpcStateChangeNotification
+  | JsonRpcNotification
+)
+
+# Dispatch on the ``method`` literal happens inside pydantic-core, straight from the raw JSON.
+_KNOWN_ADAPTER: TypeAdapter[AnyJsonRpcNotification] = TypeAdapter(
+  Annotated[
+    JsonRpcProgressNotification
+    | JsonRpcCancellationNotification
+    | JsonRpcErrorNotification
+    | JsonRpcStateChangeNotification,
+    Field(discriminator="method"),
+  ],
+  config=ConfigDict(defer_build=True),
+)
+
+
+def _is_unknown_method(exc: ValidationError) -> bool:
+  errors = exc.errors()
+  return len(errors) == 1 and errors[0]["type"] == "union_tag_invalid"
+
+
+def decode_notification(data: str | bytes | bytearray) -> AnyJsonRpcNotification:
+  """Decode a raw JSON-RPC notification frame into its wrapper class.
+
+  Dispatches on ``method`` and validates straight from the raw JSON in one
+  pass, with no intermediate dict and no trial-and-error across classes.
+  Unknown methods decode as a generic JsonRpcNotification. Raises
+  pydantic.ValidationError if the frame is malformed.
+  """
+  try:
+    return _KNOWN_ADAPTER.validate_json(data)
+  except ValidationError as exc:
+    if not _is_unknown_method(exc):
+      raise
+  return JsonRpcNotification.model_validate_json(data)
+
+
+def decode_notification_python(data: dict[str, Any]) -> AnyJsonRpcNotification:
+  """Decode an already parsed JSON-RPC notification into its wrapper class."""
+  try:
+    return _KNOWN_ADAPTER.validate_python(data)
+  except ValidationError as exc:
+    if not _is_unknown_method(exc):
+      raise
+  return JsonRpcNotification.model_validate(data)
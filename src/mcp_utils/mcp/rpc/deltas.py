@@ -0,0 +1,188 @@
+"""Opt-in delta encoding for high-frequency progress notification streams."""
+
+from typing import Any
+
+from pydantic_core import to_json
+
+from mcp_utils.base.primitives import ProgressToken
+from mcp_utils.base.timestamps import format_epoch_ms, timestamp_to_epoch_ms
+from mcp_utils.core.progress_metrics import ProgressNotification
+from mcp_utils.mcp.rpc.decoders import AnyJsonRpcNotification, decode_notification
+from mcp_utils.mcp.rpc.encoders import encode_progress_notification
+from mcp_utils.mcp.rpc.wrappers import JsonRpcNotification, JsonRpcProgressNotification
+
+PROGRESS_DELTA_METHOD = "notifications/progress_delta"
+
+_DELTA_ENVELOPE = b'{"jsonrpc":"2.0","method":"' + PROGRESS_DELTA_METHOD.encode() + b'","params":'
+_PROGRESS_KEYS = ("current", "total", "unit", "percentage")
+_DERIVED_KEYS = ("percentage", "timestamp")
+
+
+def _flatten(params: ProgressNotification) -> dict[str, Any]:
+  """Wire-form fields of a progress notification, with the metrics inlined."""
+  progress = params.progress
+  return {
+    "operationId": params.operation_id,
+    "progressToken": params.progress_token,
+    "stage": params.stage,
+    "current": progress.current,
+    "total": progress.total,
+    "unit": progress.unit,
+    "percentage": progress.percentage,
+    "message": params.message,
+    "metadata": params.metadata,
+    "timestamp": params.timestamp,
+  }
+
+
+def _derived_percentage(fields: dict[str, Any]) -> float:
+  current: int = fields["current"]
+  total: int = fields["total"]
+  return (current / total) * 100
+
+
+def _nest(fields: dict[str, Any]) -> dict[str, Any]:
+  params = {key: value for key, value in fields.items() if key not in _PROGRESS_KEYS}
+  params["progress"] = {key: fields[key] for key in _PROGRESS_KEYS}
+  return params
+
+
+class _EncoderState:
+  __slots__ = ("fields", "id", "since_keyframe", "announced")
+
+  def __init__(self, fields: dict[str, Any], stream_id: int) -> None:
+    self.fields = fields
+    self.id = stream_id
+    self.since_keyframe = 1
+    self.announced = False
+
+
+class ProgressDeltaEncoder:
+  """Encode progress notifications as a full frame followed by deltas.
+
+  The first notification for a progress token is a normal
+  ``notifications/progress`` frame. Later ones are
+  ``notifications/progress_delta`` frames whose params hold only what
+  changed, with the metrics fields inlined (``current``, ``percentage``,
+  ...):
+
+  - ``id``: a small integer standing for the progress token on this stream;
+    the first delta after each full frame also carries ``progressToken``
+    to bind it
+  - ``dt``: milliseconds since the previous timestamp, used instead of
+    ``timestamp`` when the receiver can rebuild the exact string from it
+  - ``percentage`` is left out when ``current`` or ``total`` changed and
+    it equals current/total * 100 exactly, since the receiver derives it
+
+  A full frame is repeated every ``keyframe_interval`` notifications so a
+  receiver that joins late can resynchronize. Both ends must opt in;
+  decode with ProgressDeltaDecoder.
+  """
+
+  def __init__(self, keyframe_interval: int | None = 100) -> None:
+    if keyframe_interval is not None and keyframe_interval < 1:
+      raise ValueError("keyframe_interval must be at least 1")
+    self.keyframe_interval = keyframe_interval
+    self._states: dict[ProgressToken, _EncoderState] = {}
+    self._next_id = 0
+
+  def encode(self, notification: JsonRpcProgressNotification | ProgressNotification) -> bytes:
+    """Encode one notification as a full or delta frame."""
+    params = (
+      notification.params if isinstance(notification, JsonRpcProgressNotification) else notification
+    )
+    fields = _flatten(params)
+    state = self._states.get(params.progress_token)
+    if state is None:
+      state = self._states[params.progress_token] = _EncoderState(fields, self._next_id)
+      self._next_id += 1
+      return encode_progress_notification(notification)
+    if state.since_keyframe == self.keyframe_interval:
+      state.fields, state.since_keyframe, state.announced = fields, 1, False
+      return encode_progress_notification(notification)
+
+    last = state.fields
+    delta: dict[str, Any] = {"id": state.id}
+    if not state.announced:
+      delta["progressToken"] = params.progress_token
+      state.announced = True
+    for key, value in fields.items():
+      if key not in _DERIVED_KEYS and last[key] != value:
+        delta[key] = value
+    percentage = fields["percentage"]
+    if ("current" in delta or "total" in delta) and fields["total"]:
+      if percentage != _derived_percentage(fields):
+        delta["percentage"] = percentage
+    elif percentage != last["percentage"]:
+      delta["percentage"] = percentage
+    timestamp = fields["timestamp"]
+    if timestamp != last["timestamp"]:
+      millis = timestamp_to_epoch_ms(timestamp)
+      if format_epoch_ms(millis) == timestamp:
+        delta["dt"] = millis - timestamp_to_epoch_ms(last["timestamp"])
+      else:
+        delta["timestamp"] = timestamp
+    state.fields = fields
+    state.since_keyframe += 1
+    return _DELTA_ENVELOPE + to_json(delta) + b"}"
+
+  def forget(self, progress_token: ProgressToken) -> None:
+    """Drop the state for a finished progress token."""
+    self._states.pop(progress_token, None)
+
+
+class ProgressDeltaDecoder:
+  """Rebuild full progress notifications from a stream encoded by ProgressDeltaEncoder.
+
+  Full frames are remembered per progress token and each delta is applied
+  on top of the last state, yielding a complete, validated
+  JsonRpcProgressNotification. Other notifications pass through unchanged.
+  """
+
+  def __init__(self) -> None:
+    self._fields: dict[ProgressToken, dict[str, Any]] = {}
+    self._tokens: dict[int, ProgressToken] = {}
+
+  def decode(self, data: str | bytes | bytearray) -> AnyJsonRpcNotification:
+    """Decode a raw frame, expanding progress deltas into full notifications."""
+    return self.apply(decode_notification(data))
+
+  def apply(self, notification: AnyJsonRpcNotification) -> AnyJsonRpcNotification:
+    """Track or expand an already decoded notification.
+
+    Raises ValueError for a delta that cannot be matched to an earlier full
+    frame, and pydantic.ValidationError if the rebuilt notification is
+    invalid.
+    """
+    if isinstance(notification, JsonRpcProgressNotification):
+      self._fields[notification.params.progress_token] = _flatten(notification.params)
+      return notification
+    if (
+      type(notification) is not JsonRpcNotification or notification.method != PROGRESS_DELTA_METHOD
+    ):
+      return notification
+
+    delta = dict(notification.params or {})
+    stream_id = delta.pop("id", None)
+    if "progressToken" in delta:
+      self._tokens[stream_id] = delta["progressToken"]
+    token = self._tokens.get(stream_id)
+    last = None if token is None else self._fields.get(token)
+    if last is None:
+      raise ValueError(f"progress delta for stream id {stream_id!r} arrived before a full frame")
+    if "dt" in delta:
+      delta["timestamp"] = format_epoch_ms(
+        timestamp_to_epoch_ms(last["timestamp"]) + delta.pop("dt")
+      )
+    fields = {**last, **delta}
+    if ("current" in delta or "total" in delta) and "percentage" not in delta and fields["total"]:
+      fields["percentage"] = _derived_percentage(fields)
+    rebuilt = JsonRpcProgressNotification.model_validate({"params": _nest(fields)})
+    self._fields[rebuilt.params.progress_token] = _flatten(rebuilt.params)
+    return rebuilt
+
+  def forget(self, progress_token: ProgressToken) -> None:
+    """Drop the state for a finished progress token."""
+    self._fields.pop(progress_token, None)
+    for stream_id in [key for key, token in self._tokens.items() if token == progress_token]:
+      del self._tokens[stream_id]
@@ -0,0 +1,131 @@
+"""Specialized JSON encoders for high-rate JSON-RPC notifications."""
+
+from functools import lru_cache
+from json.encoder import encode_basestring
+from typing import Any
+
+from pydantic_core import to_json
+
+from mcp_utils.base.primitives import OperationId, ProgressToken, Timestamp
+from mcp_utils.core.progress_metrics import ProgressNotification
+from mcp_utils.mcp.rpc.wrappers import JsonRpcProgressNotification
+
+_PROGRESS_ENVELOPE = '{"jsonrpc":"2.0","method":"notifications/progress","params":{'
+
+
+@lru_cache(maxsize=1024)
+def _progress_head(operation_id: str, progress_token: str) -> str:
+  return (
+    f'{_PROGRESS_ENVELOPE}"operationId":{encode_basestring(operation_id)},'
+    f'"progressToken":{encode_basestring(progress_token)},"stage":'
+  )
+
+
+def _float(value: float) -> str:
+  text = repr(float(value))
+  # Exponent forms ("1e-07") and non-finite values ("inf", "nan") are spelled
+  # differently by pydantic; defer to pydantic-core for those rare cases.
+  if "e" in text or "n" in text:
+    return to_json(value, inf_nan_mode="null").decode()
+  return text
+
+
+def _progress_frame(
+  head: str,
+  stage: str,
+  current: int,
+  total: int | None,
+  unit: str,
+  percentage: float,
+  message: str | None,
+  metadata: dict[str, Any] | None,
+  timestamp: str,
+) -> str:
+  return (
+    f'{head}{encode_basestring(stage)},"progress":{{"current":{current},'
+    f'"total":{"null" if total is None else total},"unit":{encode_basestring(unit)},'
+    f'"percentage":{_float(percentage)}}},'
+    f'"message":{"null" if message is None else encode_basestring(message)},'
+    f'"metadata":{"null" if metadata is None else to_json(metadata).decode()},'
+    f'"timestamp":{encode_basestring(timestamp)}}}}}'
+  )
+
+
+def encode_progress_notification(
+  notification: JsonRpcProgressNotification | ProgressNotification,
+) -> bytes:
+  """Encode a progress notification as a JSON-RPC frame.
+
+  The output is byte-for-byte identical to ``model_dump_json()`` on the
+  JSON-RPC wrapper, but only the variable fields are serialized; the
+  envelope and key names are fixed text.
+  """
+  params = (
+    notification.params if isinstance(notification, JsonRpcProgressNotification) else notification
+  )
+  progress = params.progress
+  return _progress_frame(
+    _progress_head(params.operation_id, params.progress_token),
+    params.stage,
+    progress.current,
+    progress.total,
+    progress.unit,
+    progress.percentage,
+    params.message,
+    params.metadata,
+    params.timestamp,
+  ).encode()
+
+
+class ProgressFrameEncoder:
+  """Encoder for the progress frames of one operation, without building models.
+
+  The envelope, key names, operation ID and progress token are rendered once;
+  each call writes only the per-tick fields. Values are written as given and
+  not validated, so this is for data the caller produced itself. Output
+  matches ``model_dump_json()`` of the equivalent JsonRpcProgressNotification.
+  """
+
+  __slots__ = ("operation_id", "progress_token", "_head")
+
+  def __init__(self, operation_id: OperationId, progress_token: ProgressToken) -> None:
+    self.operation_id = operation_id
+    self.progress_token = progress_token
+    self._head = _progress_head(operation_id, progress_token)
+
+  def encode(
+    self,
+    stage: str,
+    current: int,
+    percentage: float,
+    timestamp: Timestamp,
+    *,
+    total: int | None = None,
+    unit: str = "items",
+    message: str | None = None,
+    metadata: dict[str, Any] | None = None,
+  ) -> bytes:
+    """Encode one progress frame."""
+    return _progress_frame(
+      self._head, stage, current, total, unit, percentage, message, metadata, timestamp
+    ).encode()
+
+  def encode_into(
+    self,
+    buffer: bytearray,
+    stage: str,
+    current: int,
+    percentage: float,
+    timestamp: Timestamp,
+    *,
+    total: int | None = None,
+    unit: str = "items",
+    message: str | None = None,
+    metadata: dict[str, Any] | None = None,
+  ) -> int:
+    """Append one progress frame to ``buffer`` and return the number of bytes written."""
+    frame = _progress_frame(
+      self._head, stage, current, total, unit, percentage, message, metadata, timestamp
+    ).encode()
+    buffer += frame
+    return len(frame)
@@ -0,0 +1,84 @@
+"""Lazily validated JSON-RPC notifications for routing and forwarding."""
+
+from typing import Self
+
+from pydantic_core import SchemaValidator, core_schema
+
+from mcp_utils.mcp.rpc.decoders import AnyJsonRpcNotification, decode_notification
+
+# Only the routing keys are materialized; the rest of ``params`` is skipped by the parser.
+_ENVELOPE_VALIDATOR = SchemaValidator(
+  core_schema.typed_dict_schema(
+    {
+      "jsonrpc": core_schema.typed_dict_field(
+        core_schema.with_default_schema(core_schema.literal_schema(["2.0"]), default="2.0")
+      ),
+      "method": core_schema.typed_dict_field(core_schema.str_schema()),
+      "params": core_schema.typed_dict_field(
+        core_schema.with_default_schema(
+          core_schema.nullable_schema(
+            core_schema.typed_dict_schema(
+              {
+                "operationId": core_schema.typed_dict_field(
+                  core_schema.with_default_schema(
+                    core_schema.nullable_schema(core_schema.str_schema()), default=None
+                  )
+                ),
+              },
+              extra_behavior="ignore",
+            )
+          ),
+          default=None,
+        )
+      ),
+    },
+    extra_behavior="ignore",
+  )
+)
+
+
+class LazyNotification:
+  """A JSON-RPC notification whose params are validated only on access.
+
+  Parsing reads just the envelope and the routing keys (``method`` and
+  ``params.operationId``). The full ``JsonRpc*Notification`` is decoded from
+  the raw frame the first time ``notification`` is read, then cached, so
+  messages that are only routed, forwarded or dropped skip most of the
+  validation cost. Validation errors in ``params`` surface on that first
+  access, as pydantic.ValidationError.
+  """
+
+  __slots__ = ("raw", "method", "operation_id", "_notification")
+
+  def __init__(self, raw: bytes, method: str, operation_id: str | None) -> None:
+    self.raw = raw
+    self.method = method
+    self.operation_id = operation_id
+    self._notification: AnyJsonRpcNotification | None = None
+
+  @classmethod
+  def from_json(cls, data: str | bytes | bytearray | memoryview) -> Self:
+    """Parse the envelope of a raw frame, deferring validation of its params.
+
+    The frame is copied to ``bytes`` if needed, so callers may reuse their
+    read buffer. Raises pydantic.ValidationError if the envelope is malformed.
+    """
+    raw = data.encode() if isinstance(data, str) else bytes(data)
+    envelope = _ENVELOPE_VALIDATOR.validate_json(raw)
+    params = envelope["params"]
+    return cls(raw, envelope["method"], None if params is None else params["operationId"])
+
+  @property
+  def is_decoded(self) -> bool:
+    """Whether the full notification has been validated yet."""
+    return self._notification is not None
+
+  @property
+  def notification(self) -> AnyJsonRpcNotification:
+    """The fully validated notification, decoded on first access."""
+    if self._notification is None:
+      self._notification = decode_notification(self.raw)
+    return self._notification
+
+  def __repr__(self) -> str:
+    return f"LazyNotification(method={self.method!r}, operation_id={self.operation_id!r})"
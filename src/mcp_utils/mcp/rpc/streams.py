@@ -0,0 +1,260 @@
+"""Streaming frame readers for newline-delimited and Content-Length framed JSON-RPC."""
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Literal, Protocol
+
+from mcp_utils.mcp.rpc.decoders import AnyJsonRpcNotification, decode_notification
+from mcp_utils.mcp.rpc.lazy import LazyNotification
+
+Framing = Literal["auto", "ndjson", "content-length"]
+
+_WHITESPACE = b" \t\r\n"
+_HEADER_END = b"\r\n\r\n"
+_JSON_START = frozenset(b"{[")
+
+
+class BinaryReader(Protocol):
+  """A blocking byte stream, such as ``sys.stdin.buffer`` or an open file."""
+
+  def readinto(self, buffer: memoryview, /) -> int | None: ...
+
+
+class AsyncByteReader(Protocol):
+  """An asyncio byte stream, such as ``asyncio.StreamReader``."""
+
+  async def read(self, n: int = -1, /) -> bytes: ...
+
+
+class FrameBuffer:
+  """Sans-IO frame splitter over a reusable read buffer.
+
+  Bytes are read into ``writable()`` (or copied in with ``feed()``) and
+  complete frames are sliced out by ``frames()`` as memoryviews, without
+  copying. A yielded frame is only valid until the next read into the
+  buffer; copy it (``bytes(frame)``) to keep it. Unconsumed bytes are moved
+  to the front of the buffer before each read, and the buffer only grows to
+  fit the largest single frame, so memory use does not depend on stream
+  length.
+
+  ``framing`` selects newline-delimited JSON, ``Content-Length`` headers
+  (as in LSP-style stdio transports), or ``"auto"`` to detect per frame:
+  a frame starting with ``{`` or ``[`` is a line, anything else is a header
+  block. Raises ValueError for malformed headers or frames larger than
+  ``max_frame_size``.
+  """
+
+  __slots__ = (
+    "framing",
+    "chunk_size",
+    "max_frame_size",
+    "_buffer",
+    "_view",
+    "_start",
+    "_end",
+    "_scanned",
+  )
+
+  def __init__(
+    self,
+    framing: Framing = "auto",
+    *,
+    chunk_size: int = 1 << 16,
+    max_frame_size: int = 1 << 26,
+  ) -> None:
+    if chunk_size < 1:
+      raise ValueError("chunk_size must be at least 1")
+    self.framing = framing
+    self.chunk_size = chunk_size
+    self.max_frame_size = max_frame_size
+    self._buffer = bytearray(chunk_size)
+    self._view = memoryview(self._buffer)
+    self._start = 0
+    self._end = 0
+    self._scanned = 0  # bytes of the pending frame already searched for its delimiter
+
+  @property
+  def capacity(self) -> int:
+    """Current size of the underlying buffer in bytes."""
+    return len(self._buffer)
+
+  @property
+  def pending(self) -> int:
+    """Number of buffered bytes not yet returned as frames."""
+    return self._end - self._start
+
+  def writable(self, size: int | None = None) -> memoryview:
+    """Return the free buffer space, making room for at least ``size`` bytes.
+
+    By default at least a quarter of ``chunk_size`` is made free, so the
+    buffer grows only when a partial frame fills most of it.
+    """
+    self._reserve(max(1, self.chunk_size // 4) if size is None else size)
+    return self._view[self._end :]
+
+  def commit(self, count: int) -> None:
+    """Mark ``count`` bytes written into ``writable()`` as received."""
+    self._end += count
+
+  def feed(self, data: bytes) -> None:
+    """Copy ``data`` into the buffer."""
+    size = len(data)
+    self.writable(size)[:size] = data
+    self._end += size
+
+  def frames(self) -> Iterator[memoryview]:
+    """Yield every complete frame currently buffered."""
+    while (frame := self._next_frame()) is not None:
+      yield frame
+
+  def finish(self) -> None:
+    """Check for a truncated frame at end of stream; raises ValueError if found."""
+    if self._view[self._start : self._end].tobytes().strip(_WHITESPACE):
+      raise ValueError(f"stream ended inside a frame ({self.pending} bytes pending)")
+
+  def _next_frame(self) -> memoryview | None:
+    buffer, start, end = self._buffer, self._start, self._end
+    while start < end and buffer[start] in _WHITESPACE:
+      start += 1
+    self._start = start
+    if start == end:
+      return None
+    if self.framing == "ndjson" or (self.framing == "auto" and buffer[start] in _JSON_START):
+      return self._next_line(start, end)
+    return self._next_body(start, end)
+
+  def _next_line(self, start: int, end: int) -> memoryview | None:
+    newline = self._buffer.find(b"\n", start + self._scanned, end)
+    if newline < 0:
+      self._check_size(end - start)
+      self._scanned = end - start
+      return None
+    self._start, self._scanned = newline + 1, 0
+    stop = newline - 1 if self._buffer[newline - 1] == 0x0D else newline  # drop a trailing \r
+    return self._view[start:stop]
+
+  def _next_body(self, start: int, end: int) -> memoryview | None:
+    header_end = self._buffer.find(_HEADER_END, start + self._scanned, end)
+    if header_end < 0:
+      self._check_size(end - start)
+      # Resume just early enough to catch a delimiter split across reads.
+      self._scanned = max(end - start - len(_HEADER_END) + 1, 0)
+      return None
+    length = _content_length(self._view[start:header_end].tobytes())
+    self._check_size(length)
+    body = header_end + len(_HEADER_END)
+    if end - body < length:
+      self._scanned = header_end - start
+      return None
+    self._start, self._scanned = body + length, 0
+    return self._view[body : body + length]
+
+  def _check_size(self, size: int) -> None:
+    if size > self.max_frame_size:
+      raise ValueError(f"frame of {size} bytes exceeds max_frame_size ({self.max_frame_size})")
+
+  def _reserve(self, size: int) -> None:
+    """Make room for ``size`` more bytes after the pending data."""
+    start, end = self._start, self._end
+    if len(self._buffer) - end >= size:
+      return
+    pending = end - start
+    if len(self._buffer) >= pending + size:
+      self._view[:pending] = self._view[start:end]
+    else:
+      # Replace rather than resize: a bytearray with exported views cannot be resized.
+      buffer = bytearray(max(pending + size, 2 * len(self._buffer)))
+      buffer[:pending] = self._view[start:end]
+      self._buffer = buffer
+      self._view = memoryview(buffer)
+    self._start, self._end = 0, pending
+
+
+def _content_length(headers: bytes) -> int:
+  for line in headers.split(b"\r\n"):
+    name, _, value = line.partition(b":")
+    if name.strip().lower() == b"content-length":
+      try:
+        length = int(value)
+      except ValueError:
+        raise ValueError(f"invalid Content-Length header: {line!r}") from None
+      if length < 0:
+        raise ValueError(f"invalid Content-Length header: {line!r}")
+      return length
+  raise ValueError(f"frame headers have no Content-Length: {headers!r}")
+
+
+def iter_frames(
+  stream: BinaryReader,
+  framing: Framing = "auto",
+  *,
+  chunk_size: int = 1 << 16,
+  max_frame_size: int = 1 << 26,
+) -> Iterator[memoryview]:
+  """Yield raw frames from a blocking byte stream.
+
+  Each frame is a memoryview into a reusable buffer and is only valid until
+  the next frame is requested. See FrameBuffer for the framing options.
+  """
+  frames = FrameBuffer(framing, chunk_size=chunk_size, max_frame_size=max_frame_size)
+  while count := stream.readinto(frames.writable()):
+    frames.commit(count)
+    yield from frames.frames()
+  frames.finish()
+
+
+async def aiter_frames(
+  stream: AsyncByteReader,
+  framing: Framing = "auto",
+  *,
+  chunk_size: int = 1 << 16,
+  max_frame_size: int = 1 << 26,
+) -> AsyncIterator[memoryview]:
+  """Async variant of iter_frames for asyncio streams."""
+  frames = FrameBuffer(framing, chunk_size=chunk_size, max_frame_size=max_frame_size)
+  while data := await stream.read(chunk_size):
+    frames.feed(data)
+    for frame in frames.frames():
+      yield frame
+  frames.finish()
+
+
+def iter_notifications(
+  stream: BinaryReader,
+  framing: Framing = "auto",
+  *,
+  chunk_size: int = 1 << 16,
+  max_frame_size: int = 1 << 26,
+) -> Iterator[AnyJsonRpcNotification]:
+  """Yield decoded notifications from a blocking byte stream.
+
+  Raises pydantic.ValidationError for a frame that is not a valid
+  notification.
+  """
+  for frame in iter_frames(stream, framing, chunk_size=chunk_size, max_frame_size=max_frame_size):
+    yield decode_notification(frame.tobytes())
+
+
+async def aiter_notifications(
+  stream: AsyncByteReader,
+  framing: Framing = "auto",
+  *,
+  chunk_size: int = 1 << 16,
+  max_frame_size: int = 1 << 26,
+) -> AsyncIterator[AnyJsonRpcNotification]:
+  """Async variant of iter_notifications for asyncio streams."""
+  async for frame in aiter_frames(
+    stream, framing, chunk_size=chunk_size, max_frame_size=max_frame_size
+  ):
+    yield decode_notification(frame.tobytes())
+
+
+def iter_lazy_notifications(
+  stream: BinaryReader,
+  framing: Framing = "auto",
+  *,
+  chunk_size: int = 1 << 16,
+  max_frame_size: int = 1 << 26,
+) -> Iterator[LazyNotification]:
+  """Yield notifications whose params are validated only on access (see LazyNotification)."""
+  for frame in iter_frames(stream, framing, chunk_size=chunk_size, max_frame_size=max_frame_size):
+    yield LazyNotification.from_json(frame)
@@ -5,6 +5,7 @@ from typing import Any, Literal
 from pydantic import Field
 
 from mcp_utils._base_model import McpUtilsBaseModel
+from mcp_utils.base.primitives import InternedStr
 from mcp_utils.core.progress_metrics import ProgressNotification
 from mcp_utils.mcp.notifications import (
   CancellationNotification,
@@ -17,7 +18,7 @@ class JsonRpcNotification(McpUtilsBaseModel):
   """Base JSON-RPC 2.0 notification (no id, no response expected)."""
 
   jsonrpc: Literal["2.0"] = "2.0"
-  method: str
+  method: InternedStr
   params: dict[str, Any] | None = None
 
 
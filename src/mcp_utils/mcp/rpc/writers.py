@@ -0,0 +1,211 @@
+"""Buffered notification writers that coalesce frames into fewer writes."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Literal, Protocol, Self
+
+from mcp_utils.mcp.rpc.decoders import AnyJsonRpcNotification
+from mcp_utils.mcp.rpc.encoders import encode_progress_notification
+from mcp_utils.mcp.rpc.wrappers import JsonRpcProgressNotification
+
+WriteFraming = Literal["ndjson", "content-length"]
+
+# Notifications the peer must see promptly; writing one flushes the buffer.
+URGENT_METHODS = frozenset({"notifications/error", "notifications/cancelled"})
+
+
+class BinaryWriter(Protocol):
+  """A blocking byte sink, such as ``sys.stdout.buffer``."""
+
+  def write(self, data: bytes, /) -> object: ...
+
+  def flush(self) -> object: ...
+
+
+class AsyncByteWriter(Protocol):
+  """An asyncio byte sink, such as ``asyncio.StreamWriter``."""
+
+  def write(self, data: bytes, /) -> object: ...
+
+  async def drain(self) -> None: ...
+
+
+class _FrameBatch:
+  """Encoding, framing and flush-threshold bookkeeping shared by both writers."""
+
+  __slots__ = ("framing", "max_buffer_size", "max_delay", "buffer", "first_buffered_at")
+
+  def __init__(self, framing: WriteFraming, max_buffer_size: int, max_delay: float) -> None:
+    if framing not in ("ndjson", "content-length"):
+      raise ValueError(f"framing must be 'ndjson' or 'content-length', not {framing!r}")
+    if max_buffer_size < 0:
+      raise ValueError("max_buffer_size must not be negative")
+    if max_delay < 0:
+      raise ValueError("max_delay must not be negative")
+    self.framing = framing
+    self.max_buffer_size = max_buffer_size
+    self.max_delay = max_delay
+    self.buffer = bytearray()
+    self.first_buffered_at: float | None = None
+
+  def add(self, message: AnyJsonRpcNotification | bytes, urgent: bool | None, now: float) -> bool:
+    """Buffer one frame; return True if the buffer should be flushed now."""
+    if isinstance(message, bytes):
+      frame = message
+      urgent = bool(urgent)
+    else:
+      if isinstance(message, JsonRpcProgressNotification):
+        frame = encode_progress_notification(message)
+      else:
+        frame = message.model_dump_json().encode()
+      if urgent is None:
+        urgent = message.method in URGENT_METHODS
+    if self.framing == "ndjson":
+      self.buffer += frame
+      self.buffer += b"\n"
+    else:
+      self.buffer += b"Content-Length: %d\r\n\r\n" % len(frame)
+      self.buffer += frame
+    if self.first_buffered_at is None:
+      self.first_buffered_at = now
+    return urgent or len(self.buffer) >= self.max_buffer_size or self.is_due(now)
+
+  def is_due(self, now: float) -> bool:
+    return self.first_buffered_at is not None and now - self.first_buffered_at >= self.max_delay
+
+  def take(self) -> bytes:
+    data = bytes(self.buffer)
+    self.buffer.clear()
+    self.first_buffered_at = None
+    return data
+
+
+class NotificationWriter:
+  """Coalescing writer for JSON-RPC notifications on a blocking byte stream.
+
+  Frames are appended to an in-memory buffer and written with one ``write``
+  and ``flush`` when the buffer reaches ``max_buffer_size`` bytes, when the
+  oldest buffered frame is ``max_delay`` seconds old, or when an urgent
+  notification (error or cancellation, see URGENT_METHODS) is written. The
+  age check runs on each write; call ``flush_if_due()`` from an idle loop to
+  honor ``max_delay`` when no further writes arrive. Progress notifications
+  are encoded with encode_progress_notification; pre-encoded frames can be
+  written as ``bytes``.
+  """
+
+  def __init__(
+    self,
+    stream: BinaryWriter,
+    framing: WriteFraming = "ndjson",
+    *,
+    max_buffer_size: int = 1 << 16,
+    max_delay: float = 0.05,
+    clock: Callable[[], float] = time.monotonic,
+  ) -> None:
+    self._stream = stream
+    self._batch = _FrameBatch(framing, max_buffer_size, max_delay)
+    self._clock = clock
+
+  @property
+  def buffered(self) -> int:
+    """Number of bytes waiting to be written."""
+    return len(self._batch.buffer)
+
+  def write(self, message: AnyJsonRpcNotification | bytes, *, urgent: bool | None = None) -> None:
+    """Buffer a notification (or pre-encoded frame), flushing if a threshold is reached.
+
+    ``urgent`` overrides the method-based priority; raw frames are not urgent
+    unless marked so.
+    """
+    if self._batch.add(message, urgent, self._clock()):
+      self.flush()
+
+  def flush_if_due(self) -> bool:
+    """Flush if the oldest buffered frame has waited ``max_delay``; return whether it did."""
+    if not self._batch.is_due(self._clock()):
+      return False
+    self.flush()
+    return True
+
+  def flush(self) -> None:
+    """Write out all buffered frames."""
+    if self._batch.buffer:
+      self._stream.write(self._batch.take())
+    self._stream.flush()
+
+  def close(self) -> None:
+    """Flush remaining frames. The underlying stream is left open."""
+    self.flush()
+
+  def __enter__(self) -> Self:
+    return self
+
+  def __exit__(self, *exc_info: object) -> None:
+    self.close()
+
+
+class AsyncNotificationWriter:
+  """asyncio variant of NotificationWriter with backpressure.
+
+  Uses the same flush thresholds. A flush awaits ``drain()``, so when the
+  peer reads slowly ``write`` blocks once the buffer is full instead of
+  letting memory grow. ``max_delay`` is enforced with a loop timer, so idle
+  buffers are flushed without further writes.
+  """
+
+  def __init__(
+    self,
+    stream: AsyncByteWriter,
+    framing: WriteFraming = "ndjson",
+    *,
+    max_buffer_size: int = 1 << 16,
+    max_delay: float = 0.05,
+  ) -> None:
+    self._stream = stream
+    self._batch = _FrameBatch(framing, max_buffer_size, max_delay)
+    self._timer: asyncio.TimerHandle | None = None
+    self._timed_flush: asyncio.Task[None] | None = None
+
+  @property
+  def buffered(self) -> int:
+    """Number of bytes waiting to be written."""
+    return len(self._batch.buffer)
+
+  async def write(
+    self,
+    message: AnyJsonRpcNotification | bytes,
+    *,
+    urgent: bool | None = None,
+  ) -> None:
+    """Buffer a notification (or pre-encoded frame), flushing if a threshold is reached."""
+    loop = asyncio.get_running_loop()
+    if self._batch.add(message, urgent, loop.time()):
+      await self.flush()
+    elif self._timer is None:
+      self._timer = loop.call_later(self._batch.max_delay, self._flush_later)
+
+  async def flush(self) -> None:
+    """Write out all buffered frames and wait for the stream to drain."""
+    if self._timer is not None:
+      self._timer.cancel()
+      self._timer = None
+    if self._batch.buffer:
+      self._stream.write(self._batch.take())
+    await self._stream.drain()
+
+  async def aclose(self) -> None:
+    """Flush remaining frames. The underlying stream is left open."""
+    await self.flush()
+    if self._timed_flush is not None:
+      await self._timed_flush
+
+  def _flush_later(self) -> None:
+    self._timer = None
+    self._timed_flush = asyncio.ensure_future(self.flush())
+
+  async def __aenter__(self) -> Self:
+    return self
+
+  async def __aexit__(self, *exc_info: object) -> None:
+    await self.aclose()
@@ -1,10 +1,13 @@
 """Tests for base primitive types."""
 
 import pytest
-from pydantic import TypeAdapter, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from mcp_utils.base.primitives import (
+  TIMESTAMP_PATTERN,
   UUID,
+  EpochTimestamp,
+  InternedStr,
   OperationId,
   ProgressToken,
   Timestamp,
@@ -109,3 +112,54 @@ class TestProgressToken:
   def test_invalid(self, value):
     with pytest.raises(ValidationError):
       self.ta.validate_python(value)
+
+
+class TestEpochTimestamp:
+  ta = TypeAdapter(EpochTimestamp)
+
+  def test_from_wire_string(self):
+    assert self.ta.validate_python("2025-01-15T10:30:00.250Z") == 1736937000250
+
+  def test_from_offset_string(self):
+    assert self.ta.validate_python("2025-01-15T11:30:00+01:00") == 1736937000000
+
+  def test_from_int(self):
+    assert self.ta.validate_python(1736937000250) == 1736937000250
+
+  def test_from_json(self):
+    assert self.ta.validate_json('"2025-01-15T10:30:00Z"') == 1736937000000
+
+  @pytest.mark.parametrize("value", ["2025-01-15", "2025-01-15T10:30:00", "1736937000", 1.5])
+  def test_invalid(self, value):
+    with pytest.raises(ValidationError):
+      self.ta.validate_python(value)
+
+  def test_serializes_to_wire_string(self):
+    assert self.ta.dump_python(1736937000250) == "2025-01-15T10:30:00.250Z"
+    assert self.ta.dump_json(1736937000000) == b'"2025-01-15T10:30:00Z"'
+
+  def test_json_schema_matches_timestamp(self):
+    assert self.ta.json_schema() == {"type": "string", "pattern": TIMESTAMP_PATTERN}
+
+  def test_in_model(self):
+    class Deadline(BaseModel):
+      start: EpochTimestamp
+      end: EpochTimestamp
+
+    d = Deadline.model_validate({"start": "2025-01-15T10:30:00Z", "end": "2025-01-15T10:31:00Z"})
+    assert d.end - d.start == 60_000
+    assert d.start < d.end
+    assert d.model_dump() == {"start": "2025-01-15T10:30:00Z", "end": "2025-01-15T10:31:00Z"}
+
+
+class TestInternedStr:
+  ta = TypeAdapter(InternedStr)
+
+  def test_returns_shared_object(self):
+    first = self.ta.validate_python("".join(["run", "ning"]))
+    second = self.ta.validate_json('"running"')
+    assert first == "running"
+    assert first is second
+
+  def test_json_schema_is_plain_string(self):
+    assert self.ta.json_schema() == {"type": "string"}
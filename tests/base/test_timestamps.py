@@ -0,0 +1,100 @@
+"""Tests for timestamp parsing."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from mcp_utils.base.timestamps import (
+  format_epoch_ms,
+  parse_timestamp,
+  timestamp_to_epoch_ms,
+  timestamps_to_epoch_ms,
+)
+
+
+class TestParseTimestamp:
+  def test_utc(self):
+    dt = parse_timestamp("2025-01-15T10:30:00Z")
+    assert dt == datetime(2025, 1, 15, 10, 30, tzinfo=UTC)
+    assert dt.utcoffset() == timedelta(0)
+
+  def test_offset(self):
+    dt = parse_timestamp("2025-01-15T10:30:00-02:15")
+    assert dt.tzinfo == timezone(-timedelta(hours=2, minutes=15))
+
+  def test_millis(self):
+    assert parse_timestamp("2025-01-15T10:30:00.123Z").microsecond == 123000
+
+  def test_memoized(self):
+    assert parse_timestamp("2025-03-01T00:00:00Z") is parse_timestamp("2025-03-01T00:00:00Z")
+    assert parse_timestamp.cache_info().maxsize == 4096
+
+  @pytest.mark.parametrize("ts", ["not a timestamp", "2025-13-15T10:30:00Z"])
+  def test_invalid(self, ts):
+    with pytest.raises(ValueError):
+      parse_timestamp(ts)
+
+
+class TestTimestampToEpochMs:
+  @pytest.mark.parametrize(
+    ("ts", "expected"),
+    [
+      ("1970-01-01T00:00:00Z", 0),
+      ("1970-01-01T00:00:01.250Z", 1250),
+      ("1969-12-31T23:59:59.999Z", -1),
+      ("2025-01-15T10:30:00Z", 1736937000000),
+      ("2025-01-15T16:00:00.5+05:30", 1736937000500),
+      ("2025-01-15T02:30:00-08:00", 1736937000000),
+    ],
+  )
+  def test_values(self, ts, expected):
+    assert timestamp_to_epoch_ms(ts) == expected
+
+  def test_invalid(self):
+    with pytest.raises(ValueError):
+      timestamp_to_epoch_ms("2025-02-30T10:30:00Z")
+
+  def test_missing_offset(self):
+    with pytest.raises(ValueError, match="UTC offset"):
+      timestamp_to_epoch_ms("2025-01-15T10:30:00")
+
+
+class TestTimestampsToEpochMs:
+  def test_bulk_matches_single(self):
+    stamps = [
+      "2025-01-15T10:30:00Z",
+      "2025-01-15T10:30:01.500Z",
+      "2025-01-16T00:00:00+01:00",
+      "2025-01-15T10:30:00Z",
+    ]
+    assert timestamps_to_epoch_ms(stamps) == [timestamp_to_epoch_ms(ts) for ts in stamps]
+
+  def test_accepts_iterables(self):
+    result = timestamps_to_epoch_ms(f"2025-01-15T10:30:{s:02d}Z" for s in range(3))
+    assert [b - a for a, b in zip(result, result[1:], strict=False)] == [1000, 1000]
+
+  def test_empty(self):
+    assert timestamps_to_epoch_ms([]) == []
+
+  def test_invalid_entry_raises(self):
+    with pytest.raises(ValueError):
+      timestamps_to_epoch_ms(["2025-01-15T10:30:00Z", "bad"])
+
+
+class TestFormatEpochMs:
+  @pytest.mark.parametrize(
+    ("ms", "expected"),
+    [
+      (0, "1970-01-01T00:00:00Z"),
+      (1250, "1970-01-01T00:00:01.250Z"),
+      (-1, "1969-12-31T23:59:59.999Z"),
+      (1736937000000, "2025-01-15T10:30:00Z"),
+      (1736937000007, "2025-01-15T10:30:00.007Z"),
+    ],
+  )
+  def test_values(self, ms, expected):
+    assert format_epoch_ms(ms) == expected
+
+  @pytest.mark.parametrize("ts", ["2025-01-15T10:30:00Z", "2025-01-15T10:30:00.123Z"])
+  def test_round_trip(self, ts):
+    assert format_epoch_ms(timestamp_to_epoch_ms(ts)) == ts
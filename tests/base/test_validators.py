@@ -0,0 +1,101 @@
+"""Tests for precompiled primitive validators."""
+
+import pytest
+from pydantic import TypeAdapter
+
+from mcp_utils.base.primitives import OPERATION_ID_PATTERN, OperationId
+from mcp_utils.base.validators import (
+  PatternValidator,
+  all_operation_ids,
+  all_progress_tokens,
+  all_timestamps,
+  all_uuids,
+  find_invalid_operation_ids,
+  find_invalid_progress_tokens,
+  find_invalid_timestamps,
+  find_invalid_uuids,
+  is_operation_id,
+  is_progress_token,
+  is_timestamp,
+  is_uuid,
+)
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174001"
+UUID = "123e4567-e89b-12d3-a456-426614174000"
+TS = "2025-01-15T10:30:00.000Z"
+
+
+class TestSingleValidators:
+  @pytest.mark.parametrize(
+    ("check", "valid", "invalid"),
+    [
+      (is_uuid, UUID, UUID.upper()),
+      (is_timestamp, TS, "2025-01-15T10:30:00"),
+      (is_operation_id, OP_ID, PT_ID),
+      (is_progress_token, PT_ID, OP_ID),
+    ],
+  )
+  def test_valid_and_invalid(self, check, valid, invalid):
+    assert check(valid) is True
+    assert check(invalid) is False
+
+  @pytest.mark.parametrize("value", [OP_ID + "\n", OP_ID.encode(), None, 42, ""])
+  def test_rejects_non_matching(self, value):
+    assert is_operation_id(value) is False
+
+  @pytest.mark.parametrize("value", [OP_ID, OP_ID + "\n", "op-", "OP-" + OP_ID[3:]])
+  def test_agrees_with_pydantic(self, value):
+    ta = TypeAdapter(OperationId)
+    try:
+      ta.validate_python(value)
+      expected = True
+    except ValueError:
+      expected = False
+    assert is_operation_id(value) is expected
+
+
+class TestBulkValidators:
+  @pytest.mark.parametrize(
+    ("check_all", "find_invalid", "valid"),
+    [
+      (all_uuids, find_invalid_uuids, UUID),
+      (all_timestamps, find_invalid_timestamps, TS),
+      (all_operation_ids, find_invalid_operation_ids, OP_ID),
+      (all_progress_tokens, find_invalid_progress_tokens, PT_ID),
+    ],
+  )
+  def test_all_valid(self, check_all, find_invalid, valid):
+    values = [valid] * 100
+    assert check_all(values) is True
+    assert find_invalid(values) == []
+
+  def test_find_invalid_indices(self):
+    values = [OP_ID] * 10
+    values[2] = "nope"
+    values[5] = OP_ID + "\n"
+    values[7] = None  # type: ignore[call-overload]
+    assert find_invalid_operation_ids(values) == [2, 5, 7]
+    assert all_operation_ids(values) is False
+
+  def test_embedded_newline_is_not_split(self):
+    assert find_invalid_operation_ids([f"{OP_ID}\n{OP_ID}", OP_ID]) == [0]
+
+  def test_empty(self):
+    assert all_operation_ids([]) is True
+    assert find_invalid_operation_ids([]) == []
+
+  def test_accepts_tuples_and_iterables(self):
+    assert all_operation_ids((OP_ID, OP_ID)) is True
+    assert find_invalid_operation_ids(v for v in [OP_ID, "x"]) == [1]
+
+
+class TestPatternValidator:
+  def test_custom_pattern(self):
+    validator = PatternValidator(r"^[a-z]+$")
+    assert validator.pattern == r"^[a-z]+$"
+    assert validator.is_valid("abc") is True
+    assert validator.find_invalid(["abc", "ABC"]) == [1]
+
+  def test_pattern_attribute(self):
+    assert PatternValidator(OPERATION_ID_PATTERN).pattern == OPERATION_ID_PATTERN
@@ -0,0 +1,27 @@
+"""Fixtures shared by the operation supervision tests."""
+
+import pytest
+
+from tests.helpers import FakeClock
+
+
+@pytest.fixture
+def clock():
+  return FakeClock(100.0)
+
+
+@pytest.fixture
+def cancellations():
+  """(state, token) pairs received by ``on_cancel``."""
+  return []
+
+
+@pytest.fixture
+def on_cancel(cancellations):
+  return lambda state, token: cancellations.append((state, token))
+
+
+@pytest.fixture
+def sent():
+  """Notifications received by a sink."""
+  return []
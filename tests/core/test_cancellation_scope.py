@@ -0,0 +1,231 @@
+"""Tests for the live CancellationScope."""
+
+import asyncio
+import threading
+
+import pytest
+
+from mcp_utils._utils.factories import create_active_cancellation_token, generate_operation_id
+from mcp_utils._utils.transitions import create_operation, transition_operation
+from mcp_utils.core.cancellation_scope import CancellationScope, cancel_operation
+from mcp_utils.core.cancellation_token import CancellationReason, CancellationSource
+from mcp_utils.core.operation_state import LifecycleStatus
+from mcp_utils.mcp.notifications import CancellationNotification
+
+TIMEOUT = (CancellationReason.TIMEOUT, CancellationSource.SERVER)
+USER = (CancellationReason.USER_REQUESTED, CancellationSource.CLIENT)
+
+
+class TestCancel:
+  def test_initial_state(self):
+    scope = CancellationScope()
+    assert scope.cancelled is False
+    assert scope.token is create_active_cancellation_token()
+    assert scope.notification is None
+
+  def test_cancel_sets_flag_and_token(self):
+    scope = CancellationScope()
+    assert scope.cancel(*TIMEOUT) is True
+    assert scope.cancelled is True
+    assert scope.token.is_cancellation_requested is True
+    assert scope.token.reason == CancellationReason.TIMEOUT
+    assert scope.token.source == CancellationSource.SERVER
+    assert scope.token.timestamp is not None
+
+  def test_first_cancel_wins(self):
+    scope = CancellationScope()
+    scope.cancel(*TIMEOUT)
+    token = scope.token
+    assert scope.cancel(*USER) is False
+    assert scope.token is token
+
+  def test_notification(self):
+    operation_id = generate_operation_id()
+    scope = CancellationScope(operation_id)
+    scope.cancel(*USER)
+    notification = scope.notification
+    assert isinstance(notification, CancellationNotification)
+    assert notification.operation_id == operation_id
+    assert notification.cancellation_token is scope.token
+    assert scope.notification is notification
+
+  def test_anonymous_scope_has_no_notification(self):
+    scope = CancellationScope()
+    scope.cancel(*USER)
+    assert scope.notification is None
+
+  def test_cancel_from_another_thread(self):
+    scope = CancellationScope()
+    thread = threading.Thread(target=scope.cancel, args=TIMEOUT)
+    thread.start()
+    thread.join()
+    assert scope.cancelled is True
+
+
+class TestCallbacks:
+  def test_callback_runs_once_on_cancel(self):
+    scope = CancellationScope()
+    seen = []
+    scope.add_callback(seen.append)
+    scope.cancel(*TIMEOUT)
+    scope.cancel(*TIMEOUT)
+    assert seen == [scope]
+
+  def test_callback_added_after_cancel_runs_immediately(self):
+    scope = CancellationScope()
+    scope.cancel(*TIMEOUT)
+    seen = []
+    remove = scope.add_callback(seen.append)
+    assert seen == [scope]
+    remove()
+
+  def test_removed_callback_does_not_run(self):
+    scope = CancellationScope()
+    seen = []
+    remove = scope.add_callback(seen.append)
+    remove()
+    remove()
+    scope.cancel(*TIMEOUT)
+    assert seen == []
+
+  def test_failing_callbacks_do_not_stop_the_others(self):
+    scope = CancellationScope()
+    child = scope.child()
+    seen = []
+
+    def fail(_):
+      raise RuntimeError("boom")
+
+    scope.add_callback(fail)
+    scope.add_callback(seen.append)
+    with pytest.raises(ExceptionGroup) as excinfo:
+      scope.cancel(*TIMEOUT)
+    assert [type(error) for error in excinfo.value.exceptions] == [RuntimeError]
+    assert seen == [scope]
+    assert scope.cancelled and child.cancelled
+
+
+class TestLinking:
+  def test_parent_cancels_descendants(self):
+    root = CancellationScope()
+    child = root.child()
+    grandchild = child.child()
+    root.cancel(*USER)
+    assert child.cancelled and grandchild.cancelled
+    assert grandchild.token is root.token
+
+  def test_child_does_not_cancel_parent(self):
+    root = CancellationScope()
+    child = root.child()
+    child.cancel(*TIMEOUT)
+    assert child.cancelled
+    assert not root.cancelled
+
+  def test_child_of_cancelled_parent_starts_cancelled(self):
+    root = CancellationScope()
+    root.cancel(*USER)
+    child = root.child(generate_operation_id())
+    assert child.cancelled
+    assert child.token is root.token
+
+  def test_linked_to_any_parent(self):
+    request, shutdown = CancellationScope(), CancellationScope()
+    linked = CancellationScope(parents=(request, shutdown))
+    shutdown.cancel(*TIMEOUT)
+    assert linked.cancelled
+    assert not request.cancelled
+
+  def test_linked_to_already_cancelled_parent(self):
+    request, shutdown = CancellationScope(), CancellationScope()
+    shutdown.cancel(*TIMEOUT)
+    linked = CancellationScope(parents=(request, shutdown))
+    assert linked.cancelled
+    assert linked.token is shutdown.token
+
+  def test_shared_descendant_fires_once(self):
+    root = CancellationScope()
+    left, right = root.child(), root.child()
+    joined = CancellationScope(parents=(left, right))
+    seen = []
+    joined.add_callback(seen.append)
+    root.cancel(*USER)
+    assert seen == [joined]
+
+  def test_closed_child_is_detached(self):
+    root = CancellationScope()
+    with root.child() as child:
+      seen = []
+      child.add_callback(seen.append)
+    root.cancel(*USER)
+    assert not child.cancelled
+    assert seen == []
+
+
+class TestWait:
+  def test_wait_returns_when_cancelled(self):
+    async def main():
+      scope = CancellationScope()
+      waiter = asyncio.create_task(scope.wait())
+      await asyncio.sleep(0)
+      assert not waiter.done()
+      scope.cancel(*USER)
+      await asyncio.wait_for(waiter, 1)
+      await scope.wait()
+
+    asyncio.run(main())
+
+  def test_wait_woken_from_another_thread(self):
+    async def main():
+      scope = CancellationScope()
+      loop = asyncio.get_running_loop()
+      loop.call_later(0.01, threading.Thread(target=scope.cancel, args=TIMEOUT).start)
+      await asyncio.wait_for(scope.wait(), 1)
+
+    asyncio.run(main())
+
+  def test_cancelled_wait_unregisters(self):
+    async def main():
+      scope = CancellationScope()
+      waiter = asyncio.create_task(scope.wait())
+      await asyncio.sleep(0)
+      waiter.cancel()
+      with pytest.raises(asyncio.CancelledError):
+        await waiter
+      assert scope._callbacks == {}
+
+    asyncio.run(main())
+
+  def test_waiter_cancelled_after_wakeup_was_scheduled(self):
+    async def main():
+      scope = CancellationScope()
+      waiter = asyncio.create_task(scope.wait())
+      await asyncio.sleep(0)
+      scope.cancel(*USER)
+      waiter.cancel()
+      with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    asyncio.run(main())
+
+
+class TestCancelOperation:
+  def running(self):
+    return transition_operation(create_operation("export"), LifecycleStatus.RUNNING)
+
+  def test_running_state_is_cancelled(self):
+    state, token = cancel_operation(self.running(), *TIMEOUT)
+    assert state.status == LifecycleStatus.CANCELLED
+    assert state.partial_results == {}
+    assert token.reason == CancellationReason.TIMEOUT
+
+  def test_fires_scope_and_uses_its_token(self):
+    scope = CancellationScope()
+    state, token = cancel_operation(self.running(), *TIMEOUT, scope=scope)
+    assert scope.cancelled
+    assert token is scope.token
+
+  def test_state_that_cannot_be_cancelled_is_returned_unchanged(self):
+    created = create_operation("export")
+    state, token = cancel_operation(created, *USER)
+    assert state is created
+    assert token.is_cancellation_requested
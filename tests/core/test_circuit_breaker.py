@@ -0,0 +1,265 @@
+"""Tests for the per-tool CircuitBreaker."""
+
+import pytest
+
+from mcp_utils._utils.factories import generate_timestamp
+from mcp_utils._utils.transitions import transition_operation
+from mcp_utils.core.cancellation_scope import CancellationScope
+from mcp_utils.core.cancellation_token import CancellationReason, CancellationSource
+from mcp_utils.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from mcp_utils.core.error_response import ErrorResponse
+from mcp_utils.core.operation_state import LifecycleStatus
+from tests.helpers import running
+
+
+def error(code):
+  return ErrorResponse(code=code, message="backend failed", timestamp=generate_timestamp())
+
+
+def start(breaker, tool_name="slow_query", scope=None):
+  state = breaker.create_operation(tool_name, scope=scope)
+  state = transition_operation(state, LifecycleStatus.RUNNING)
+  breaker.track(state)
+  return state
+
+
+def fail(breaker, state, code=1001):
+  breaker.track(transition_operation(state, LifecycleStatus.FAILED, error=error(code)))
+
+
+def complete(breaker, state):
+  breaker.track(transition_operation(state, LifecycleStatus.COMPLETED, result={"rows": 1}))
+
+
+class TestTripping:
+  def test_opens_after_threshold_and_cancels_in_flight(self, clock, cancellations, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    scope = CancellationScope()
+    bystander = start(breaker, scope=scope)
+    other_tool = start(breaker, "export")
+    for _ in range(3):
+      assert breaker.state("slow_query") == CircuitState.CLOSED
+      fail(breaker, start(breaker))
+    assert breaker.state("slow_query") == CircuitState.OPEN
+    assert breaker.state("export") == CircuitState.CLOSED
+    [(state, token)] = cancellations
+    assert state.operation_id == bystander.operation_id
+    assert state.status == LifecycleStatus.CANCELLED
+    assert token is scope.token
+    assert token.reason == CancellationReason.ERROR_THRESHOLD
+    assert token.source == CancellationSource.SERVER
+    assert bystander.operation_id not in breaker
+    assert other_tool.operation_id in breaker and len(breaker) == 1
+
+  def test_successes_slide_failures_out_of_the_window(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    for _ in range(4):
+      fail(breaker, start(breaker))
+      for _ in range(2):
+        complete(breaker, start(breaker))
+      assert breaker.failures("slow_query") <= 2
+    assert breaker.state("slow_query") == CircuitState.CLOSED
+
+  def test_cancelled_operations_are_not_outcomes(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    state = start(breaker)
+    breaker.track(transition_operation(state, LifecycleStatus.CANCELLED, partial_results={}))
+    assert state.operation_id not in breaker
+    assert breaker.failures("slow_query") == 0
+
+  def test_record_failure_returns_cancelled_states(self):
+    breaker = CircuitBreaker(failure_threshold=1, window=1)
+    state = start(breaker)
+    [cancelled] = breaker.record_failure("slow_query")
+    assert cancelled.operation_id == state.operation_id
+    assert breaker.record_failure("slow_query") == []
+
+  def test_record_success_for_unknown_tool(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    breaker.record_success("unknown")
+    assert breaker.state("unknown") == CircuitState.CLOSED
+    assert breaker.failures("unknown") == 0
+
+  def test_paused_operation_cannot_be_cancelled_but_is_released(
+    self, clock, cancellations, on_cancel
+  ):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=1, window=5, reset_timeout=10.0, clock=clock
+    )
+    paused = transition_operation(start(breaker), LifecycleStatus.PAUSED)
+    breaker.track(paused)
+    breaker.record_failure("slow_query")
+    [(state, token)] = cancellations
+    assert state is paused and token.is_cancellation_requested
+    assert len(breaker) == 0
+
+
+class TestCodeRanges:
+  def test_ranges_are_counted_separately(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, by_code_range=True, clock=clock
+    )
+    for code in (1001, 3001, 1002, 3002):
+      fail(breaker, start(breaker), code)
+    assert breaker.failures("slow_query", 1500) == 2
+    assert breaker.failures("slow_query", 3999) == 2
+    assert breaker.failures("slow_query", 2000) == 0
+    assert breaker.state("slow_query") == CircuitState.CLOSED
+    fail(breaker, start(breaker), 3003)
+    assert breaker.state("slow_query") == CircuitState.OPEN
+
+  def test_without_code_ranges_all_failures_add_up(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    for code in (1001, 3001, 5001):
+      fail(breaker, start(breaker), code)
+    assert breaker.state("slow_query") == CircuitState.OPEN
+    assert breaker.failures("slow_query", 3001) == 3
+
+
+class TestRecovery:
+  def trip(self, breaker):
+    for _ in range(3):
+      breaker.record_failure("slow_query")
+
+  def test_rejects_while_open(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    self.trip(breaker)
+    clock.now += 4.0
+    with pytest.raises(CircuitOpenError) as excinfo:
+      breaker.create_operation("slow_query")
+    rejection = excinfo.value
+    assert rejection.tool_name == "slow_query"
+    assert rejection.retry_after == pytest.approx(6.0)
+    assert rejection.error.code == 6002
+    assert rejection.error.context.operation == "slow_query"
+    assert rejection.error.suggestion == "Retry in 6.0s"
+    assert str(rejection) == rejection.error.message
+    assert breaker.create_operation("export").tool_name == "export"
+
+  def test_probe_success_closes(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    self.trip(breaker)
+    clock.now += 10.0
+    probe = start(breaker)
+    assert breaker.state("slow_query") == CircuitState.HALF_OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+      breaker.create_operation("slow_query")
+    assert excinfo.value.retry_after == 0.0
+    complete(breaker, probe)
+    assert breaker.state("slow_query") == CircuitState.CLOSED
+    assert breaker.failures("slow_query") == 0
+    start(breaker)
+
+  def test_probe_failure_reopens(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    self.trip(breaker)
+    clock.now += 10.0
+    fail(breaker, start(breaker))
+    assert breaker.state("slow_query") == CircuitState.OPEN
+    clock.now += 9.0
+    with pytest.raises(CircuitOpenError):
+      breaker.create_operation("slow_query")
+    clock.now += 1.0
+    start(breaker)
+
+  def test_forgotten_probe_lets_another_probe_through(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    self.trip(breaker)
+    clock.now += 10.0
+    probe = start(breaker)
+    breaker.forget(probe.operation_id)
+    breaker.forget(probe.operation_id)
+    second = start(breaker)
+    breaker.track(transition_operation(second, LifecycleStatus.CANCELLED, partial_results={}))
+    start(breaker)
+    assert breaker.state("slow_query") == CircuitState.HALF_OPEN
+
+  def test_failures_while_open_do_not_extend_it(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    self.trip(breaker)
+    clock.now += 9.0
+    assert breaker.record_failure("slow_query") == []
+    clock.now += 1.0
+    start(breaker)
+
+  def test_reset(self, clock, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=3, window=5, reset_timeout=10.0, clock=clock
+    )
+    breaker.reset("slow_query")
+    self.trip(breaker)
+    breaker.reset("slow_query")
+    assert breaker.state("slow_query") == CircuitState.CLOSED
+    assert breaker.failures("slow_query") == 0
+    start(breaker)
+
+
+class TestTracking:
+  def test_track_keeps_scope(self, clock, cancellations, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=1, window=5, reset_timeout=10.0, clock=clock
+    )
+    scope = CancellationScope()
+    state = start(breaker, scope=scope)
+    breaker.track(transition_operation(state, LifecycleStatus.PAUSED))
+    breaker.track(state)
+    breaker.record_failure("slow_query")
+    assert scope.cancelled
+    assert cancellations[0][1] is scope.token
+
+  def test_tracks_operations_not_created_through_it(self, clock, cancellations, on_cancel):
+    breaker = CircuitBreaker(
+      on_cancel, failure_threshold=1, window=5, reset_timeout=10.0, clock=clock
+    )
+    state = running()
+    breaker.track(state)
+    assert state.operation_id in breaker
+    breaker.record_failure("slow_query")
+    assert cancellations[0][0].operation_id == state.operation_id
+
+  def test_on_cancel_may_track_the_cancelled_states(self):
+    cancelled = []
+
+    def on_cancel(state, token):
+      breaker.track(state)
+      cancelled.append(state)
+
+    breaker = CircuitBreaker(on_cancel, failure_threshold=1, window=1)
+    for _ in range(3):
+      start(breaker)
+    breaker.record_failure("slow_query")
+    assert len(cancelled) == 3 and len(breaker) == 0
+    assert breaker.failures("slow_query") == 1
+
+  @pytest.mark.parametrize(
+    "kwargs",
+    [
+      {"failure_threshold": 0},
+      {"failure_threshold": 6, "window": 5},
+      {"reset_timeout": 0},
+      {"error_code": 5001},
+    ],
+  )
+  def test_invalid_arguments(self, kwargs):
+    with pytest.raises(ValueError):
+      CircuitBreaker(**kwargs)
@@ -0,0 +1,189 @@
+"""Tests for the timer-wheel DeadlineManager."""
+
+import asyncio
+import random
+
+import pytest
+
+from mcp_utils._utils.transitions import transition_operation
+from mcp_utils.core.cancellation_scope import CancellationScope
+from mcp_utils.core.cancellation_token import CancellationReason, CancellationSource
+from mcp_utils.core.deadlines import DeadlineManager
+from mcp_utils.core.operation_state import LifecycleStatus
+from tests.helpers import running
+
+
+class TestArming:
+  def test_fires_after_deadline(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    state = running()
+    manager.arm(state, 1.0)
+    assert state.operation_id in manager and len(manager) == 1
+    clock.now += 0.99
+    assert manager.advance() == 0
+    clock.now += 0.02
+    assert manager.advance() == 1
+    assert len(manager) == 0
+    [(cancelled, token)] = cancellations
+    assert cancelled.operation_id == state.operation_id
+    assert cancelled.status == LifecycleStatus.CANCELLED
+    assert cancelled.partial_results == {}
+    assert token.reason == CancellationReason.TIMEOUT
+    assert token.source == CancellationSource.SERVER
+
+  def test_rearm_replaces_deadline(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    state = running()
+    manager.arm(state, 1.0)
+    manager.arm(state, 3.0)
+    assert manager.remaining(state.operation_id) == pytest.approx(3.0)
+    clock.now += 2.0
+    manager.advance()
+    assert cancellations == []
+    clock.now += 1.01
+    manager.advance()
+    assert len(cancellations) == 1
+
+  def test_disarm(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    state = running()
+    manager.arm(state, 1.0)
+    assert manager.disarm(state.operation_id) is True
+    assert manager.disarm(state.operation_id) is False
+    assert manager.remaining(state.operation_id) is None
+    clock.now += 2.0
+    assert manager.advance() == 0
+    assert cancellations == []
+
+  def test_past_deadline_fires_on_next_tick(self, clock, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    manager.arm(running(), -5.0)
+    clock.now += 0.015
+    assert manager.advance() == 1
+
+  def test_update_keeps_latest_state(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    state = running()
+    manager.arm(state, 1.0)
+    paused = transition_operation(state, LifecycleStatus.PAUSED)
+    assert manager.update(paused) is True
+    assert manager.update(running()) is False
+    clock.now += 1.01
+    manager.advance()
+    [(passed_on, token)] = cancellations
+    assert passed_on is paused  # PAUSED cannot move to CANCELLED
+    assert token.is_cancellation_requested
+
+  def test_keeps_partial_results(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    state = running().model_copy(update={"partial_results": {"rows": 10}})
+    manager.arm(state, 0.5)
+    clock.now += 0.51
+    manager.advance()
+    assert cancellations[0][0].partial_results == {"rows": 10}
+
+  @pytest.mark.parametrize(
+    "kwargs",
+    [{"resolution": 0}, {"wheel_size": 1}, {"levels": 0}],
+  )
+  def test_invalid_arguments(self, kwargs):
+    with pytest.raises(ValueError):
+      DeadlineManager(lambda state, token: None, **kwargs)
+
+
+class TestScopes:
+  def test_cancels_scope(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    scope = CancellationScope()
+    child = scope.child()
+    manager.arm(running(), 0.5, scope=scope)
+    clock.now += 0.51
+    manager.advance()
+    assert scope.cancelled and child.cancelled
+    assert cancellations[0][1] is scope.token
+
+  def test_already_cancelled_scope_keeps_its_token(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    scope = CancellationScope()
+    scope.cancel(CancellationReason.USER_REQUESTED, CancellationSource.CLIENT)
+    manager.arm(running(), 0.5, scope=scope)
+    clock.now += 0.51
+    manager.advance()
+    assert cancellations[0][1].reason == CancellationReason.USER_REQUESTED
+
+
+class TestWheel:
+  def test_many_deadlines_across_levels_never_fire_early(self, clock, cancellations, on_cancel):
+    manager = DeadlineManager(on_cancel, wheel_size=4, levels=3, clock=clock)
+    rng = random.Random(7)
+    deadlines = {}
+    for _ in range(300):
+      state = running()
+      timeout = rng.uniform(0, 5)
+      manager.arm(state, timeout)
+      deadlines[state.operation_id] = clock.now + timeout
+    start = clock.now
+    fired_at = {}
+    while clock.now < start + 6:
+      clock.now += rng.uniform(0, 0.05)
+      count = len(cancellations)
+      manager.advance()
+      for state, _ in cancellations[count:]:
+        fired_at[state.operation_id] = clock.now
+    assert fired_at.keys() == deadlines.keys()
+    for operation_id, deadline in deadlines.items():
+      assert deadline <= fired_at[operation_id] + 1e-9
+
+  def test_single_level_parks_deadlines_beyond_its_range(self, clock, on_cancel):
+    manager = DeadlineManager(on_cancel, resolution=1.0, wheel_size=4, levels=1, clock=clock)
+    manager.arm(running(), 10.0)
+    for _ in range(9):
+      clock.now += 1.0
+      assert manager.advance() == 0
+    clock.now += 1.0
+    assert manager.advance() == 1
+
+  def test_idle_advance_skips_ahead(self, clock, on_cancel):
+    manager = DeadlineManager(on_cancel, clock=clock)
+    clock.now += 3600
+    manager.advance()
+    state = running()
+    manager.arm(state, 0.05)
+    clock.now += 0.06
+    assert manager.advance() == 1
+
+  def test_callback_may_disarm_or_rearm_timers_in_the_same_slot(self, clock):
+    first, disarmed, rearmed = running(), running(), running()
+    seen = []
+
+    def on_timeout(state, token):
+      seen.append(state.operation_id)
+      manager.disarm(disarmed.operation_id)
+      manager.arm(rearmed, 1.0)
+
+    manager = DeadlineManager(on_timeout, clock=clock)
+    for state in (first, disarmed, rearmed):
+      manager.arm(state, 0.5)
+    clock.now += 0.51
+    assert manager.advance() == 1
+    assert seen == [first.operation_id]
+    assert list(manager._timers) == [rearmed.operation_id]
+
+
+class TestRun:
+  def test_run_advances_until_cancelled(self):
+    async def main():
+      expired = []
+      manager = DeadlineManager(lambda state, token: expired.append(state), resolution=0.005)
+      manager.arm(running(), 0.01)
+      task = asyncio.create_task(manager.run())
+      for _ in range(200):
+        if expired:
+          break
+        await asyncio.sleep(0.005)
+      task.cancel()
+      with pytest.raises(asyncio.CancelledError):
+        await task
+      assert len(expired) == 1
+
+    asyncio.run(main())
@@ -1,5 +1,7 @@
 """Tests for core operation state types."""
 
+import sys
+
 import pytest
 from pydantic import ValidationError
 
@@ -92,6 +94,16 @@ class TestOperationState:
     assert state.status == LifecycleStatus.CREATED
     assert state.end_time is None
 
+  def test_tool_name_is_interned(self):
+    state = OperationState(
+      operation_id="op-123e4567-e89b-12d3-a456-426614174000",
+      tool_name="".join(["test", "_tool"]),
+      status=LifecycleStatus.CREATED,
+      start_time="2025-01-15T10:30:00Z",
+      progress=PROGRESS_ZERO,
+    )
+    assert state.tool_name is sys.intern("test_tool")
+
   def test_completed_requires_end_time(self):
     with pytest.raises(ValidationError):
       OperationState(
@@ -1,5 +1,7 @@
 """Tests for core progress types."""
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -93,3 +95,13 @@ class TestProgressNotification:
     )
     assert pn.message is None
     assert pn.metadata is None
+
+  def test_low_cardinality_strings_are_interned(self):
+    first = ProgressNotification.model_validate_json(
+      json.dumps(VALID_PROGRESS_NOTIFICATION).encode()
+    )
+    second = ProgressNotification.model_validate(
+      json.loads(json.dumps(VALID_PROGRESS_NOTIFICATION))
+    )
+    assert first.stage is second.stage
+    assert first.progress.unit is second.progress.unit
@@ -0,0 +1,120 @@
+"""Tests for the mutable ProgressTracker."""
+
+import pytest
+
+from mcp_utils.core.progress_metrics import ProgressMetrics
+from mcp_utils.core.progress_tracker import ProgressTracker
+from tests.helpers import FakeClock
+
+
+def make_tracker(total=None, **kwargs):
+  clock = FakeClock(100.0)
+  return ProgressTracker(total, clock=clock, **kwargs), clock
+
+
+class TestCounting:
+  def test_advance(self):
+    tracker, _ = make_tracker(10)
+    tracker.advance()
+    tracker.advance(4)
+    assert tracker.current == 5
+    assert tracker.percentage == 50.0
+
+  def test_unknown_total(self):
+    tracker, _ = make_tracker()
+    tracker.advance(7)
+    assert tracker.percentage == 0.0
+    assert tracker.eta is None
+
+  def test_zero_total(self):
+    tracker, _ = make_tracker(0)
+    assert tracker.percentage == 0.0
+
+  def test_total_can_be_set_later(self):
+    tracker, _ = make_tracker(current=3)
+    tracker.total = 12
+    assert tracker.percentage == 25.0
+
+
+class TestSnapshot:
+  def test_returns_validated_metrics(self):
+    tracker, _ = make_tracker(3, unit="files")
+    tracker.advance()
+    snapshot = tracker.snapshot()
+    assert isinstance(snapshot, ProgressMetrics)
+    assert snapshot.current == 1
+    assert snapshot.total == 3
+    assert snapshot.unit == "files"
+    assert snapshot.percentage == pytest.approx(100 / 3)
+
+  def test_snapshot_is_independent_of_later_advances(self):
+    tracker, _ = make_tracker(10)
+    snapshot = tracker.snapshot()
+    tracker.advance(5)
+    assert snapshot.current == 0
+
+  def test_overshoot_reports_current_as_total(self):
+    tracker, _ = make_tracker(10)
+    tracker.advance(11)
+    assert tracker.percentage == 100.0
+    snapshot = tracker.snapshot()
+    assert (snapshot.current, snapshot.total, snapshot.percentage) == (11, 11, 100.0)
+    assert tracker.total == 10
+
+
+class TestThroughput:
+  def test_no_rate_before_first_sample(self):
+    tracker, _ = make_tracker(100)
+    tracker.advance(10)
+    assert tracker.throughput is None
+    assert tracker.eta is None
+
+  def test_first_sample_sets_rate(self):
+    tracker, clock = make_tracker(100)
+    tracker.advance(20)
+    clock.now += 2
+    assert tracker.throughput == 10.0
+    assert tracker.eta == 8.0
+
+  def test_ewma_weights_by_halflife(self):
+    tracker, clock = make_tracker(1000, halflife=1.0)
+    tracker.advance(10)
+    clock.now += 1
+    assert tracker.throughput == 10.0
+    tracker.advance(30)
+    clock.now += 1
+    assert tracker.throughput == 20.0  # half of the way from 10 to 30
+
+  def test_samples_at_most_once_per_interval(self):
+    tracker, clock = make_tracker(100, sample_interval=1.0)
+    tracker.advance(10)
+    clock.now += 0.5
+    assert tracker.throughput is None
+    clock.now += 0.5
+    assert tracker.throughput == 10.0
+
+  def test_zero_interval_without_elapsed_time(self):
+    tracker, _ = make_tracker(100, sample_interval=0)
+    tracker.advance(10)
+    assert tracker.throughput is None
+
+  def test_eta_when_stalled(self):
+    tracker, clock = make_tracker(100)
+    clock.now += 1
+    assert tracker.throughput == 0.0
+    assert tracker.eta is None
+
+  def test_eta_never_negative(self):
+    tracker, clock = make_tracker(10)
+    tracker.advance(20)
+    clock.now += 1
+    assert tracker.eta == 0.0
+
+  def test_elapsed(self):
+    tracker, clock = make_tracker()
+    clock.now += 3
+    assert tracker.elapsed == 3
+
+  def test_rejects_bad_halflife(self):
+    with pytest.raises(ValueError, match="halflife"):
+      ProgressTracker(halflife=0)
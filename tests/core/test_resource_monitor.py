@@ -0,0 +1,265 @@
+"""Tests for the sampling ResourceMonitor."""
+
+import asyncio
+import tracemalloc
+
+import pytest
+
+from mcp_utils._utils.transitions import transition_operation
+from mcp_utils.core import resource_monitor
+from mcp_utils.core.cancellation_scope import CancellationScope
+from mcp_utils.core.cancellation_token import CancellationReason, CancellationSource
+from mcp_utils.core.operation_state import LifecycleStatus
+from mcp_utils.core.resource_monitor import ResourceBudget, ResourceMonitor, current_rss
+from tests.helpers import running
+
+MiB = 1 << 20
+
+
+class FakeRss:
+  def __init__(self):
+    self.value = 100 * MiB
+
+  def __call__(self):
+    return self.value
+
+
+@pytest.fixture
+def rss():
+  return FakeRss()
+
+
+class TestBudgets:
+  def test_overrun(self):
+    budget = ResourceBudget(cpu_seconds=2.0, memory_bytes=100)
+    assert budget.overrun(1.0, 50) == 0.5
+    assert budget.overrun(1.0, 300) == 3.0
+    assert ResourceBudget().overrun(100.0, 1 << 40) == 0.0
+
+  @pytest.mark.parametrize("kwargs", [{"cpu_seconds": 0}, {"memory_bytes": -1}])
+  def test_invalid_budget(self, kwargs):
+    with pytest.raises(ValueError):
+      ResourceBudget(**kwargs)
+
+  def test_cancels_operations_over_budget_worst_first(self, cancellations, on_cancel, rss):
+    monitor = ResourceMonitor(
+      on_cancel,
+      budgets={"export": ResourceBudget(memory_bytes=10 * MiB)},
+      default_budget=ResourceBudget(cpu_seconds=1.0),
+      rss=rss,
+    )
+    within, slightly, far, export = running(), running(), running(), running("export")
+    for state in (within, slightly, far, export):
+      monitor.track(state)
+    monitor.charge(within.operation_id, cpu_seconds=0.5)
+    monitor.charge(slightly.operation_id, cpu_seconds=1.5)
+    monitor.charge(far.operation_id, cpu_seconds=4.0)
+    monitor.charge(export.operation_id, cpu_seconds=30.0, memory_bytes=5 * MiB)
+    assert monitor.budget_for("export").memory_bytes == 10 * MiB
+
+    states = monitor.sample()
+    assert [state.operation_id for state in states] == [far.operation_id, slightly.operation_id]
+    assert all(state.status == LifecycleStatus.CANCELLED for state in states)
+    assert [state for state, _ in cancellations] == states
+    token = cancellations[0][1]
+    assert token.reason == CancellationReason.RESOURCE_LIMIT
+    assert token.source == CancellationSource.SERVER
+    assert len(monitor) == 2 and far.operation_id not in monitor
+
+  def test_no_budget_means_unlimited(self, on_cancel, rss):
+    monitor = ResourceMonitor(on_cancel, rss=rss)
+    state = running()
+    monitor.track(state)
+    monitor.charge(state.operation_id, cpu_seconds=1e6, memory_bytes=1 << 40)
+    assert monitor.sample() == []
+    assert monitor.process_rss == 100 * MiB
+
+
+class TestRssCeiling:
+  def test_sheds_heaviest_until_excess_is_covered(self, on_cancel, rss):
+    monitor = ResourceMonitor(on_cancel, max_rss=100 * MiB, rss=rss)
+    light, medium, heavy = running(), running(), running()
+    for state, memory in ((light, 1), (medium, 20), (heavy, 30)):
+      monitor.track(state)
+      monitor.charge(state.operation_id, memory_bytes=memory * MiB)
+    assert monitor.sample() == []
+    rss.value = 140 * MiB
+    assert [state.operation_id for state in monitor.sample()] == [
+      heavy.operation_id,
+      medium.operation_id,
+    ]
+    assert list(monitor._usage) == [light.operation_id]
+
+  def test_over_budget_operations_count_towards_the_excess(self, on_cancel, rss):
+    monitor = ResourceMonitor(
+      on_cancel, max_rss=100 * MiB, default_budget=ResourceBudget(memory_bytes=10 * MiB), rss=rss
+    )
+    hog, other = running(), running()
+    monitor.track(hog)
+    monitor.track(other)
+    monitor.charge(hog.operation_id, memory_bytes=50 * MiB)
+    monitor.charge(other.operation_id, memory_bytes=5 * MiB)
+    rss.value = 120 * MiB
+    assert [state.operation_id for state in monitor.sample()] == [hog.operation_id]
+
+  def test_without_accounting_sheds_one_per_sample(self, on_cancel, rss):
+    monitor = ResourceMonitor(on_cancel, max_rss=100 * MiB, rss=rss)
+    first, second = running(), running()
+    monitor.track(first)
+    monitor.track(second)
+    monitor.charge(first.operation_id, cpu_seconds=2.0)
+    rss.value = 200 * MiB
+    assert [state.operation_id for state in monitor.sample()] == [first.operation_id]
+    assert [state.operation_id for state in monitor.sample()] == [second.operation_id]
+    assert monitor.sample() == []
+
+
+class TestTracking:
+  def test_track_updates_state_and_keeps_scope(self, cancellations, on_cancel, rss):
+    monitor = ResourceMonitor(on_cancel, default_budget=ResourceBudget(cpu_seconds=1.0), rss=rss)
+    state, scope = running(), CancellationScope()
+    monitor.track(state, scope=scope)
+    paused = transition_operation(state, LifecycleStatus.PAUSED)
+    monitor.track(paused)
+    resumed = transition_operation(paused, LifecycleStatus.RUNNING)
+    monitor.track(resumed, scope=scope)
+    monitor.charge(state.operation_id, cpu_seconds=2.0)
+    [cancelled_state] = monitor.sample()
+    assert cancelled_state.status == LifecycleStatus.CANCELLED
+    assert scope.cancelled
+    assert cancellations[0][1] is scope.token
+
+  def test_terminal_state_and_forget_stop_accounting(self, on_cancel, rss):
+    monitor = ResourceMonitor(on_cancel, rss=rss)
+    done, dropped = running(), running()
+    monitor.track(done)
+    monitor.track(dropped)
+    monitor.track(transition_operation(done, LifecycleStatus.COMPLETED, result={"rows": 1}))
+    monitor.forget(dropped.operation_id)
+    monitor.forget(dropped.operation_id)
+    assert len(monitor) == 0
+    assert monitor.charge(done.operation_id, cpu_seconds=1.0) is False
+    assert monitor.usage(done.operation_id) is None
+
+  def test_charge_accumulates(self, on_cancel, rss):
+    monitor = ResourceMonitor(on_cancel, rss=rss)
+    state = running()
+    monitor.track(state)
+    assert monitor.charge(state.operation_id, cpu_seconds=0.25, memory_bytes=100) is True
+    monitor.charge(state.operation_id, cpu_seconds=0.25, memory_bytes=-40)
+    assert monitor.usage(state.operation_id) == (0.5, 60)
+
+  def test_on_cancel_may_finish_later_victims(self, rss):
+    first, second = running(), running()
+
+    def on_cancel(state, token):
+      monitor.forget(second.operation_id)
+
+    monitor = ResourceMonitor(on_cancel, default_budget=ResourceBudget(cpu_seconds=1.0), rss=rss)
+    for state, cpu in ((first, 3.0), (second, 2.0)):
+      monitor.track(state)
+      monitor.charge(state.operation_id, cpu_seconds=cpu)
+    assert [state.operation_id for state in monitor.sample()] == [first.operation_id]
+
+
+class TestMeasure:
+  def test_charges_cpu_time_of_block(self):
+    ticks = iter([1.0, 1.75])
+    monitor = ResourceMonitor(lambda state, token: None, cpu_clock=lambda: next(ticks))
+    state = running()
+    monitor.track(state)
+    with monitor.measure(state.operation_id):
+      pass
+    assert monitor.usage(state.operation_id) == (0.75, 0)
+
+  def test_charges_even_when_block_raises(self):
+    monitor = ResourceMonitor(lambda state, token: None)
+    state = running()
+    monitor.track(state)
+    with pytest.raises(RuntimeError), monitor.measure(state.operation_id):
+      raise RuntimeError
+    assert monitor.usage(state.operation_id)[0] >= 0.0
+
+  def test_traces_allocations(self):
+    with ResourceMonitor(lambda state, token: None, trace_allocations=True) as monitor:
+      assert tracemalloc.is_tracing()
+      state = running()
+      monitor.track(state)
+      with monitor.measure(state.operation_id):
+        kept = bytearray(MiB)
+      assert monitor.usage(state.operation_id)[1] >= MiB
+      del kept
+    assert not tracemalloc.is_tracing()
+
+  def test_close_leaves_tracing_it_did_not_start(self):
+    tracemalloc.start()
+    try:
+      with ResourceMonitor(lambda state, token: None, trace_allocations=True):
+        pass
+      assert tracemalloc.is_tracing()
+    finally:
+      tracemalloc.stop()
+
+  def test_close_is_idempotent(self):
+    monitor = ResourceMonitor(lambda state, token: None, trace_allocations=True)
+    monitor.close()
+    monitor.close()
+    assert not tracemalloc.is_tracing()
+
+  def test_untraced_when_tracing_stopped(self):
+    monitor = ResourceMonitor(lambda state, token: None, trace_allocations=True)
+    tracemalloc.stop()
+    state = running()
+    monitor.track(state)
+    with monitor.measure(state.operation_id):
+      kept = bytearray(MiB)
+    assert monitor.usage(state.operation_id)[1] == 0
+    del kept
+    monitor.close()
+
+
+class TestCurrentRss:
+  def test_reads_proc(self):
+    assert current_rss() > 0
+
+  def test_none_without_proc(self, monkeypatch):
+    monkeypatch.setattr(resource_monitor, "_STATM", "/nonexistent/statm")
+    assert current_rss() is None
+
+  def test_max_rss_needs_current_rss(self):
+    with pytest.raises(ValueError, match="max_rss"):
+      ResourceMonitor(lambda state, token: None, max_rss=MiB, rss=lambda: None)
+
+  def test_budgets_without_current_rss(self):
+    monitor = ResourceMonitor(
+      lambda state, token: None, default_budget=ResourceBudget(cpu_seconds=1.0), rss=lambda: None
+    )
+    state = running()
+    monitor.track(state)
+    monitor.charge(state.operation_id, cpu_seconds=2.0)
+    assert [cancelled.operation_id for cancelled in monitor.sample()] == [state.operation_id]
+    assert monitor.process_rss is None
+
+
+class TestRun:
+  def test_run_samples_until_cancelled(self):
+    async def main():
+      cancelled = []
+      monitor = ResourceMonitor(
+        lambda state, token: cancelled.append(state),
+        default_budget=ResourceBudget(cpu_seconds=1.0),
+      )
+      state = running()
+      monitor.track(state)
+      monitor.charge(state.operation_id, cpu_seconds=2.0)
+      task = asyncio.create_task(monitor.run(0.005))
+      for _ in range(200):
+        if cancelled:
+          break
+        await asyncio.sleep(0.005)
+      task.cancel()
+      with pytest.raises(asyncio.CancelledError):
+        await task
+      assert len(cancelled) == 1
+
+    asyncio.run(main())
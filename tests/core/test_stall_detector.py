@@ -0,0 +1,226 @@
+"""Tests for the StallDetector watchdog."""
+
+import logging
+
+import pytest
+
+from mcp_utils._utils.factories import generate_progress_token, generate_timestamp
+from mcp_utils._utils.transitions import transition_operation
+from mcp_utils.core.cancellation_scope import CancellationScope
+from mcp_utils.core.cancellation_token import CancellationReason, CancellationSource
+from mcp_utils.core.operation_state import LifecycleStatus
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.core.stall_detector import StallAction, StallDetector
+from mcp_utils.mcp.notifications import CancellationNotification, ErrorNotification
+from tests.helpers import running
+
+
+def progress(state, stage="scanning"):
+  return ProgressNotification(
+    operation_id=state.operation_id,
+    progress_token=generate_progress_token(),
+    stage=stage,
+    progress=ProgressMetrics(current=1, percentage=0.0),
+    timestamp=generate_timestamp(),
+  )
+
+
+class TestDetection:
+  def test_reports_operation_without_progress(self, caplog, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    state = running()
+    detector.record_transition(state)
+    clock.now += 9.5
+    assert detector.check() == []
+    clock.now += 1.0
+    with caplog.at_level(logging.WARNING, logger="mcp_utils.core.stall_detector"):
+      assert detector.check() == [state]
+    assert state.operation_id in caplog.text
+    assert "no progress for 10.5s" in caplog.text
+
+  def test_progress_postpones_the_stall(self, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    state = running()
+    detector.record_transition(state)
+    for _ in range(5):
+      clock.now += 8.0
+      assert detector.record_progress(progress(state)) is True
+      assert detector.check() == []
+    clock.now += 11.0
+    assert detector.check() == [state]
+
+  def test_progress_for_unwatched_operation(self, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    assert detector.record_progress(progress(running())) is False
+
+  def test_per_tool_threshold(self, clock, sent):
+    detector = StallDetector(
+      threshold=10.0, tool_thresholds={"bulk_export": 60.0}, sink=sent.append, clock=clock
+    )
+    quick, bulk = running(), running("bulk_export")
+    detector.record_transition(quick)
+    detector.record_transition(bulk)
+    assert detector.threshold_for("bulk_export") == 60.0
+    clock.now += 11.0
+    assert detector.check() == [quick]
+    detector.forget(quick.operation_id)
+    clock.now += 50.0
+    assert detector.check() == [bulk]
+
+  def test_warns_again_after_each_threshold(self, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    state = running()
+    detector.record_transition(state)
+    clock.now += 11.0
+    assert detector.check() == [state]
+    clock.now += 5.0
+    assert detector.check() == []
+    clock.now += 6.0
+    assert detector.check() == [state]
+
+  def test_terminal_transition_forgets(self, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    state = running()
+    detector.record_transition(state)
+    detector.record_transition(
+      transition_operation(state, LifecycleStatus.COMPLETED, result={"rows": 1})
+    )
+    assert state.operation_id not in detector and len(detector) == 0
+    clock.now += 20.0
+    assert detector.check() == []
+
+  def test_paused_operation_is_not_checked(self, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    state = running()
+    detector.record_transition(state)
+    paused = transition_operation(state, LifecycleStatus.PAUSED)
+    detector.record_transition(paused)
+    assert detector.record_progress(progress(paused)) is True
+    clock.now += 100.0
+    assert detector.check() == []
+    resumed = transition_operation(paused, LifecycleStatus.RUNNING)
+    detector.record_transition(resumed)
+    clock.now += 11.0
+    assert detector.check() == [resumed]
+
+  def test_forget(self, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    state, other = running(), running()
+    detector.record_transition(state)
+    detector.record_transition(other)
+    detector.forget(state.operation_id)
+    detector.forget(state.operation_id)
+    clock.now += 20.0
+    assert detector.check() == [other]
+
+  def test_long_idle_gap_only_opens_existing_buckets(self, clock, sent):
+    detector = StallDetector(threshold=10.0, resolution=0.001, sink=sent.append, clock=clock)
+    states = [running() for _ in range(3)]
+    for state in states:
+      detector.record_transition(state)
+      clock.now += 1.0
+    clock.now += 3600.0
+    assert detector.check() == states
+
+  def test_check_twice_in_one_bucket(self, clock, sent):
+    detector = StallDetector(threshold=10.0, sink=sent.append, clock=clock)
+    detector.record_transition(running())
+    assert detector.check() == []
+    assert detector.check() == []
+
+  @pytest.mark.parametrize(
+    "kwargs",
+    [{"threshold": 0}, {"resolution": -1}, {"error_code": 5001}],
+  )
+  def test_invalid_arguments(self, kwargs):
+    with pytest.raises(ValueError):
+      StallDetector(**kwargs)
+
+
+class TestActions:
+  def test_error_notification(self, clock, sent):
+    detector = StallDetector(
+      threshold=10.0, action=StallAction.ERROR, error_code=6010, sink=sent.append, clock=clock
+    )
+    state = running()
+    detector.record_transition(state)
+    detector.record_progress(progress(state, stage="loading"))
+    clock.now += 11.0
+    assert detector.check() == [state]
+    [notification] = sent
+    assert isinstance(notification, ErrorNotification)
+    assert notification.operation_id == state.operation_id
+    assert notification.error.code == 6010
+    assert notification.error.context.operation == "slow_query"
+    assert notification.error.context.stage == "loading"
+    assert state.operation_id in detector
+
+  def test_error_without_sink(self, clock):
+    detector = StallDetector(action=StallAction.ERROR, threshold=1.0, clock=clock)
+    detector.record_transition(running())
+    clock.now += 2.0
+    assert len(detector.check()) == 1
+
+  def test_cancel(self, clock, sent):
+    detector = StallDetector(
+      threshold=10.0, action=StallAction.CANCEL, sink=sent.append, clock=clock
+    )
+    state, scope = running(), CancellationScope()
+    detector.record_transition(state, scope=scope)
+    detector.record_transition(state, scope=CancellationScope())
+    detector.record_transition(state, scope=scope)
+    detector.record_transition(state)  # keeps the scope
+    clock.now += 11.0
+    [cancelled] = detector.check()
+    assert cancelled.status == LifecycleStatus.CANCELLED
+    assert scope.cancelled
+    assert scope.token.reason == CancellationReason.TIMEOUT
+    assert scope.token.source == CancellationSource.SERVER
+    [notification] = sent
+    assert isinstance(notification, CancellationNotification)
+    assert notification.cancellation_token is scope.token
+    assert state.operation_id not in detector
+
+  def test_cancel_without_sink(self, clock):
+    detector = StallDetector(action=StallAction.CANCEL, threshold=1.0, clock=clock)
+    detector.record_transition(running())
+    clock.now += 2.0
+    assert detector.check()[0].status == LifecycleStatus.CANCELLED
+    assert len(detector) == 0
+
+  def test_callbacks_may_record_activity_for_operations_in_the_same_bucket(self, clock, sent):
+    detector = StallDetector(
+      threshold=10.0, action=StallAction.CANCEL, sink=sent.append, clock=clock
+    )
+    first, second, third = running(), running(), running()
+    scope = CancellationScope()
+
+    def on_cancel(_):
+      detector.record_transition(second)
+      detector.forget(third.operation_id)
+
+    scope.add_callback(on_cancel)
+    detector.record_transition(first, scope=scope)
+    detector.record_transition(second)
+    detector.record_transition(third)
+    clock.now += 11.0
+    assert [state.operation_id for state in detector.check()] == [first.operation_id]
+    assert list(detector._watches) == [second.operation_id]
+
+  def test_sink_may_record_progress_for_operations_in_the_same_bucket(self, clock):
+    first, second = running(), running()
+
+    def sink(notification):
+      if notification.operation_id == first.operation_id:
+        assert detector.record_progress(progress(second)) is True
+
+    detector = StallDetector(action=StallAction.CANCEL, threshold=10.0, sink=sink, clock=clock)
+    detector.record_transition(first)
+    detector.record_transition(second)
+    clock.now += 11.0
+    assert [state.operation_id for state in detector.check()] == [first.operation_id]
+    assert second.operation_id in detector
+    clock.now += 9.5
+    assert detector.check() == []
+    clock.now += 1.0
+    assert [state.operation_id for state in detector.check()] == [second.operation_id]
@@ -0,0 +1,19 @@
+"""Shared test helpers."""
+
+from mcp_utils._utils.transitions import create_operation, transition_operation
+from mcp_utils.core.operation_state import LifecycleStatus
+
+
+class FakeClock:
+  """Clock callable whose time only moves when a test sets ``now``."""
+
+  def __init__(self, now=0.0):
+    self.now = now
+
+  def __call__(self):
+    return self.now
+
+
+def running(tool_name="slow_query"):
+  """A new operation of ``tool_name`` in RUNNING status."""
+  return transition_operation(create_operation(tool_name), LifecycleStatus.RUNNING)
@@ -0,0 +1,123 @@
+"""Tests for method-dispatched JSON-RPC notification decoding."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_utils.core.cancellation_token import CancellationToken
+from mcp_utils.core.error_response import ErrorResponse
+from mcp_utils.core.operation_state import LifecycleStatus
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.mcp.notifications import (
+  CancellationNotification,
+  ErrorNotification,
+  StateChangeNotification,
+)
+from mcp_utils.mcp.rpc.decoders import (
+  NOTIFICATION_TYPES,
+  decode_notification,
+  decode_notification_python,
+)
+from mcp_utils.mcp.rpc.wrappers import (
+  JsonRpcCancellationNotification,
+  JsonRpcErrorNotification,
+  JsonRpcNotification,
+  JsonRpcProgressNotification,
+  JsonRpcStateChangeNotification,
+)
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174001"
+TS = "2025-01-15T10:30:00.000Z"
+
+NOTIFICATIONS = [
+  JsonRpcProgressNotification(
+    params=ProgressNotification(
+      operation_id=OP_ID,
+      progress_token=PT_ID,
+      stage="s",
+      progress=ProgressMetrics(current=1, total=2, percentage=50.0),
+      timestamp=TS,
+    )
+  ),
+  JsonRpcCancellationNotification(
+    params=CancellationNotification(
+      operation_id=OP_ID,
+      cancellation_token=CancellationToken(is_cancellation_requested=False),
+      timestamp=TS,
+    )
+  ),
+  JsonRpcErrorNotification(
+    params=ErrorNotification(
+      operation_id=OP_ID,
+      error=ErrorResponse(code=5001, message="boom", timestamp=TS),
+      timestamp=TS,
+    )
+  ),
+  JsonRpcStateChangeNotification(
+    params=StateChangeNotification(
+      operation_id=OP_ID,
+      old_state=LifecycleStatus.CREATED,
+      new_state=LifecycleStatus.RUNNING,
+      timestamp=TS,
+    )
+  ),
+]
+
+
+class TestDecodeNotification:
+  @pytest.mark.parametrize("notification", NOTIFICATIONS, ids=lambda n: n.method)
+  def test_dispatches_on_method(self, notification):
+    decoded = decode_notification(notification.model_dump_json())
+    assert type(decoded) is type(notification)
+    assert decoded == notification
+
+  @pytest.mark.parametrize("notification", NOTIFICATIONS, ids=lambda n: n.method)
+  def test_accepts_bytes_and_bytearray(self, notification):
+    raw = notification.model_dump_json().encode()
+    assert decode_notification(raw) == decode_notification(bytearray(raw)) == notification
+
+  def test_unknown_method_falls_back_to_generic(self):
+    decoded = decode_notification(b'{"jsonrpc":"2.0","method":"custom/event","params":{"a":1}}')
+    assert type(decoded) is JsonRpcNotification
+    assert decoded.method == "custom/event"
+    assert decoded.params == {"a": 1}
+
+  def test_known_method_with_bad_params_does_not_fall_back(self):
+    with pytest.raises(ValidationError, match="operationId"):
+      decode_notification(b'{"jsonrpc":"2.0","method":"notifications/progress","params":{}}')
+
+  def test_missing_method_raises(self):
+    with pytest.raises(ValidationError):
+      decode_notification(b'{"jsonrpc":"2.0"}')
+
+  def test_invalid_unknown_method_frame_raises(self):
+    with pytest.raises(ValidationError):
+      decode_notification(b'{"jsonrpc":"1.0","method":"custom/event"}')
+
+  def test_malformed_json_raises(self):
+    with pytest.raises(ValidationError):
+      decode_notification(b'{"jsonrpc":')
+
+
+class TestDecodeNotificationPython:
+  @pytest.mark.parametrize("notification", NOTIFICATIONS, ids=lambda n: n.method)
+  def test_dispatches_on_method(self, notification):
+    decoded = decode_notification_python(json.loads(notification.model_dump_json()))
+    assert type(decoded) is type(notification)
+
+  def test_unknown_method_falls_back_to_generic(self):
+    decoded = decode_notification_python({"jsonrpc": "2.0", "method": "custom/event"})
+    assert type(decoded) is JsonRpcNotification
+
+  def test_known_method_with_bad_params_raises(self):
+    with pytest.raises(ValidationError):
+      decode_notification_python({"method": "notifications/error", "params": {}})
+
+
+class TestNotificationTypes:
+  def test_maps_every_dedicated_wrapper(self):
+    assert {cls.model_fields["method"].default: cls for cls in NOTIFICATION_TYPES.values()} == (
+      NOTIFICATION_TYPES
+    )
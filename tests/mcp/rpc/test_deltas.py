@@ -0,0 +1,170 @@
+"""Tests for delta-encoded progress notification streams."""
+
+import json
+
+import pytest
+
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.mcp.rpc.deltas import (
+  PROGRESS_DELTA_METHOD,
+  ProgressDeltaDecoder,
+  ProgressDeltaEncoder,
+)
+from mcp_utils.mcp.rpc.encoders import encode_progress_notification
+from mcp_utils.mcp.rpc.wrappers import JsonRpcNotification, JsonRpcProgressNotification
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_A = "pt-123e4567-e89b-12d3-a456-426614174001"
+PT_B = "pt-123e4567-e89b-12d3-a456-426614174002"
+
+
+def progress(current, *, token=PT_A, total=100, percentage=None, ms=0, **fields):
+  if percentage is None:
+    percentage = current / total * 100 if total else 0.0
+  return JsonRpcProgressNotification(
+    params=ProgressNotification(
+      operation_id=OP_ID,
+      progress_token=token,
+      stage=fields.pop("stage", "index"),
+      progress=ProgressMetrics(current=current, total=total, percentage=percentage),
+      timestamp=fields.pop("timestamp", f"2025-01-15T10:30:00.{ms:03d}Z"),
+      **fields,
+    )
+  )
+
+
+def params(frame):
+  return json.loads(frame)["params"]
+
+
+def round_trip(notifications, **kwargs):
+  encoder, decoder = ProgressDeltaEncoder(**kwargs), ProgressDeltaDecoder()
+  frames = [encoder.encode(n) for n in notifications]
+  assert [decoder.decode(frame) for frame in frames] == notifications
+  return frames
+
+
+class TestEncoder:
+  def test_full_frame_first_then_deltas(self):
+    first, second = round_trip([progress(1, ms=1), progress(2, ms=5)])
+    assert first == encode_progress_notification(progress(1, ms=1))
+    assert json.loads(second)["method"] == PROGRESS_DELTA_METHOD
+    assert params(second) == {"id": 0, "progressToken": PT_A, "current": 2, "dt": 4}
+
+  def test_later_deltas_use_only_the_stream_id(self):
+    frames = round_trip([progress(1, ms=1), progress(2, ms=2), progress(3, ms=3)])
+    assert params(frames[2]) == {"id": 0, "current": 3, "dt": 1}
+
+  def test_changed_fields_are_sent(self):
+    frames = round_trip(
+      [
+        progress(1, ms=1),
+        progress(1, ms=1, stage="merge", message="hi", metadata={"k": 1}),
+      ]
+    )
+    assert params(frames[1]) == {
+      "id": 0,
+      "progressToken": PT_A,
+      "stage": "merge",
+      "message": "hi",
+      "metadata": {"k": 1},
+    }
+
+  def test_inexact_percentage_is_sent(self):
+    frames = round_trip(
+      [progress(1, total=3, percentage=33.33), progress(2, total=3, percentage=66.67)]
+    )
+    assert params(frames[1])["percentage"] == 66.67
+
+  def test_percentage_without_total(self):
+    frames = round_trip(
+      [progress(1, total=None, percentage=10.0), progress(2, total=None, percentage=20.0)]
+    )
+    assert params(frames[1])["percentage"] == 20.0
+
+  def test_total_change_derives_percentage(self):
+    frames = round_trip([progress(10, total=100), progress(10, total=200)])
+    assert params(frames[1]) == {"id": 0, "progressToken": PT_A, "total": 200}
+
+  def test_timestamp_sent_when_dt_cannot_round_trip(self):
+    frames = round_trip([progress(1, ms=500), progress(2, ms=0)])
+    assert params(frames[1])["timestamp"] == "2025-01-15T10:30:00.000Z"
+    assert "dt" not in params(frames[1])
+
+  def test_whole_second_timestamps_use_dt(self):
+    frames = round_trip(
+      [progress(1, timestamp="2025-01-15T10:30:00Z"), progress(2, timestamp="2025-01-15T10:30:05Z")]
+    )
+    assert params(frames[1])["dt"] == 5000
+
+  def test_keyframe_interval(self):
+    notifications = [progress(i, ms=i) for i in range(7)]
+    frames = round_trip(notifications, keyframe_interval=3)
+    full = [i for i, frame in enumerate(frames) if b'"notifications/progress"' in frame]
+    assert full == [0, 3, 6]
+    assert "progressToken" in params(frames[4])
+
+  def test_no_keyframes(self):
+    frames = round_trip([progress(i, ms=i) for i in range(5)], keyframe_interval=None)
+    assert sum(b'"notifications/progress"' in frame for frame in frames) == 1
+
+  def test_streams_get_distinct_ids(self):
+    frames = round_trip(
+      [progress(1, token=PT_A), progress(1, token=PT_B), progress(2, token=PT_B), progress(2)]
+    )
+    assert params(frames[2])["id"] == 1
+    assert params(frames[3])["id"] == 0
+
+  def test_accepts_bare_params(self):
+    encoder = ProgressDeltaEncoder()
+    assert encoder.encode(progress(1).params) == encode_progress_notification(progress(1))
+
+  def test_forget_restarts_with_full_frame(self):
+    encoder = ProgressDeltaEncoder()
+    encoder.encode(progress(1))
+    encoder.forget(PT_A)
+    encoder.forget(PT_A)
+    assert encoder.encode(progress(2)) == encode_progress_notification(progress(2))
+
+  def test_rejects_bad_keyframe_interval(self):
+    with pytest.raises(ValueError, match="keyframe_interval"):
+      ProgressDeltaEncoder(keyframe_interval=0)
+
+  def test_compresses_high_frequency_streams(self):
+    notifications = [progress(i, total=1000, ms=i % 1000) for i in range(500)]
+    frames = round_trip(notifications)
+    full = sum(len(encode_progress_notification(n)) for n in notifications)
+    assert full / sum(len(frame) for frame in frames) > 3
+
+
+class TestDecoder:
+  def test_other_notifications_pass_through(self):
+    decoder = ProgressDeltaDecoder()
+    decoded = decoder.decode(b'{"jsonrpc":"2.0","method":"custom/x"}')
+    assert type(decoded) is JsonRpcNotification
+
+  def test_delta_before_full_frame_raises(self):
+    encoder, decoder = ProgressDeltaEncoder(), ProgressDeltaDecoder()
+    encoder.encode(progress(1))
+    with pytest.raises(ValueError, match="before a full frame"):
+      decoder.decode(encoder.encode(progress(2)))
+
+  def test_unknown_stream_id_raises(self):
+    decoder = ProgressDeltaDecoder()
+    with pytest.raises(ValueError, match="stream id 7"):
+      decoder.apply(JsonRpcNotification(method=PROGRESS_DELTA_METHOD, params={"id": 7}))
+
+  def test_late_joiner_syncs_on_keyframe(self):
+    encoder, decoder = ProgressDeltaEncoder(keyframe_interval=2), ProgressDeltaDecoder()
+    frames = [encoder.encode(progress(i, ms=i)) for i in range(4)]
+    assert decoder.decode(frames[2]) == progress(2, ms=2)
+    assert decoder.decode(frames[3]) == progress(3, ms=3)
+
+  def test_forget(self):
+    encoder, decoder = ProgressDeltaEncoder(), ProgressDeltaDecoder()
+    frames = [encoder.encode(progress(i, ms=i)) for i in range(3)]
+    decoder.decode(frames[0])
+    decoder.decode(frames[1])
+    decoder.forget(PT_A)
+    with pytest.raises(ValueError):
+      decoder.decode(frames[2])
@@ -0,0 +1,97 @@
+"""Tests for the specialized JSON-RPC progress encoders."""
+
+import json
+
+import pytest
+
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.mcp.rpc.encoders import ProgressFrameEncoder, encode_progress_notification
+from mcp_utils.mcp.rpc.wrappers import JsonRpcProgressNotification
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174001"
+TS = "2025-01-15T10:30:00.000Z"
+
+
+def make_notification(**overrides):
+  fields = {
+    "operation_id": OP_ID,
+    "progress_token": PT_ID,
+    "stage": "indexing",
+    "progress": ProgressMetrics(current=5, total=10, percentage=50.0),
+    "timestamp": TS,
+  }
+  fields.update(overrides)
+  return JsonRpcProgressNotification(params=ProgressNotification(**fields))
+
+
+class TestEncodeProgressNotification:
+  @pytest.mark.parametrize(
+    "overrides",
+    [
+      {},
+      {"progress": ProgressMetrics(current=0, percentage=0.0)},
+      {"progress": ProgressMetrics(current=1, total=3, unit="files", percentage=100 / 3)},
+      {"progress": ProgressMetrics(current=0, percentage=1e-7)},
+      {"message": 'quote " backslash \\ newline \n control \x01 unicode é  '},
+      {"stage": "ステージ"},
+      {"metadata": {"rows": 3, "nested": {"ok": True, "items": [1.5, None]}}},
+    ],
+  )
+  def test_matches_model_dump_json(self, overrides):
+    notification = make_notification(**overrides)
+    assert encode_progress_notification(notification) == notification.model_dump_json().encode()
+
+  def test_accepts_bare_params(self):
+    notification = make_notification()
+    assert encode_progress_notification(notification.params) == encode_progress_notification(
+      notification
+    )
+
+  def test_round_trips(self):
+    notification = make_notification(message="done")
+    frame = encode_progress_notification(notification)
+    assert JsonRpcProgressNotification.model_validate_json(frame) == notification
+
+
+class TestProgressFrameEncoder:
+  def test_matches_model_dump_json(self):
+    encoder = ProgressFrameEncoder(OP_ID, PT_ID)
+    frame = encoder.encode("indexing", 5, 50.0, TS, total=10, message="half", metadata={"k": 1})
+    expected = make_notification(
+      message="half",
+      metadata={"k": 1},
+    ).model_dump_json()
+    assert frame == expected.encode()
+
+  def test_defaults(self):
+    frame = ProgressFrameEncoder(OP_ID, PT_ID).encode("s", 0, 0, TS)
+    params = json.loads(frame)["params"]
+    assert params["progress"] == {"current": 0, "total": None, "unit": "items", "percentage": 0.0}
+    assert params["message"] is None
+    assert params["metadata"] is None
+
+  def test_integer_percentage_written_as_float(self):
+    frame = ProgressFrameEncoder(OP_ID, PT_ID).encode("s", 1, 100, TS, total=1)
+    assert b'"percentage":100.0}' in frame
+
+  @pytest.mark.parametrize(("value", "expected"), [(float("inf"), None), (float("nan"), None)])
+  def test_non_finite_percentage_is_null(self, value, expected):
+    frame = ProgressFrameEncoder(OP_ID, PT_ID).encode("s", 1, value, TS)
+    assert json.loads(frame)["params"]["progress"]["percentage"] is expected
+
+  def test_escapes_identifiers(self):
+    frame = ProgressFrameEncoder('op-"x', PT_ID).encode("s", 0, 0.0, TS)
+    assert json.loads(frame)["params"]["operationId"] == 'op-"x'
+
+  def test_encode_into_appends(self):
+    encoder = ProgressFrameEncoder(OP_ID, PT_ID)
+    buffer = bytearray(b"prefix\n")
+    written = encoder.encode_into(buffer, "s", 1, 10.0, TS, total=10)
+    assert written == len(buffer) - len(b"prefix\n")
+    assert bytes(buffer[7:]) == encoder.encode("s", 1, 10.0, TS, total=10)
+
+  def test_exposes_bound_ids(self):
+    encoder = ProgressFrameEncoder(OP_ID, PT_ID)
+    assert encoder.operation_id == OP_ID
+    assert encoder.progress_token == PT_ID
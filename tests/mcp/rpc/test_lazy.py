@@ -0,0 +1,87 @@
+"""Tests for lazily validated JSON-RPC notifications."""
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_utils.mcp.rpc.lazy import LazyNotification
+from mcp_utils.mcp.rpc.wrappers import JsonRpcErrorNotification, JsonRpcNotification
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+TS = "2025-01-15T10:30:00.000Z"
+
+ERROR_FRAME = (
+  '{"jsonrpc":"2.0","method":"notifications/error","params":{"operationId":"' + OP_ID + '",'
+  '"error":{"code":5001,"message":"boom","timestamp":"' + TS + '","trace":["a","b"],'
+  '"context":{"operation":"query","extra":{"rows":[1,2]}}},"timestamp":"' + TS + '"}}'
+).encode()
+
+
+class TestFromJson:
+  def test_reads_routing_keys_without_decoding(self):
+    lazy = LazyNotification.from_json(ERROR_FRAME)
+    assert lazy.method == "notifications/error"
+    assert lazy.operation_id == OP_ID
+    assert lazy.raw is ERROR_FRAME
+    assert not lazy.is_decoded
+
+  def test_accepts_str_bytearray_and_memoryview(self):
+    for data in (ERROR_FRAME.decode(), bytearray(ERROR_FRAME), memoryview(ERROR_FRAME)):
+      lazy = LazyNotification.from_json(data)
+      assert lazy.raw == ERROR_FRAME
+      assert type(lazy.raw) is bytes
+
+  def test_copies_mutable_buffers(self):
+    buffer = bytearray(ERROR_FRAME)
+    lazy = LazyNotification.from_json(memoryview(buffer))
+    buffer[:] = b"x" * len(buffer)
+    assert lazy.raw == ERROR_FRAME
+
+  def test_params_without_operation_id(self):
+    lazy = LazyNotification.from_json(b'{"jsonrpc":"2.0","method":"custom/event","params":{"a":1}}')
+    assert lazy.method == "custom/event"
+    assert lazy.operation_id is None
+
+  def test_no_params(self):
+    lazy = LazyNotification.from_json(b'{"method":"custom/ping"}')
+    assert lazy.operation_id is None
+
+  @pytest.mark.parametrize(
+    "frame",
+    [
+      b'{"jsonrpc":"2.0"}',
+      b'{"jsonrpc":"1.0","method":"x"}',
+      b'{"method":"x","params":{"operationId":5}}',
+      b'{"method":',
+    ],
+  )
+  def test_malformed_envelope_raises(self, frame):
+    with pytest.raises(ValidationError):
+      LazyNotification.from_json(frame)
+
+
+class TestNotification:
+  def test_decodes_on_first_access_and_caches(self):
+    lazy = LazyNotification.from_json(ERROR_FRAME)
+    notification = lazy.notification
+    assert isinstance(notification, JsonRpcErrorNotification)
+    assert notification.params.error.trace == ["a", "b"]
+    assert lazy.is_decoded
+    assert lazy.notification is notification
+
+  def test_unknown_method_decodes_generic(self):
+    lazy = LazyNotification.from_json(b'{"method":"custom/event","params":{"a":1}}')
+    assert type(lazy.notification) is JsonRpcNotification
+
+  def test_invalid_params_raise_on_access(self):
+    lazy = LazyNotification.from_json(
+      b'{"method":"notifications/error","params":{"operationId":"bad"}}'
+    )
+    assert lazy.operation_id == "bad"
+    with pytest.raises(ValidationError):
+      lazy.notification  # noqa: B018
+    assert not lazy.is_decoded
+
+
+def test_repr():
+  lazy = LazyNotification.from_json(ERROR_FRAME)
+  assert repr(lazy) == f"LazyNotification(method='notifications/error', operation_id='{OP_ID}')"
@@ -0,0 +1,218 @@
+"""Tests for streaming JSON-RPC frame readers."""
+
+import asyncio
+import io
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.mcp.rpc.lazy import LazyNotification
+from mcp_utils.mcp.rpc.streams import (
+  FrameBuffer,
+  aiter_frames,
+  aiter_notifications,
+  iter_frames,
+  iter_lazy_notifications,
+  iter_notifications,
+)
+from mcp_utils.mcp.rpc.wrappers import JsonRpcNotification, JsonRpcProgressNotification
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174001"
+TS = "2025-01-15T10:30:00.000Z"
+
+PROGRESS = JsonRpcProgressNotification(
+  params=ProgressNotification(
+    operation_id=OP_ID,
+    progress_token=PT_ID,
+    stage="s",
+    progress=ProgressMetrics(current=1, total=2, percentage=50.0),
+    timestamp=TS,
+  )
+)
+FRAME = PROGRESS.model_dump_json().encode()
+
+
+def content_length(body: bytes) -> bytes:
+  return b"Content-Length: %d\r\n\r\n" % len(body) + body
+
+
+def read_all(data: bytes, framing="auto", **kwargs) -> list[bytes]:
+  return [bytes(frame) for frame in iter_frames(io.BytesIO(data), framing, **kwargs)]
+
+
+async def async_stream(data: bytes) -> asyncio.StreamReader:
+  reader = asyncio.StreamReader()
+  reader.feed_data(data)
+  reader.feed_eof()
+  return reader
+
+
+class TestNdjson:
+  def test_splits_lines(self):
+    assert read_all(b'{"a":1}\n{"b":2}\n', "ndjson") == [b'{"a":1}', b'{"b":2}']
+
+  def test_crlf_blank_lines_and_missing_final_newline_at_eof(self):
+    assert read_all(b'{"a":1}\r\n\r\n\n{"b":2}\n', "ndjson") == [b'{"a":1}', b'{"b":2}']
+
+  def test_truncated_final_line_raises(self):
+    with pytest.raises(ValueError, match="stream ended inside a frame"):
+      read_all(b'{"a":1}\n{"b":', "ndjson")
+
+  def test_frames_spanning_chunks(self):
+    data = b"".join(FRAME + b"\n" for _ in range(50))
+    assert read_all(data, "ndjson", chunk_size=7) == [FRAME] * 50
+
+  def test_line_over_max_frame_size_raises(self):
+    with pytest.raises(ValueError, match="max_frame_size"):
+      read_all(b'{"a":"' + b"x" * 100 + b'"}\n', "ndjson", chunk_size=16, max_frame_size=32)
+
+
+class TestContentLength:
+  def test_splits_bodies(self):
+    data = content_length(b'{"a":1}') + content_length(b'{"b":\n2}')
+    assert read_all(data, "content-length") == [b'{"a":1}', b'{"b":\n2}']
+
+  def test_extra_headers_and_case(self):
+    data = b"Content-Type: application/json\r\ncontent-length: 7\r\n\r\n" + b'{"a":1}'
+    assert read_all(data, "content-length") == [b'{"a":1}']
+
+  def test_body_spanning_chunks(self):
+    data = content_length(FRAME) * 20
+    assert read_all(data, "content-length", chunk_size=5) == [FRAME] * 20
+
+  @pytest.mark.parametrize(
+    ("headers", "match"),
+    [
+      (b"Content-Type: json\r\n\r\n", "no Content-Length"),
+      (b"Content-Length: abc\r\n\r\n", "invalid Content-Length"),
+      (b"Content-Length: -1\r\n\r\n", "invalid Content-Length"),
+    ],
+  )
+  def test_bad_headers_raise(self, headers, match):
+    with pytest.raises(ValueError, match=match):
+      read_all(headers, "content-length")
+
+  def test_body_over_max_frame_size_raises(self):
+    with pytest.raises(ValueError, match="max_frame_size"):
+      read_all(b"Content-Length: 1000\r\n\r\n", "content-length", max_frame_size=100)
+
+  def test_unterminated_headers_over_max_frame_size_raise(self):
+    with pytest.raises(ValueError, match="max_frame_size"):
+      read_all(b"X-Header: " + b"x" * 100, "content-length", chunk_size=8, max_frame_size=32)
+
+  def test_truncated_body_raises(self):
+    with pytest.raises(ValueError, match="stream ended inside a frame"):
+      read_all(b'Content-Length: 10\r\n\r\n{"a"', "content-length")
+
+
+class TestAutoFraming:
+  def test_detects_each_frame(self):
+    data = b'{"a":1}\n' + content_length(b'{"b":2}') + b"[1]\n"
+    assert read_all(data) == [b'{"a":1}', b'{"b":2}', b"[1]"]
+
+
+class TestFrameBuffer:
+  def test_rejects_bad_chunk_size(self):
+    with pytest.raises(ValueError, match="chunk_size"):
+      FrameBuffer(chunk_size=0)
+
+  def test_feed_and_pending(self):
+    frames = FrameBuffer("ndjson", chunk_size=8)
+    frames.feed(b'{"a":1}\n{"b"')
+    assert [bytes(f) for f in frames.frames()] == [b'{"a":1}']
+    assert frames.pending == 4
+    frames.feed(b":2}\n")
+    assert [bytes(f) for f in frames.frames()] == [b'{"b":2}']
+    frames.finish()
+
+  def test_partial_line_is_not_searched_again(self):
+    frames = FrameBuffer("ndjson", chunk_size=8)
+    frames.feed(b' {"a":')
+    assert list(frames.frames()) == []
+    assert frames._scanned == 5
+    frames.feed(b'"' + b"x" * 40)  # compacts and grows the buffer
+    assert list(frames.frames()) == []
+    assert frames._scanned == 46
+    frames.feed(b'"}\n{"b":2}\n')
+    assert [bytes(f) for f in frames.frames()] == [b'{"a":"' + b"x" * 40 + b'"}', b'{"b":2}']
+    assert frames._scanned == 0
+
+  def test_content_length_fed_byte_by_byte(self):
+    data = content_length(FRAME) + content_length(b"{}")
+    frames = FrameBuffer("content-length", chunk_size=8)
+    received = []
+    for i in range(len(data)):
+      frames.feed(data[i : i + 1])
+      received.extend(bytes(f) for f in frames.frames())
+      assert frames._scanned <= frames.pending
+    assert received == [FRAME, b"{}"]
+    frames.finish()
+
+  def test_frames_are_zero_copy_views(self):
+    frames = FrameBuffer("ndjson")
+    frames.feed(b'{"a":1}\n')
+    (frame,) = frames.frames()
+    assert isinstance(frame, memoryview)
+    assert frame.obj is frames._buffer
+
+  def test_grows_only_to_fit_a_frame(self):
+    frames = FrameBuffer("ndjson", chunk_size=16)
+    frames.feed(b'{"a":"' + b"x" * 100 + b'"}\n')
+    assert len(list(frames.frames())) == 1
+    assert 100 < frames.capacity <= 256
+
+  def test_constant_memory_for_long_streams(self):
+    data = b"".join(FRAME + b"\n" for _ in range(2000))
+    frames = FrameBuffer("ndjson", chunk_size=1024)
+    stream = io.BytesIO(data)
+    count = 0
+    while read := stream.readinto(frames.writable()):
+      frames.commit(read)
+      count += sum(1 for _ in frames.frames())
+    assert count == 2000
+    assert frames.capacity == 1024
+
+
+class TestNotifications:
+  def test_iter_notifications(self):
+    data = FRAME + b"\n" + content_length(b'{"jsonrpc":"2.0","method":"custom/x"}')
+    decoded = list(iter_notifications(io.BytesIO(data)))
+    assert decoded[0] == PROGRESS
+    assert type(decoded[1]) is JsonRpcNotification
+
+  def test_invalid_notification_raises(self):
+    with pytest.raises(ValidationError):
+      list(iter_notifications(io.BytesIO(b'{"jsonrpc":"2.0"}\n')))
+
+  def test_iter_lazy_notifications_outlive_the_buffer(self):
+    data = b"".join(FRAME + b"\n" for _ in range(10))
+    lazies = list(iter_lazy_notifications(io.BytesIO(data), chunk_size=64))
+    assert all(isinstance(lazy, LazyNotification) for lazy in lazies)
+    assert [lazy.operation_id for lazy in lazies] == [OP_ID] * 10
+    assert lazies[0].notification == PROGRESS
+
+
+class TestAsync:
+  def test_aiter_frames(self):
+    async def collect():
+      stream = await async_stream(b'{"a":1}\n' + content_length(b'{"b":2}'))
+      return [bytes(frame) async for frame in aiter_frames(stream, chunk_size=4)]
+
+    assert asyncio.run(collect()) == [b'{"a":1}', b'{"b":2}']
+
+  def test_aiter_frames_truncated_raises(self):
+    async def collect():
+      stream = await async_stream(b'{"a":')
+      return [frame async for frame in aiter_frames(stream)]
+
+    with pytest.raises(ValueError, match="stream ended inside a frame"):
+      asyncio.run(collect())
+
+  def test_aiter_notifications(self):
+    async def collect():
+      stream = await async_stream((FRAME + b"\n") * 3)
+      return [n async for n in aiter_notifications(stream, "ndjson")]
+
+    assert asyncio.run(collect()) == [PROGRESS] * 3
@@ -0,0 +1,231 @@
+"""Tests for buffered notification writers."""
+
+import asyncio
+import io
+
+import pytest
+
+from mcp_utils.core.cancellation_token import CancellationToken
+from mcp_utils.core.error_response import ErrorResponse
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.mcp.notifications import CancellationNotification, ErrorNotification
+from mcp_utils.mcp.rpc.streams import iter_frames, iter_notifications
+from mcp_utils.mcp.rpc.wrappers import (
+  JsonRpcCancellationNotification,
+  JsonRpcErrorNotification,
+  JsonRpcNotification,
+  JsonRpcProgressNotification,
+)
+from mcp_utils.mcp.rpc.writers import AsyncNotificationWriter, NotificationWriter
+from tests.helpers import FakeClock
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174001"
+TS = "2025-01-15T10:30:00.000Z"
+
+PROGRESS = JsonRpcProgressNotification(
+  params=ProgressNotification(
+    operation_id=OP_ID,
+    progress_token=PT_ID,
+    stage="s",
+    progress=ProgressMetrics(current=1, total=2, percentage=50.0),
+    timestamp=TS,
+  )
+)
+ERROR = JsonRpcErrorNotification(
+  params=ErrorNotification(
+    operation_id=OP_ID,
+    error=ErrorResponse(code=5001, message="boom", timestamp=TS),
+    timestamp=TS,
+  )
+)
+CANCELLED = JsonRpcCancellationNotification(
+  params=CancellationNotification(
+    operation_id=OP_ID,
+    cancellation_token=CancellationToken(is_cancellation_requested=False),
+    timestamp=TS,
+  )
+)
+
+
+class RecordingStream(io.BytesIO):
+  def __init__(self):
+    super().__init__()
+    self.writes = 0
+    self.flushes = 0
+
+  def write(self, data):
+    self.writes += 1
+    return super().write(data)
+
+  def flush(self):
+    self.flushes += 1
+
+
+class TestNotificationWriter:
+  def test_coalesces_until_size_threshold(self):
+    stream = RecordingStream()
+    frame_size = len(PROGRESS.model_dump_json()) + 1
+    writer = NotificationWriter(stream, max_buffer_size=frame_size * 3, max_delay=60)
+    writer.write(PROGRESS)
+    writer.write(PROGRESS)
+    assert stream.writes == 0
+    assert writer.buffered == frame_size * 2
+    writer.write(PROGRESS)
+    assert stream.writes == 1
+    assert stream.flushes == 1
+    assert writer.buffered == 0
+    assert list(iter_notifications(io.BytesIO(stream.getvalue()))) == [PROGRESS] * 3
+
+  @pytest.mark.parametrize("urgent", [ERROR, CANCELLED], ids=["error", "cancelled"])
+  def test_urgent_notifications_flush_immediately(self, urgent):
+    stream = RecordingStream()
+    writer = NotificationWriter(stream, max_delay=60)
+    writer.write(PROGRESS)
+    writer.write(urgent)
+    assert stream.writes == 1
+    assert list(iter_notifications(io.BytesIO(stream.getvalue()))) == [PROGRESS, urgent]
+
+  def test_urgent_override(self):
+    stream = RecordingStream()
+    writer = NotificationWriter(stream, max_delay=60)
+    writer.write(ERROR, urgent=False)
+    assert stream.writes == 0
+    writer.write(PROGRESS, urgent=True)
+    assert stream.writes == 1
+
+  def test_time_threshold_on_write(self):
+    clock = FakeClock()
+    stream = RecordingStream()
+    writer = NotificationWriter(stream, max_delay=0.5, clock=clock)
+    writer.write(PROGRESS)
+    clock.now = 0.4
+    writer.write(PROGRESS)
+    assert stream.writes == 0
+    clock.now = 0.5
+    writer.write(PROGRESS)
+    assert stream.writes == 1
+
+  def test_flush_if_due(self):
+    clock = FakeClock()
+    stream = RecordingStream()
+    writer = NotificationWriter(stream, max_delay=0.5, clock=clock)
+    assert not writer.flush_if_due()
+    writer.write(PROGRESS)
+    assert not writer.flush_if_due()
+    clock.now = 1.0
+    assert writer.flush_if_due()
+    assert stream.writes == 1
+
+  def test_raw_frames(self):
+    stream = RecordingStream()
+    writer = NotificationWriter(stream, max_delay=60)
+    writer.write(b'{"jsonrpc":"2.0","method":"custom/x"}')
+    assert stream.writes == 0
+    writer.write(b'{"jsonrpc":"2.0","method":"custom/y"}', urgent=True)
+    assert [bytes(f) for f in iter_frames(io.BytesIO(stream.getvalue()))] == [
+      b'{"jsonrpc":"2.0","method":"custom/x"}',
+      b'{"jsonrpc":"2.0","method":"custom/y"}',
+    ]
+
+  def test_content_length_framing(self):
+    stream = RecordingStream()
+    with NotificationWriter(stream, "content-length") as writer:
+      writer.write(PROGRESS)
+      writer.write(JsonRpcNotification(method="custom/x"))
+    data = stream.getvalue()
+    assert data.startswith(b"Content-Length: ")
+    frames = list(iter_notifications(io.BytesIO(data), "content-length"))
+    assert frames == [PROGRESS, JsonRpcNotification(method="custom/x")]
+
+  def test_close_flushes(self):
+    stream = RecordingStream()
+    writer = NotificationWriter(stream, max_delay=60)
+    writer.write(PROGRESS)
+    writer.close()
+    assert stream.writes == 1
+    writer.close()
+    assert stream.writes == 1
+    assert stream.flushes == 2
+
+  @pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+      ({"framing": "auto"}, "framing"),
+      ({"max_buffer_size": -1}, "max_buffer_size"),
+      ({"max_delay": -1}, "max_delay"),
+    ],
+  )
+  def test_rejects_bad_settings(self, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+      NotificationWriter(RecordingStream(), **kwargs)
+
+
+class RecordingAsyncStream:
+  def __init__(self, drain_delay=0.0):
+    self.data = bytearray()
+    self.writes = 0
+    self.drains = 0
+    self.drain_delay = drain_delay
+
+  def write(self, data):
+    self.writes += 1
+    self.data += data
+
+  async def drain(self):
+    self.drains += 1
+    await asyncio.sleep(self.drain_delay)
+
+
+class TestAsyncNotificationWriter:
+  def test_size_and_urgent_flushes(self):
+    async def run():
+      stream = RecordingAsyncStream()
+      writer = AsyncNotificationWriter(stream, max_buffer_size=1 << 20, max_delay=60)
+      await writer.write(PROGRESS)
+      await writer.write(PROGRESS)
+      assert stream.writes == 0
+      assert writer.buffered > 0
+      await writer.write(ERROR)
+      assert stream.writes == 1
+      assert stream.drains == 1
+      await writer.aclose()
+      return stream
+
+    stream = asyncio.run(run())
+    assert list(iter_notifications(io.BytesIO(bytes(stream.data)))) == [PROGRESS, PROGRESS, ERROR]
+
+  def test_timer_flushes_idle_buffer(self):
+    async def run():
+      stream = RecordingAsyncStream()
+      writer = AsyncNotificationWriter(stream, max_delay=0.01)
+      await writer.write(PROGRESS)
+      await writer.write(PROGRESS)
+      assert stream.writes == 0
+      await asyncio.sleep(0.05)
+      assert stream.writes == 1
+      await writer.aclose()
+      return stream
+
+    assert asyncio.run(run()).writes == 1
+
+  def test_backpressure_blocks_writer(self):
+    async def run():
+      stream = RecordingAsyncStream(drain_delay=0.05)
+      writer = AsyncNotificationWriter(stream, max_buffer_size=1, max_delay=60)
+      loop = asyncio.get_running_loop()
+      start = loop.time()
+      await writer.write(PROGRESS)
+      return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.04
+
+  def test_context_manager_flushes(self):
+    async def run():
+      stream = RecordingAsyncStream()
+      async with AsyncNotificationWriter(stream, "content-length", max_delay=60) as writer:
+        await writer.write(PROGRESS)
+      return stream
+
+    stream = asyncio.run(run())
+    assert list(iter_notifications(io.BytesIO(bytes(stream.data)), "content-length")) == [PROGRESS]
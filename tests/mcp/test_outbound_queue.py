@@ -0,0 +1,134 @@
+"""Tests for the coalescing outbound notification queue."""
+
+import asyncio
+
+import pytest
+
+from mcp_utils.core.error_response import ErrorResponse
+from mcp_utils.core.operation_state import LifecycleStatus
+from mcp_utils.core.progress_metrics import ProgressMetrics, ProgressNotification
+from mcp_utils.mcp.notifications import ErrorNotification, StateChangeNotification
+from mcp_utils.mcp.outbound_queue import AsyncOutboundQueue, OutboundQueue
+from mcp_utils.mcp.rpc.wrappers import JsonRpcProgressNotification, JsonRpcStateChangeNotification
+
+OP_A = "op-123e4567-e89b-12d3-a456-426614174000"
+OP_B = "op-123e4567-e89b-12d3-a456-426614174001"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174002"
+TS = "2025-01-15T10:30:00.000Z"
+
+
+def progress(operation_id, current):
+  return ProgressNotification(
+    operation_id=operation_id,
+    progress_token=PT_ID,
+    stage="s",
+    progress=ProgressMetrics(current=current, total=100, percentage=float(current)),
+    timestamp=TS,
+  )
+
+
+def state_change(operation_id, old=LifecycleStatus.CREATED, new=LifecycleStatus.RUNNING):
+  return StateChangeNotification(
+    operation_id=operation_id, old_state=old, new_state=new, timestamp=TS
+  )
+
+
+def error(operation_id):
+  return ErrorNotification(
+    operation_id=operation_id,
+    error=ErrorResponse(code=5001, message="boom", timestamp=TS),
+    timestamp=TS,
+  )
+
+
+class TestOutboundQueue:
+  def test_progress_is_last_value_wins_in_place(self):
+    queue = OutboundQueue()
+    queue.put(progress(OP_A, 1))
+    queue.put(progress(OP_B, 1))
+    for current in range(2, 50):
+      queue.put(progress(OP_A, current))
+    assert len(queue) == 2
+    assert queue.coalesced == 48
+    assert queue.pop().progress.current == 49
+    assert queue.pop().operation_id == OP_B
+
+  def test_control_notifications_are_never_dropped(self):
+    queue = OutboundQueue()
+    items = [state_change(OP_A), error(OP_A), error(OP_A)]
+    for item in items:
+      queue.put(item)
+    assert queue.drain() == items
+
+  def test_progress_does_not_jump_ahead_of_later_control_notification(self):
+    queue = OutboundQueue()
+    queue.put(progress(OP_A, 10))
+    queue.put(state_change(OP_A))
+    queue.put(progress(OP_A, 20))
+    queue.put(progress(OP_A, 30))
+    drained = queue.drain()
+    assert [type(item).__name__ for item in drained] == [
+      "ProgressNotification",
+      "StateChangeNotification",
+      "ProgressNotification",
+    ]
+    assert drained[0].progress.current == 10
+    assert drained[2].progress.current == 30
+
+  def test_popped_progress_is_not_replaced(self):
+    queue = OutboundQueue()
+    queue.put(progress(OP_A, 1))
+    assert queue.pop().progress.current == 1
+    queue.put(progress(OP_A, 2))
+    assert len(queue) == 1
+    assert queue.coalesced == 0
+
+  def test_pop_of_superseded_slot_keeps_newer_slot(self):
+    queue = OutboundQueue()
+    queue.put(progress(OP_A, 1))
+    queue.put(state_change(OP_A))
+    queue.put(progress(OP_A, 2))
+    queue.pop()
+    queue.pop()
+    queue.put(progress(OP_A, 3))
+    assert len(queue) == 1
+    assert queue.pop().progress.current == 3
+
+  def test_json_rpc_wrappers(self):
+    queue = OutboundQueue()
+    queue.put(JsonRpcProgressNotification(params=progress(OP_A, 1)))
+    queue.put(JsonRpcProgressNotification(params=progress(OP_A, 2)))
+    queue.put(JsonRpcStateChangeNotification(params=state_change(OP_A)))
+    assert len(queue) == 2
+    assert queue.pop().params.progress.current == 2
+    assert isinstance(queue.pop(), JsonRpcStateChangeNotification)
+
+  def test_pop_empty_raises(self):
+    with pytest.raises(IndexError):
+      OutboundQueue().pop()
+
+  def test_memory_bounded_by_operations(self):
+    queue = OutboundQueue()
+    for current in range(1000):
+      for operation_id in (OP_A, OP_B):
+        queue.put(progress(operation_id, current % 101))
+    assert len(queue) == 2
+
+
+class TestAsyncOutboundQueue:
+  def test_get_waits_for_put(self):
+    async def run():
+      queue = AsyncOutboundQueue()
+      getter = asyncio.ensure_future(queue.get())
+      await asyncio.sleep(0)
+      assert not getter.done()
+      queue.put(progress(OP_A, 1))
+      queue.put(progress(OP_A, 2))
+      first = await getter
+      queue.put(error(OP_A))
+      second = await queue.get()
+      return first, second
+
+    first, second = asyncio.run(run())
+    assert first.progress.current == 2
+    assert isinstance(second, ErrorNotification)
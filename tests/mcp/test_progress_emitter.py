@@ -0,0 +1,173 @@
+"""Tests for the verbosity-aware progress emitter."""
+
+import pytest
+
+from mcp_utils.base.system_types import VerbosityMode
+from mcp_utils.core.progress_metrics import ProgressNotification
+from mcp_utils.mcp.progress_emitter import ProgressEmitter
+from tests.helpers import FakeClock
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174001"
+PT_OTHER = "pt-123e4567-e89b-12d3-a456-426614174002"
+
+
+def make_emitter(verbosity, **kwargs):
+  clock = FakeClock()
+  return ProgressEmitter(verbosity, clock=clock, **kwargs), clock
+
+
+def update(emitter, stage="load", current=0, **kwargs):
+  return emitter.update(OP_ID, PT_ID, stage, current, total=kwargs.pop("total", 100), **kwargs)
+
+
+class TestCoarse:
+  def test_first_update_and_stage_changes_only(self):
+    emitter, clock = make_emitter(VerbosityMode.COARSE)
+    assert isinstance(update(emitter), ProgressNotification)
+    clock.now = 10
+    assert update(emitter, current=50) is None
+    assert update(emitter, current=100) is None
+    assert update(emitter, "index", current=100) is not None
+
+  def test_stage_change_ignores_min_interval(self):
+    emitter, _ = make_emitter(VerbosityMode.COARSE, min_interval=60)
+    update(emitter)
+    assert update(emitter, "index") is not None
+
+  def test_completion_and_total_changes_wait_for_a_stage_change(self):
+    emitter, _ = make_emitter(VerbosityMode.COARSE, min_interval=60)
+    update(emitter, current=50)
+    assert update(emitter, current=100, total=100) is None
+    assert update(emitter, current=100, total=120) is None
+
+  def test_drops_message_and_metadata(self):
+    emitter, _ = make_emitter(VerbosityMode.COARSE)
+    notification = update(emitter, message="hi", metadata={"k": 1})
+    assert notification.message is None
+    assert notification.metadata is None
+
+
+class TestNormal:
+  def test_percentage_delta(self):
+    emitter, clock = make_emitter(VerbosityMode.NORMAL, min_percentage_delta=5.0)
+    update(emitter)
+    clock.now = 1
+    assert update(emitter, current=4) is None
+    notification = update(emitter, current=5)
+    assert notification.progress.percentage == 5.0
+    assert notification.progress.current == 5
+
+  def test_min_interval(self):
+    emitter, clock = make_emitter(VerbosityMode.NORMAL, min_interval=0.5)
+    update(emitter)
+    clock.now = 0.4
+    assert update(emitter, current=50) is None
+    clock.now = 0.5
+    assert update(emitter, current=50) is not None
+
+  def test_completion_always_counts(self):
+    emitter, clock = make_emitter(VerbosityMode.NORMAL, min_percentage_delta=10.0)
+    update(emitter, current=95)
+    clock.now = 1
+    assert update(emitter, current=100) is not None
+    clock.now = 2
+    assert update(emitter, current=100) is None
+
+  def test_completion_ignores_min_interval(self):
+    emitter, clock = make_emitter(VerbosityMode.NORMAL, min_interval=60)
+    update(emitter, current=50)
+    clock.now = 0.01
+    assert update(emitter, current=60) is None
+    notification = update(emitter, current=100)
+    assert notification.progress.percentage == 100.0
+    assert update(emitter, current=100) is None
+
+  def test_total_change_ignores_min_interval(self):
+    emitter, clock = make_emitter(VerbosityMode.NORMAL, min_interval=60)
+    update(emitter, current=50)
+    clock.now = 0.01
+    notification = update(emitter, current=50, total=200)
+    assert notification.progress.percentage == 25.0
+    assert update(emitter, current=50, total=200) is None
+
+  def test_overshoot_reports_current_as_total(self):
+    emitter, _ = make_emitter(VerbosityMode.NORMAL)
+    progress = emitter.update(OP_ID, PT_ID, "load", 5, total=4).progress
+    assert (progress.current, progress.total, progress.percentage) == (5, 5, 100.0)
+
+  def test_message_changes_are_ignored(self):
+    emitter, clock = make_emitter(VerbosityMode.NORMAL)
+    update(emitter, message="a")
+    clock.now = 1
+    assert update(emitter, message="b") is None
+
+  def test_unknown_total(self):
+    emitter, clock = make_emitter(VerbosityMode.NORMAL)
+    notification = update(emitter, current=7, total=None)
+    assert notification.progress.total is None
+    assert notification.progress.percentage == 0.0
+    clock.now = 1
+    assert update(emitter, current=8, total=None) is None
+
+  def test_tokens_are_independent(self):
+    emitter, _ = make_emitter(VerbosityMode.NORMAL, min_interval=60)
+    update(emitter)
+    assert emitter.update(OP_ID, PT_OTHER, "load", 0, total=100) is not None
+    assert len(emitter) == 2
+
+  def test_exact_percentage_passes_model_validation(self):
+    emitter, _ = make_emitter(VerbosityMode.NORMAL)
+    notification = update(emitter, current=1, total=3, unit="files")
+    assert notification.progress.percentage == pytest.approx(100 / 3)
+    assert notification.progress.unit == "files"
+
+
+class TestFine:
+  def test_message_changes(self):
+    emitter, clock = make_emitter(VerbosityMode.FINE)
+    update(emitter, message="a")
+    clock.now = 1
+    assert update(emitter, message="a") is None
+    notification = update(emitter, message="b")
+    assert notification.message == "b"
+    assert notification.metadata is None
+
+
+class TestDebug:
+  def test_metadata_changes(self):
+    emitter, clock = make_emitter(VerbosityMode.DEBUG)
+    update(emitter, metadata={"k": 1})
+    clock.now = 1
+    assert update(emitter, metadata={"k": 1}) is None
+    assert update(emitter, metadata={"k": 2}).metadata == {"k": 2}
+
+
+class TestForget:
+  @pytest.mark.parametrize("token", [PT_ID, PT_OTHER])
+  def test_forget(self, token):
+    emitter, _ = make_emitter(VerbosityMode.COARSE)
+    update(emitter)
+    emitter.forget(token)
+    assert len(emitter) == (0 if token == PT_ID else 1)
+
+  def test_forgotten_token_emits_again(self):
+    emitter, _ = make_emitter(VerbosityMode.COARSE)
+    update(emitter)
+    emitter.forget(PT_ID)
+    assert update(emitter) is not None
+
+
+def test_defaults():
+  emitter = ProgressEmitter()
+  assert emitter.verbosity == VerbosityMode.NORMAL
+  assert update(emitter) is not None
+
+
+def test_explicit_percentage():
+  emitter, clock = make_emitter(VerbosityMode.NORMAL)
+  notification = update(emitter, current=3, total=None, percentage=42.5)
+  assert notification.progress.percentage == 42.5
+  clock.now = 1
+  assert update(emitter, current=3, total=None, percentage=43.0) is None
+  assert update(emitter, current=3, total=None, percentage=43.5) is not None
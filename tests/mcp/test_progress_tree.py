@@ -0,0 +1,199 @@
+"""Tests for hierarchical progress aggregation."""
+
+import pytest
+
+from mcp_utils.base.system_types import VerbosityMode
+from mcp_utils.core.progress_metrics import ProgressMetrics
+from mcp_utils.mcp.progress_emitter import ProgressEmitter
+from mcp_utils.mcp.progress_tree import ProgressNode, ProgressTree
+
+OP_ID = "op-123e4567-e89b-12d3-a456-426614174000"
+PT_ID = "pt-123e4567-e89b-12d3-a456-426614174001"
+
+
+def make_tree(**kwargs):
+  sent = []
+  emitter = ProgressEmitter(VerbosityMode.NORMAL, min_interval=0, min_percentage_delta=0.001)
+  return ProgressTree(OP_ID, PT_ID, sent.append, emitter=emitter, **kwargs), sent
+
+
+class TestProgressNode:
+  def test_leaf_fraction(self):
+    node = ProgressNode(total=4)
+    node.update(1)
+    assert node.fraction == 0.25
+    assert node.percentage == 25.0
+
+  def test_leaf_overrun_is_clamped(self):
+    node = ProgressNode(total=4)
+    node.update(8)
+    assert node.fraction == 1.0
+
+  def test_update_keeps_total(self):
+    node = ProgressNode()
+    node.update(1, total=2)
+    node.update(2)
+    assert node.total == 2
+    assert node.fraction == 1.0
+
+  def test_weighted_children(self):
+    root = ProgressNode()
+    heavy = root.add_child(weight=3, total=10)
+    light = root.add_child(weight=1, total=10)
+    heavy.update(10)
+    assert root.fraction == pytest.approx(0.75)
+    light.update(5)
+    assert root.fraction == pytest.approx(0.875)
+
+  def test_nested_propagation(self):
+    root = ProgressNode()
+    branch = root.add_child()
+    root.add_child(total=1)
+    leaves = [branch.add_child(total=2) for _ in range(2)]
+    leaves[0].update(2)
+    assert branch.fraction == 0.5
+    assert root.fraction == 0.25
+
+  def test_unknown_total_counts_on_completion(self):
+    root = ProgressNode()
+    unknown = root.add_child()
+    known = root.add_child(total=2)
+    unknown.update(1000)
+    known.update(1)
+    assert root.fraction == 0.25
+    unknown.complete()
+    assert root.fraction == 0.75
+    assert root.completed_children == 1
+
+  def test_adding_child_dilutes_parent(self):
+    root = ProgressNode()
+    root.add_child(total=1).update(1)
+    assert root.fraction == 1.0
+    assert root.completed_children == 1
+    root.add_child(total=1)
+    assert root.fraction == 0.5
+
+  def test_completed_child_counts(self):
+    root = ProgressNode()
+    child = root.add_child(total=2)
+    child.update(2)
+    assert root.completed_children == 1
+    child.update(1)
+    assert root.completed_children == 0
+
+  def test_update_metrics(self):
+    root = ProgressNode()
+    child = root.add_child()
+    child.update_metrics(ProgressMetrics(current=3, total=4, percentage=75.0))
+    assert child.total == 4
+    assert root.fraction == 0.75
+
+  def test_many_children_stay_exact(self):
+    root = ProgressNode()
+    children = [root.add_child(total=10) for _ in range(2000)]
+    for step in range(1, 11):
+      for child in children:
+        child.update(step)
+    assert root.fraction == 1.0
+    assert root.completed_children == 2000
+
+  def test_inner_nodes_reject_direct_progress(self):
+    root = ProgressNode()
+    root.add_child()
+    with pytest.raises(ValueError, match="derived"):
+      root.update(1)
+    with pytest.raises(ValueError, match="derived"):
+      root.complete()
+
+  @pytest.mark.parametrize("progress", ["update", "complete"])
+  def test_leaf_with_progress_rejects_children(self, progress):
+    node = ProgressNode(total=2)
+    if progress == "update":
+      node.update(1)
+    else:
+      node.complete()
+    with pytest.raises(ValueError, match="cannot add children"):
+      node.add_child()
+
+  def test_rejects_bad_weight(self):
+    with pytest.raises(ValueError, match="weight"):
+      ProgressNode().add_child(weight=0)
+
+  def test_leaf_snapshot(self):
+    node = ProgressNode(total=3)
+    node.update(1)
+    snapshot = node.snapshot()
+    assert (snapshot.current, snapshot.total) == (1, 3)
+    assert snapshot.percentage == pytest.approx(100 / 3)
+
+  def test_overshot_leaf_snapshot(self):
+    node = ProgressNode(total=10)
+    node.update(11)
+    snapshot = node.snapshot()
+    assert (snapshot.current, snapshot.total, snapshot.percentage) == (11, 11, 100.0)
+    assert node.fraction == 1.0
+
+  def test_unknown_total_leaf_snapshot(self):
+    node = ProgressNode()
+    node.complete()
+    assert node.snapshot().percentage == 100.0
+
+  def test_inner_snapshot(self):
+    root = ProgressNode()
+    root.add_child(total=1).complete()
+    root.add_child(total=2)
+    snapshot = root.snapshot("shards")
+    assert snapshot == ProgressMetrics(current=1, unit="shards", percentage=50.0)
+
+
+class TestProgressTree:
+  def test_emits_parent_notifications(self):
+    tree, sent = make_tree(stage="fan-out")
+    children = [tree.add_child(total=10) for _ in range(4)]
+    assert sent == []
+    children[0].update(10)
+    children[1].update(5)
+    assert [n.progress.percentage for n in sent] == [25.0, 37.5]
+    notification = sent[-1]
+    assert notification.operation_id == OP_ID
+    assert notification.progress_token == PT_ID
+    assert notification.stage == "fan-out"
+    assert notification.progress.current == 1
+    assert notification.progress.unit == "operations"
+
+  def test_unchanged_root_does_not_emit(self):
+    tree, sent = make_tree()
+    child = tree.add_child(total=10)
+    child.update(0)
+    assert sent == []
+
+  def test_emitter_throttles(self):
+    sent = []
+    emitter = ProgressEmitter(VerbosityMode.COARSE)
+    tree = ProgressTree(OP_ID, PT_ID, sent.append, emitter=emitter)
+    child = tree.add_child(total=100)
+    for current in range(1, 101):
+      child.update(current)
+    assert len(sent) == 1
+    tree.set_stage("merge")
+    assert [n.stage for n in sent] == ["running", "merge"]
+
+  def test_snapshot(self):
+    tree, _ = make_tree(unit="shards")
+    tree.add_child(total=2).update(1)
+    assert tree.snapshot() == ProgressMetrics(current=0, unit="shards", percentage=50.0)
+
+  def test_default_emitter(self):
+    sent = []
+    tree = ProgressTree(OP_ID, PT_ID, sent.append)
+    tree.add_child().complete()
+    assert len(sent) == 1
+
+  def test_default_emitter_sends_completion(self):
+    sent = []
+    tree = ProgressTree(OP_ID, PT_ID, sent.append)
+    first, second = tree.add_child(), tree.add_child()
+    first.complete()
+    second.complete()
+    assert [n.progress.percentage for n in sent] == [50.0, 100.0]
+    assert sent[-1].progress.current == 2
@@ -1,7 +1,9 @@
 """Tests for McpUtilsBaseModel."""
 
+from typing import Self
+
 import pytest
-from pydantic import Field, ValidationError
+from pydantic import Field, ValidationError, model_validator
 
 from mcp_utils._base_model import McpUtilsBaseModel
 
@@ -13,6 +15,19 @@ class SampleModel(McpUtilsBaseModel):
   simple: int = 0
 
 
+class OrderedModel(McpUtilsBaseModel):
+  """Test model with a cross-field invariant."""
+
+  low: int = Field(ge=0)
+  high: int
+
+  @model_validator(mode="after")
+  def validate_order(self) -> Self:
+    if self.low > self.high:
+      raise ValueError("low must not exceed high")
+    return self
+
+
 class TestMcpUtilsBaseModel:
   def test_frozen(self):
     m = SampleModel(my_field="hello")
@@ -49,3 +64,37 @@ class TestMcpUtilsBaseModel:
     m2 = m.model_copy(update={"simple": 2})
     assert m.simple == 1
     assert m2.simple == 2
+
+
+class TestValidateTrusted:
+  def test_builds_instance(self):
+    m = OrderedModel.validate_trusted({"low": 1, "high": 2})
+    assert m == OrderedModel(low=1, high=2)
+
+  def test_skips_field_constraints(self):
+    m = OrderedModel.validate_trusted({"low": -5, "high": 0})
+    assert m.low == -5
+
+  def test_enforces_invariants(self):
+    with pytest.raises(ValueError, match="low must not exceed high"):
+      OrderedModel.validate_trusted({"low": 3, "high": 2})
+
+  def test_still_checks_types(self):
+    with pytest.raises(ValidationError):
+      OrderedModel.validate_trusted({"low": "not a number", "high": 2})
+
+  def test_defaults_and_aliases(self):
+    m = SampleModel.validate_trusted({"myField": "hello"})
+    assert m.my_field == "hello"
+    assert m.simple == 0
+
+
+class TestCheckInvariants:
+  def test_returns_self(self):
+    m = OrderedModel(low=1, high=2)
+    assert m.check_invariants() is m
+
+  def test_detects_violation(self):
+    m = OrderedModel.model_construct(low=3, high=2)
+    with pytest.raises(ValueError, match="low must not exceed high"):
+      m.check_invariants()
@@ -1,5 +1,12 @@
 """Tests for top-level exports and import ergonomics."""
 
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
 from mcp_utils import (
   ErrorResponse,
   LifecycleStatus,
@@ -62,3 +69,65 @@ class TestEndToEndWorkflow:
     failed = transition_operation(running, LifecycleStatus.FAILED, error=error)
     assert failed.status == LifecycleStatus.FAILED
     assert failed.error is not None
+
+
+PACKAGES = [
+  "mcp_utils",
+  "mcp_utils._utils",
+  "mcp_utils.base",
+  "mcp_utils.core",
+  "mcp_utils.mcp",
+  "mcp_utils.mcp.rpc",
+]
+
+
+class TestLazyExports:
+  @pytest.mark.parametrize("package", PACKAGES)
+  def test_every_public_name_resolves(self, package):
+    module = importlib.import_module(package)
+    for name in module.__all__:
+      assert getattr(module, name) is not None
+
+  @pytest.mark.parametrize("package", PACKAGES)
+  def test_dir_lists_public_names(self, package):
+    module = importlib.import_module(package)
+    assert set(module.__all__) <= set(dir(module))
+
+  def test_unknown_name_raises_attribute_error(self):
+    import mcp_utils
+
+    with pytest.raises(AttributeError, match="no_such_name"):
+      mcp_utils.no_such_name  # noqa: B018
+
+  def test_subpackages_resolve_without_import(self):
+    code = (
+      "import mcp_utils\n"
+      "assert mcp_utils.core.OperationState is mcp_utils.OperationState\n"
+      "assert mcp_utils.mcp.rpc.decode_notification\n"
+      "assert mcp_utils.base.is_uuid\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=os.environ.copy())
+
+  def test_broken_submodule_import_is_not_hidden(self, monkeypatch):
+    import mcp_utils
+
+    def import_module(name):
+      raise ModuleNotFoundError("No module named 'missing_dependency'", name="missing_dependency")
+
+    monkeypatch.setattr(mcp_utils._lazy, "import_module", import_module)
+    with pytest.raises(ModuleNotFoundError, match="missing_dependency"):
+      mcp_utils.no_such_name  # noqa: B018
+
+  def test_resolved_name_is_cached(self):
+    import mcp_utils
+
+    value = mcp_utils.OperationState
+    assert vars(mcp_utils)["OperationState"] is value
+
+  def test_import_does_not_load_models(self):
+    code = (
+      "import sys, mcp_utils\n"
+      "loaded = [m for m in sys.modules if m == 'pydantic' or m.startswith('mcp_utils.core.')]\n"
+      "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, env=os.environ.copy())
@@ -1,17 +1,23 @@
 """Tests for utility factory functions."""
 
 import re
-from datetime import UTC
+import time
+from datetime import UTC, datetime, timedelta
 
 import pytest
+from pydantic import ValidationError
 
 from mcp_utils._utils.factories import (
+  _shared_progress_metrics,
   create_active_cancellation_token,
   create_cancellation_token,
+  create_progress_metrics,
   generate_operation_id,
   generate_progress_token,
+  generate_time_ordered_operation_id,
   generate_timestamp,
   generate_uuid,
+  operation_id_floor,
   parse_timestamp,
   request_cancellation,
 )
@@ -24,6 +30,7 @@ from mcp_utils.base.primitives import (
 from mcp_utils.core.cancellation_token import (
   CancellationReason,
   CancellationSource,
+  CancellationToken,
 )
 
 
@@ -48,6 +55,46 @@ class TestGenerateOperationId:
     assert len(ids) == 50
 
 
+class TestGenerateTimeOrderedOperationId:
+  def test_format(self):
+    result = generate_time_ordered_operation_id()
+    assert re.match(OPERATION_ID_PATTERN, result)
+    assert result[17] == "7"
+
+  def test_sorted_by_creation(self):
+    ids = [generate_time_ordered_operation_id() for _ in range(1000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 1000
+
+  def test_embeds_creation_time(self):
+    before = datetime.now(UTC)
+    result = generate_time_ordered_operation_id()
+    millis = int(result[3:11] + result[12:16], 16)
+    assert abs(millis - before.timestamp() * 1000) < 1000
+
+
+class TestOperationIdFloor:
+  def test_format(self):
+    assert re.match(OPERATION_ID_PATTERN, operation_id_floor(datetime.now(UTC)))
+
+  def test_bounds_later_ids(self):
+    floor = operation_id_floor(datetime.now(UTC) - timedelta(minutes=1))
+    assert floor <= generate_time_ordered_operation_id()
+
+  def test_excludes_earlier_ids(self):
+    earlier = generate_time_ordered_operation_id()
+    floor = operation_id_floor(datetime.now(UTC) + timedelta(seconds=1))
+    assert earlier < floor
+
+  def test_known_value(self):
+    floor = operation_id_floor(datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC))
+    assert floor == "op-00000000-03e8-7000-8000-000000000000"
+
+  def test_out_of_range(self):
+    with pytest.raises(ValueError, match="outside"):
+      operation_id_floor(datetime(1960, 1, 1, tzinfo=UTC))
+
+
 class TestGenerateProgressToken:
   def test_format(self):
     result = generate_progress_token()
@@ -61,6 +108,28 @@ class TestGenerateTimestamp:
     assert re.match(TIMESTAMP_PATTERN, result)
     assert result.endswith("Z")
 
+  def test_millis_format(self):
+    result = generate_timestamp(millis=True)
+    assert re.match(TIMESTAMP_PATTERN, result)
+    assert re.search(r"\.\d{3}Z$", result)
+
+  def test_matches_clock(self, monkeypatch):
+    monkeypatch.setattr(time, "time_ns", lambda: 1736937000_123_456_789)
+    assert generate_timestamp() == "2025-01-15T10:30:00Z"
+    assert generate_timestamp(millis=True) == "2025-01-15T10:30:00.123Z"
+
+  def test_cached_within_tick(self, monkeypatch):
+    monkeypatch.setattr(time, "time_ns", lambda: 1736937001_500_000_000)
+    assert generate_timestamp() is generate_timestamp()
+    assert generate_timestamp(millis=True) is generate_timestamp(millis=True)
+
+  def test_advances_with_clock(self, monkeypatch):
+    clock = iter([1736937002_000_000_000, 1736937002_001_000_000, 1736937003_000_000_000])
+    monkeypatch.setattr(time, "time_ns", lambda: next(clock))
+    assert generate_timestamp(millis=True) == "2025-01-15T10:30:02.000Z"
+    assert generate_timestamp(millis=True) == "2025-01-15T10:30:02.001Z"
+    assert generate_timestamp() == "2025-01-15T10:30:03Z"
+
 
 class TestParseTimestamp:
   def test_utc(self):
@@ -97,6 +166,23 @@ class TestCreateCancellationToken:
     assert token.reason == CancellationReason.TIMEOUT
     assert token.timestamp is not None
 
+  def test_cancelled_coerces_enum_values(self):
+    token = create_cancellation_token(
+      cancelled=True,
+      reason="timeout",  # type: ignore[arg-type]
+      source="server",  # type: ignore[arg-type]
+    )
+    assert token.reason is CancellationReason.TIMEOUT
+    assert token.source is CancellationSource.SERVER
+
+  def test_cancelled_invalid_reason(self):
+    with pytest.raises(ValueError):
+      create_cancellation_token(
+        cancelled=True,
+        reason="bored",  # type: ignore[arg-type]
+        source=CancellationSource.SERVER,
+      )
+
   def test_cancelled_missing_reason(self):
     with pytest.raises(ValueError):
       create_cancellation_token(cancelled=True, source=CancellationSource.CLIENT)
@@ -111,6 +197,10 @@ class TestCreateActiveCancellationToken:
     token = create_active_cancellation_token()
     assert token.is_cancellation_requested is False
 
+  def test_shared_instance(self):
+    assert create_active_cancellation_token() is create_active_cancellation_token()
+    assert create_cancellation_token() is create_active_cancellation_token()
+
 
 class TestRequestCancellation:
   def test_returns_new_token(self):
@@ -125,3 +215,53 @@ class TestRequestCancellation:
     assert cancelled.reason == CancellationReason.USER_REQUESTED
     assert cancelled.source == CancellationSource.CLIENT
     assert cancelled.timestamp is not None
+
+  def test_matches_validated_token(self):
+    cancelled = request_cancellation(
+      create_active_cancellation_token(),
+      CancellationReason.TIMEOUT,
+      CancellationSource.SERVER,
+    )
+    assert CancellationToken.model_validate(cancelled.model_dump()) == cancelled
+
+
+class TestCreateProgressMetrics:
+  def test_derives_percentage(self):
+    metrics = create_progress_metrics(25, 50, unit="rows")
+    assert (metrics.current, metrics.total, metrics.unit, metrics.percentage) == (
+      25,
+      50,
+      "rows",
+      50.0,
+    )
+
+  def test_unknown_total(self):
+    assert create_progress_metrics(7).percentage == 0.0
+
+  @pytest.mark.parametrize(("current", "total"), [(0, None), (0, 10), (10, 10)])
+  def test_start_and_end_are_shared(self, current, total):
+    unit = "".join(["ro", "ws"])
+    first = create_progress_metrics(current, total, unit=unit)
+    assert first is create_progress_metrics(current, total, unit="rows")
+    assert first.unit is create_progress_metrics(current, total, unit="rows").unit
+
+  def test_other_values_are_not_shared(self):
+    assert create_progress_metrics(5, 10) is not create_progress_metrics(5, 10)
+
+  def test_in_flight_percentages_are_not_cached(self):
+    _shared_progress_metrics.cache_clear()
+    first = create_progress_metrics(0, unit="operations", percentage=37.5)
+    assert first is not create_progress_metrics(0, unit="operations", percentage=37.5)
+    assert _shared_progress_metrics.cache_info().currsize == 0
+    done = create_progress_metrics(0, unit="operations", percentage=100.0)
+    assert done is create_progress_metrics(0, unit="operations", percentage=100.0)
+
+  def test_explicit_percentage(self):
+    assert create_progress_metrics(0, percentage=40.0).percentage == 40.0
+    assert create_progress_metrics(3, percentage=40.0).percentage == 40.0
+
+  def test_still_validated(self):
+    with pytest.raises(ValidationError):
+      create_progress_metrics(0, 10, percentage=50.0)
+    with pytest.raises(ValidationError):
+      create_progress_metrics(-1, -1)
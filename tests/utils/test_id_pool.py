@@ -0,0 +1,110 @@
+"""Tests for pooled ID generation."""
+
+import re
+import threading
+
+import pytest
+
+from mcp_utils._utils import id_pool
+from mcp_utils._utils.id_pool import IdPool
+from mcp_utils.base.primitives import (
+  OPERATION_ID_PATTERN,
+  PROGRESS_TOKEN_PATTERN,
+  UUID_PATTERN,
+)
+
+
+class TestIdPool:
+  def test_uuid_format(self):
+    pool = IdPool(batch_size=256)
+    for _ in range(1000):
+      assert re.match(UUID_PATTERN, pool.uuid())
+
+  def test_version_and_variant(self):
+    pool = IdPool(batch_size=512, background=False)
+    ids = [pool.uuid() for _ in range(512)]
+    assert all(u[14] == "4" for u in ids)
+    assert {u[19] for u in ids} == set("89ab")
+
+  def test_operation_id_format(self):
+    assert re.match(OPERATION_ID_PATTERN, IdPool().operation_id())
+
+  def test_progress_token_format(self):
+    assert re.match(PROGRESS_TOKEN_PATTERN, IdPool().progress_token())
+
+  def test_uniqueness(self):
+    pool = IdPool(batch_size=64)
+    ids = {pool.uuid() for _ in range(5000)}
+    assert len(ids) == 5000
+
+  def test_without_background_refill(self):
+    pool = IdPool(batch_size=8, background=False)
+    pool.uuid()
+    assert len(pool) == 7
+    for _ in range(7):
+      pool.uuid()
+    assert len(pool) == 0
+
+  def test_background_refill(self):
+    pool = IdPool(batch_size=16, low_water=4)
+    pool.uuid()
+    for _ in range(20):
+      pool.uuid()
+    for thread in threading.enumerate():
+      if thread.name == "mcp-utils-id-pool":
+        thread.join()
+    assert len(pool) > 0
+
+  def test_refill_not_started_twice(self):
+    pool = IdPool(batch_size=4)
+    pool._refilling.acquire()
+    pool._start_refill()
+    assert len(pool) == 0
+    pool._refilling.release()
+
+  def test_reset_during_refill(self, monkeypatch):
+    pool = IdPool(batch_size=4)
+    started, proceed = threading.Event(), threading.Event()
+
+    def slow_format(count):
+      started.set()
+      proceed.wait()
+      return ["stale"] * count
+
+    monkeypatch.setattr(id_pool, "_format_uuids", slow_format)
+    pool._start_refill()
+    started.wait()
+    pool._reset_after_fork()
+    proceed.set()
+    for thread in threading.enumerate():
+      if thread.name == "mcp-utils-id-pool":
+        thread.join()
+    assert len(pool) == 0
+    assert not pool._refilling.locked()
+
+  def test_invalid_batch_size(self):
+    with pytest.raises(ValueError, match="batch_size"):
+      IdPool(batch_size=0)
+
+  def test_thread_safety(self):
+    pool = IdPool(batch_size=32)
+    results: list[list[str]] = [[] for _ in range(8)]
+
+    def worker(out: list[str]) -> None:
+      out.extend(pool.uuid() for _ in range(2000))
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+    all_ids = [u for out in results for u in out]
+    assert len(set(all_ids)) == len(all_ids) == 16000
+
+  def test_reset_after_fork_discards_inherited_ids(self):
+    pool = IdPool(batch_size=16, background=False)
+    pool.uuid()
+    inherited = set(pool._ids)
+    id_pool._reset_pools_after_fork()
+    assert len(pool) == 0
+    assert pool.uuid() not in inherited
@@ -1,6 +1,7 @@
 """Tests for operation state transition utilities."""
 
 import pytest
+from pydantic import ValidationError
 
 from mcp_utils._utils.transitions import (
   VALID_TRANSITIONS,
@@ -9,7 +10,7 @@ from mcp_utils._utils.transitions import (
   validate_transition,
 )
 from mcp_utils.core.error_response import ErrorResponse
-from mcp_utils.core.operation_state import LifecycleStatus
+from mcp_utils.core.operation_state import LifecycleStatus, OperationState
 from mcp_utils.core.progress_metrics import ProgressMetrics
 
 
@@ -53,6 +54,23 @@ class TestCreateOperation:
     state = create_operation("tool", progress=progress)
     assert state.progress.current == 5
 
+  def test_matches_validated_state(self):
+    state = create_operation("tool")
+    assert OperationState.model_validate(state.model_dump()) == state
+
+  def test_progress_dict_is_validated(self):
+    state = create_operation("tool", progress={"current": 1, "total": 2, "percentage": 50.0})  # type: ignore[arg-type]
+    assert isinstance(state.progress, ProgressMetrics)
+    assert state.progress.current == 1
+
+  def test_invalid_progress_dict_raises(self):
+    with pytest.raises(ValidationError):
+      create_operation("tool", progress={"current": 1, "total": 2, "percentage": 10.0})  # type: ignore[arg-type]
+
+  def test_invalid_tool_name_raises(self):
+    with pytest.raises(ValidationError):
+      create_operation(123)  # type: ignore[arg-type]
+
 
 class TestTransitionOperation:
   def test_valid_transition(self):
@@ -104,6 +122,63 @@ class TestTransitionOperation:
     updated = transition_operation(running, LifecycleStatus.COMPLETED, progress=progress)
     assert updated.progress.current == 50
 
+  def test_failed_without_error_raises(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    with pytest.raises(ValueError, match="error is required"):
+      transition_operation(running, LifecycleStatus.FAILED)
+
+  def test_cancelled_without_partial_results_raises(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    with pytest.raises(ValueError, match="partial_results is required"):
+      transition_operation(running, LifecycleStatus.CANCELLED)
+
+  def test_end_time_is_validated(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    with pytest.raises(ValidationError):
+      transition_operation(running, LifecycleStatus.COMPLETED, end_time="yesterday")
+
+  def test_explicit_end_time(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    completed = transition_operation(
+      running, LifecycleStatus.COMPLETED, end_time="2025-01-15T10:30:00.123Z"
+    )
+    assert completed.end_time == "2025-01-15T10:30:00.123Z"
+
+  def test_end_time_ignored_for_non_terminal(self):
+    state = create_operation("tool")
+    running = transition_operation(state, LifecycleStatus.RUNNING, end_time="2025-01-15T10:30:00Z")
+    assert running.end_time is None
+
+  def test_error_dict_is_validated(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    error = {"code": 5001, "message": "failed", "timestamp": "2025-01-15T10:30:00Z"}
+    failed = transition_operation(running, LifecycleStatus.FAILED, error=error)  # type: ignore[arg-type]
+    assert isinstance(failed.error, ErrorResponse)
+
+  def test_invalid_error_dict_raises(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    error = {"code": 42, "message": "failed", "timestamp": "2025-01-15T10:30:00Z"}
+    with pytest.raises(ValidationError):
+      transition_operation(running, LifecycleStatus.FAILED, error=error)  # type: ignore[arg-type]
+
+  def test_progress_dict_is_validated(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    progress = {"current": 1, "total": 4, "percentage": 25.0}
+    paused = transition_operation(running, LifecycleStatus.PAUSED, progress=progress)  # type: ignore[arg-type]
+    assert isinstance(paused.progress, ProgressMetrics)
+    assert paused.progress.percentage == 25.0
+
+  def test_inconsistent_progress_raises(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    progress = ProgressMetrics.model_construct(current=1, total=4, unit="items", percentage=90.0)
+    with pytest.raises(ValueError, match="inconsistent"):
+      transition_operation(running, LifecycleStatus.PAUSED, progress=progress)
+
+  def test_result_matches_validated_state(self):
+    running = transition_operation(create_operation("tool"), LifecycleStatus.RUNNING)
+    cancelled = transition_operation(running, LifecycleStatus.CANCELLED, partial_results={"n": 1})
+    assert OperationState.model_validate(cancelled.model_dump()) == cancelled
+
   def test_immutable_original(self):
     state = create_operation("tool")
     transition_operation(state, LifecycleStatus.RUNNING)